@@ -362,6 +362,10 @@ def dns_lookup(subject, dns_server=None, complete=False):  # pragma: no cover
     if subject:
         # The subject is not empty nor None.
 
+        # We load the configuration.
+        # Note: It is needed by our cache of DNS answers.
+        load_config(generate_directory_structure=False)
+
         # We return the lookup.
         return DNSLookup(subject, dns_server=dns_server, complete=complete).request()
 
@@ -690,6 +694,19 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--async",
+                    action="store_true",
+                    dest="asynchronous",
+                    help="Switch the value of the usage of an event loop "
+                    "to test multiple subjects at the same time. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["asynchronous"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "" "-c",
                     "--auto-continue",
@@ -787,6 +804,18 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--concurrency",
+                    type=int,
+                    help="Set the number of subjects to test at the same time "
+                    "while testing asynchronously. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["concurrency"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "-d", "--domain", type=str, help="Set and test the given domain."
                 )
@@ -853,6 +882,17 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                     ),
                 )
 
+                PARSER.add_argument(
+                    "--dns-first",
+                    action="store_true",
+                    help="Switch the value of the DNS lookup before the WHOIS lookup. %s"
+                    % (
+                        CURRENT_VALUE_FORMAT
+                        + repr(CONFIGURATION["dns_first"])
+                        + Style.RESET_ALL
+                    ),
+                )
+
                 PARSER.add_argument(
                     "-ex",
                     "--execution",
@@ -1273,6 +1313,11 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                 if ARGS.adblock:
                     CONFIGURATION.update({"adblock": Preset().switch("adblock")})
 
+                if ARGS.asynchronous:
+                    CONFIGURATION.update(
+                        {"asynchronous": Preset().switch("asynchronous")}
+                    )
+
                 if ARGS.auto_continue:
                     CONFIGURATION.update(
                         {"auto_continue": Preset().switch("auto_continue")}
@@ -1308,6 +1353,9 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                         }
                     )
 
+                if ARGS.concurrency:
+                    CONFIGURATION.update({"concurrency": ARGS.concurrency})
+
                 if ARGS.database:
                     CONFIGURATION.update(
                         {"inactive_database": Preset().switch("inactive_database")}
@@ -1342,6 +1390,9 @@ def _command_line():  # pragma: no cover pylint: disable=too-many-branches,too-m
                 if ARGS.dns:
                     CONFIGURATION.update({"dns_server": ARGS.dns})
 
+                if ARGS.dns_first:
+                    CONFIGURATION.update({"dns_first": Preset().switch("dns_first")})
+
                 if ARGS.execution:
                     CONFIGURATION.update(
                         {"show_execution_time": Preset().switch("show_execution_time")}
@@ -61,6 +61,7 @@ License:
 # pylint: enable=line-too-long
 
 from hashlib import sha256
+from json import decoder, dumps, loads
 
 import PyFunceble
 from PyFunceble.helpers import Dict, File, List
@@ -69,12 +70,18 @@ from PyFunceble.helpers import Dict, File, List
 class AutoContinue:  # pylint: disable=too-many-instance-attributes
     """
     Provide the auto-continue subsystem.
+
+    .. note::
+        With the :code:`json` database type, each addition is appended to
+        a journal which is kept open until the database is saved.
     """
 
     # Save the content of the database.
     database = {}
     # Save the database file
     database_file = None
+    # Save the journal file.
+    journal_file = None
     # Save the operation authorization.
     authorized = False
 
@@ -99,6 +106,14 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         # We share if we are under the parent process.
         self.parent = parent_process
 
+        # We initiate the index of the tested subjects.
+        # Note: It's a subject -> status dict.
+        self.index = {}
+        # We initiate the database the index was built from.
+        self.indexed = None
+        # We initiate the (append) handle of the journal file.
+        self.journal = None
+
         if self.authorized:
             # We are authorized to operate.
 
@@ -108,6 +123,8 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                 + PyFunceble.OUTPUTS["parent_directory"]
                 + PyFunceble.OUTPUTS["logs"]["filenames"]["auto_continue"]
             )
+            # We set the location of the journal file.
+            self.journal_file = "{0}.journal".format(self.database_file)
 
             # We load the backup (if existant).
             self.load()
@@ -129,11 +146,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
     def __contains__(self, index):  # pragma: no cover
         if self.authorized:
             if PyFunceble.CONFIGURATION["db_type"] == "json":
-                if self.filename in self.database:
-                    for _, status_data in self.database[self.filename].items():
-                        if index in status_data:
-                            return True
-                return False
+                return index in self.get_index()
 
             if PyFunceble.CONFIGURATION["db_type"] == "sqlite":
                 query = (
@@ -176,6 +189,33 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             and not PyFunceble.CONFIGURATION["no_files"]
         )
 
+    def get_index(self):
+        """
+        Provide the index of the tested subjects of the currently
+        tested file.
+
+        :return: A subject -> status dict.
+        :rtype: dict
+
+        .. note::
+            The index is rebuilt only if the database was replaced.
+        """
+
+        if self.indexed is not self.database:
+            # The database was replaced since the last indexation.
+
+            # We rebuild the index.
+            self.index = {
+                subject: status
+                for status, subjects in self.database.get(self.filename, {}).items()
+                for subject in subjects
+            }
+
+            # And we save the database we indexed.
+            self.indexed = self.database
+
+        return self.index
+
     def get_table_name(self):
         """
         Return the name of the table to use.
@@ -234,73 +274,38 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             # We are authorized to operate.
 
             if PyFunceble.CONFIGURATION["db_type"] == "json":
-                if self.filename in self.database:
-                    # We already have something related
-                    # to the file we are testing.
-
-                    if status in self.database[self.filename]:
-                        # The status is already registered.
-
-                        # We set the new data.
-                        self.database[self.filename][status].append(subject)
-                    else:
-                        # We set the new data.
-                        self.database[self.filename][status] = [subject]
-                else:
-                    # We have nothing related to the file
-                    # we are testing.
-
-                    # We initiate the file index.
-                    self.database[self.filename] = {status: [subject]}
-
-                # We save everything.
-                self.save()
-            elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
-                # We construct the query string.
-                query = (
-                    "INSERT INTO {0} "
-                    "(file_path, subject, is_complement, status) "
-                    "VALUES (:file, :subject, :is_complement, :status)"
-                ).format(self.table_name)
+                # We set the new data.
+                self.__add_json(subject, status)
 
-                try:
-                    try:
-                        # We execute the query.
-                        self.sqlite_db.cursor.execute(
-                            query,
-                            {
-                                "file": self.filename,
-                                "subject": subject,
-                                "is_complement": int(False),
-                                "status": status,
-                            },
-                        )
-                    except self.sqlite_db.locked_errors:
-                        PyFunceble.sleep(0.3)
-                        # We execute the query.
-                        self.sqlite_db.cursor.execute(
-                            query,
-                            {
-                                "file": self.filename,
-                                "subject": subject,
-                                "is_complement": int(False),
-                                "status": status,
-                            },
-                        )
-                except self.sqlite_db.errors:
-                    query = (
-                        "UPDATE {0} "
-                        "SET status = :status "
-                        "WHERE file_path = :file AND subject = :subject"
-                    ).format(self.table_name)
+                # We append the new data to the journal.
+                self.__write_journal(
+                    dumps([self.filename, status, subject], ensure_ascii=False) + "\n"
+                )
+            elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
+                # We construct the query strings.
+                queries = self.sqlite_db.get_upsert_queries(
+                    self.table_name,
+                    {
+                        "file_path": "file",
+                        "subject": "subject",
+                        "is_complement": "is_complement",
+                        "status": "status",
+                    },
+                    ["file_path", "subject"],
+                    update=["status"],
+                )
 
+                for query in queries:
                     # We execute the query.
-                    self.sqlite_db.cursor.execute(
+                    self.sqlite_db.execute(
                         query,
-                        {"status": status, "file": self.filename, "subject": subject},
+                        {
+                            "file": self.filename,
+                            "subject": subject,
+                            "is_complement": int(False),
+                            "status": status,
+                        },
                     )
-                # And we commit the changes.
-                self.sqlite_db.connection.commit()
             elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
                 # We construct the query string.
 
@@ -345,9 +350,110 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                             },
                         )
 
+    def __add_json(self, subject, status, filename=None):
+        """
+        Add the given subject into the JSON database and its index.
+
+        :param str subject: The subject we are working with.
+        :param str status: The status of the given subject.
+        :param str filename:
+            The file the subject belongs to.
+            If not given, we use the currently tested file.
+        """
+
+        if filename is None:
+            # We use the currently tested file.
+            filename = self.filename
+
+        if filename == self.filename:
+            # We are working with the currently tested file.
+
+            # We get the (up to date) index.
+            index = self.get_index()
+        else:
+            # We are not working with the currently tested file.
+
+            # We do not index anything.
+            index = {}
+
+        if filename not in self.database:
+            # We have nothing related to the file
+            # we are testing.
+
+            # We initiate the file index.
+            self.database[filename] = {}
+
+        if subject in index and index[subject] in self.database[filename]:
+            # The subject was already tested.
+
+            try:
+                # We remove it from its previous status.
+                self.database[filename][index[subject]].remove(subject)
+            except ValueError:  # pragma: no cover
+                pass
+
+        if status in self.database[filename]:
+            # The status is already registered.
+
+            # We set the new data.
+            self.database[filename][status].append(subject)
+        else:
+            # We set the new data.
+            self.database[filename][status] = [subject]
+
+        if (
+            status != "complements"
+            and "complements" in self.database[filename]
+            and subject in self.database[filename]["complements"]
+        ):
+            # The subject is a complement which is now tested.
+
+            # We remove it from the complements to test.
+            self.database[filename]["complements"].remove(subject)
+
+        if filename == self.filename:
+            # We are working with the currently tested file.
+
+            # We update the index.
+            index[subject] = status
+
+    def __write_journal(self, record):
+        """
+        Append the given record to the journal.
+
+        :param str record: The record to append.
+        """
+
+        if self.journal is None:
+            # The journal is not open.
+
+            # We open it for the rest of the run.
+            self.journal = open(self.journal_file, "a", encoding="utf-8", newline="\n")
+
+        # We append the record.
+        self.journal.write(record)
+        # And we flush it so that it survives a crash.
+        self.journal.flush()
+
+    def close_journal(self):
+        """
+        Close the journal (if open).
+        """
+
+        if self.journal is not None:
+            # The journal is open.
+
+            # We close it.
+            self.journal.close()
+            self.journal = None
+
     def save(self):
         """
         Save the current state of the database.
+
+        .. note::
+            As the database file is a snapshot of the whole database,
+            the journal is emptied.
         """
 
         if self.authorized and PyFunceble.CONFIGURATION["db_type"] == "json":
@@ -356,6 +462,12 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             # We save the current database state.
             Dict(self.database).to_json(self.database_file)
 
+            # We close the journal.
+            self.close_journal()
+
+            # We empty the journal.
+            File(self.journal_file).delete()
+
     def load(self):
         """
         Load previously saved database.
@@ -375,6 +487,36 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                 # We initiate an empty database.
                 self.database = {self.filename: {}}
 
+            if PyFunceble.path.isfile(self.journal_file):
+                # The journal file exists. Which means that the previous
+                # test was not saved.
+
+                # We replay the journal.
+                self.__replay_journal()
+
+                # And we save everything.
+                self.save()
+
+    def __replay_journal(self):
+        """
+        Replay the content of the journal into the database.
+        """
+
+        for line in File(self.journal_file).read().splitlines():
+            # We loop through the records of the journal.
+
+            try:
+                # We get the record.
+                filename, status, subject = loads(line)
+            except (decoder.JSONDecodeError, ValueError):
+                # The record is corrupted (e.g. partially written).
+
+                # We continue the loop.
+                continue
+
+            # We replay the record.
+            self.__add_json(subject, status, filename=filename)
+
     def clean(self):
         """
         Clean the database.
@@ -387,17 +529,20 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
                 # We empty the database.
                 self.database[self.filename] = {}
 
+                # We empty the index.
+                self.index = {}
+
                 # And we save the current database state.
-                Dict(self.database).to_json(self.database_file)
+                self.save()
             elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
                 # We construct the query we are going to execute.
                 query = "DELETE FROM {0} WHERE file_path = :file".format(
                     self.table_name
                 )
                 # We execute it.
-                self.sqlite_db.cursor.execute(query, {"file": self.filename})
+                self.sqlite_db.execute(query, {"file": self.filename})
                 # We commit everything.
-                self.sqlite_db.connection.commit()
+                self.sqlite_db.commit()
             elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
                 # We construct the query we are going to execute.
                 query = "DELETE FROM {0} WHERE file_path = %(file)s".format(
@@ -498,13 +643,9 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
 
         if self.authorized:
             if PyFunceble.CONFIGURATION["db_type"] == "json":
-                try:
-                    return {
-                        y for _, x in self.database[self.filename].items() for y in x
-                    }
-                except KeyError:  # pragma: no cover
-                    pass
-            elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
+                return set(self.get_index())
+
+            if PyFunceble.CONFIGURATION["db_type"] == "sqlite":
                 query = "SELECT * FROM {0} WHERE file_path = :file".format(
                     self.table_name
                 )
@@ -536,8 +677,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         # We get the list of domains we are going to work with.
         result = [
             z
-            for x, y in self.get_already_tested()
-            for z in y
+            for z in self.get_already_tested()
             if not PyFunceble.Check(z).is_subdomain()
             and PyFunceble.Check(z).is_domain()
         ]
@@ -564,8 +704,7 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             # We get the list of domains we are going to work with.
             result = [
                 z
-                for x, y in self.get_already_tested()
-                for z in y
+                for z in self.get_already_tested()
                 if not PyFunceble.Check(z).is_subdomain()
                 and PyFunceble.Check(z).is_domain()
             ]
@@ -583,6 +722,9 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
             # We save the constructed list of complements
             self.database[self.filename]["complements"] = list(result)
             self.save()
+
+            # We index the complements.
+            self.index.update({x: "complements" for x in result})
         else:
             # We get the complements we still have to test.
             result = self.database[self.filename]["complements"]
@@ -614,40 +756,30 @@ class AutoContinue:  # pylint: disable=too-many-instance-attributes
         else:
             result = self.__generate_complements()
 
-        query = (
-            "INSERT INTO {0} "
-            "(file_path, subject, status, is_complement, digest) "
-            "VALUES (:file, :subject, :status, :is_complement, :digest)".format(
-                self.table_name
-            )
+        (query,) = self.sqlite_db.get_upsert_queries(
+            self.table_name,
+            {
+                "file_path": "file",
+                "subject": "subject",
+                "status": "status",
+                "is_complement": "is_complement",
+            },
+            ["file_path", "subject"],
         )
 
-        for subject in result:
-            try:
-                # We execute the query.
-                self.sqlite_db.cursor.execute(
-                    query,
-                    {
-                        "file": self.filename,
-                        "subject": subject,
-                        "status": "",
-                        "is_complement": int(True),
-                        "digest": "",
-                    },
-                )
-            except self.sqlite_db.locked_errors:
-                PyFunceble.sleep(0.3)
-                # We execute the query.
-                self.sqlite_db.cursor.execute(
-                    query,
-                    {
-                        "file": self.filename,
-                        "subject": subject,
-                        "status": "",
-                        "is_complement": int(True),
-                        "digest": "",
-                    },
-                )
+        # We insert all complements at once.
+        self.sqlite_db.executemany(
+            query,
+            [
+                {
+                    "file": self.filename,
+                    "subject": subject,
+                    "status": "",
+                    "is_complement": int(True),
+                }
+                for subject in result
+            ],
+        )
 
         return result
 
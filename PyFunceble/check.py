@@ -336,6 +336,56 @@ class Check:
         # We return the status of the check.
         return self.is_domain(subdomain_check=True)
 
+    def get_registrable_domain(self):
+        """
+        Get the registrable domain of the given subject.
+        In other words, the label before the longest public suffix
+        followed by the public suffix.
+
+        :return: The registrable domain or :code:`None` if not found.
+        :rtype: str|None
+        """
+
+        # We format the subject.
+        subject = self.subject.lower().rstrip(".")
+
+        if "." not in subject:
+            # There is no point into the subject.
+
+            # We return None, there is no registrable domain.
+            return None
+
+        # We get the extension.
+        suffix = extension = subject[subject.rindex(".") + 1 :]
+
+        if extension in PyFunceble.INTERN["psl_db"]:
+            # The extension is into the psl database.
+
+            for public_suffix in PyFunceble.INTERN["psl_db"][extension]:
+                # We loop through the suffixes of the extension.
+
+                if (
+                    subject == public_suffix or subject.endswith("." + public_suffix)
+                ) and len(public_suffix) > len(suffix):
+                    # * The subject is or ends with the currently read suffix.
+                    # and
+                    # * The currently read suffix is the longest one.
+
+                    # We save it.
+                    suffix = public_suffix
+
+        # We get what is before the suffix.
+        to_check = subject[: -len(suffix) - 1]
+
+        if subject == suffix or not to_check:
+            # The subject is a public suffix.
+
+            # We return None, there is no registrable domain.
+            return None
+
+        # We return the last label before the suffix followed by the suffix.
+        return "{0}.{1}".format(to_check.split(".")[-1], suffix)
+
     def is_ipv4(self):
         """
         Check if the given subject is a valid IPv4.
@@ -257,19 +257,21 @@ class Clean:
                 sqlite_db = SQLite()
 
                 for database_name in [
-                    y for x, y in sqlite_db.tables.items() if x != "whois"
+                    y for x, y in sqlite_db.tables.items() if x not in ["dns", "whois"]
                 ]:
                     query = "DELETE FROM {0}".format(database_name)
 
-                    sqlite_db.cursor.execute(query)
-                    sqlite_db.connection.commit()
+                    sqlite_db.execute(query)
+
+                # We commit and close everything.
+                sqlite_db.close()
             elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
                 from PyFunceble.mysql import MySQL
 
                 mysql_db = MySQL()
 
                 for database_name in [
-                    y for x, y in mysql_db.tables.items() if x != "whois"
+                    y for x, y in mysql_db.tables.items() if x not in ["dns", "whois"]
                 ]:
                     query = "DELETE FROM {0}".format(database_name)
 
@@ -163,6 +163,77 @@ class CLICore:
 
         print(PyFunceble.Fore.CYAN + PyFunceble.Style.BRIGHT + "Nothing to test.")
 
+    @classmethod
+    def print_dns_statistics(cls):  # pragma: no cover
+        """
+        Print the statistics of the DNS cache.
+        """
+
+        # We get the statistics of the DNS cache.
+        statistics = PyFunceble.DNSLookup.cache.get_statistics()
+
+        if not PyFunceble.CONFIGURATION["quiet"] and (
+            statistics["hits"] or statistics["misses"] or statistics["saved"]
+        ):
+            # * The quiet mode is not activated.
+            # and
+            # * We looked something up.
+
+            print(
+                PyFunceble.Fore.MAGENTA
+                + PyFunceble.Style.BRIGHT
+                + "\nDNS cache: {0} hits, {1} misses, {2} lookups saved.".format(
+                    statistics["hits"], statistics["misses"], statistics["saved"]
+                )
+            )
+
+            for plan, steps in sorted(statistics["plans"].items()):
+                # We loop through the query plans we followed.
+
+                # We get the number of subjects which followed the plan.
+                # Note: Every subject asks the first step.
+                followed = max(x["asked"] for x in steps.values())
+                # We get the number of subjects which got something.
+                found = sum(x["found"] for x in steps.values())
+
+                print(
+                    PyFunceble.Fore.MAGENTA
+                    + PyFunceble.Style.BRIGHT
+                    + "DNS {0} query plan: {1}/{2} found ({3}).".format(
+                        plan,
+                        found,
+                        followed,
+                        ", ".join(
+                            "{0}: {1}/{2}".format(step, x["found"], x["asked"])
+                            for step, x in steps.items()
+                        ),
+                    )
+                )
+
+            for server, counts in sorted(
+                PyFunceble.DNSLookup.get_server_statistics().items()
+            ):
+                # We loop through the DNS servers we worked with.
+
+                if not counts["queries"]:
+                    # We did not send anything to the server.
+
+                    continue
+
+                print(
+                    PyFunceble.Fore.MAGENTA
+                    + PyFunceble.Style.BRIGHT
+                    + "DNS server {0}: {1} queries, {2:.1f} ms average, "
+                    "{3:.1%} timeouts, {4:.1%} SERVFAIL, ejected {5} times.".format(
+                        server,
+                        counts["queries"],
+                        counts["latency"] * 1000 / counts["queries"],
+                        counts["timeouts"] / counts["queries"],
+                        counts["servfails"] / counts["queries"],
+                        counts["ejections"],
+                    )
+                )
+
     @classmethod
     def stay_safe(cls):  # pragma: no cover
         """
@@ -0,0 +1,184 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the single writer of our databases.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+from multiprocessing import Queue
+from os import getpid
+from queue import Empty
+from threading import Thread
+
+
+class DBWriter:
+    """
+    Provide the single writer of a database.
+    The write intents sent by our processes are applied by a thread
+    of the process which owns the database connection.
+
+    :param database: The database to write into.
+    :type database: :class:`~PyFunceble.sqlite.SQLite`|:class:`~PyFunceble.mysql.MySQL`
+
+    .. note::
+        The writer has to be started before forking our processes.
+    """
+
+    # Save the maximal number of intents we apply before committing.
+    batch_size = 500
+
+    def __init__(self, database):
+        self.database = database
+
+        # We save the process which owns the database connection.
+        self.owner = getpid()
+        # We initiate the queue of write intents.
+        self.intents = Queue()
+        # We initiate the thread which apply the intents.
+        self.thread = None
+
+    def is_remote(self):
+        """
+        Check if we are running into another process than the owner.
+
+        :rtype: bool
+        """
+
+        return getpid() != self.owner
+
+    def send(self, query, data):
+        """
+        Send the given write intent to the writer.
+
+        :param str query: The query to execute.
+        :param dict data: The data to give to the query.
+        """
+
+        self.intents.put((query, data))
+
+    def start(self):
+        """
+        Start the writer.
+        """
+
+        self.thread = Thread(target=self.__run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        """
+        Apply the remaining intents and stop the writer.
+        """
+
+        if self.thread is not None:
+            # The writer is running.
+
+            # We send the stop signal.
+            self.intents.put(None)
+
+            # And we wait for it to finish.
+            self.thread.join()
+            self.thread = None
+
+    def __get_batch(self):
+        """
+        Wait for the next intents.
+
+        :return: A list of intents. The stop signal is represented by :code:`None`.
+        :rtype: list
+        """
+
+        # We wait for the next intent.
+        batch = [self.intents.get()]
+
+        while batch[-1] is not None and len(batch) < self.batch_size:
+            # We loop until we got enough intents or the stop signal.
+
+            try:
+                # We get the next intent.
+                batch.append(self.intents.get_nowait())
+            except Empty:
+                # There is no intent waiting.
+
+                # We break the loop.
+                break
+
+        return batch
+
+    def __run(self):
+        """
+        Apply the intents until we get the stop signal.
+        """
+
+        while True:
+            # We get the next batch of intents.
+            batch = self.__get_batch()
+
+            for intent in batch:
+                # We loop through the batch.
+
+                if intent is not None:
+                    # We apply the currently read intent.
+                    self.database.execute(*intent)
+
+            # We commit the whole batch.
+            self.database.commit()
+
+            if batch[-1] is None:
+                # We got the stop signal.
+
+                # We break the loop.
+                break
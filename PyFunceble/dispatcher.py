@@ -63,6 +63,7 @@ License:
 import PyFunceble
 from PyFunceble.cli_core import CLICore
 from PyFunceble.execution_time import ExecutionTime
+from PyFunceble.file_async_core import FileAsyncCore
 from PyFunceble.file_core import FileCore
 from PyFunceble.file_multiprocess_core import FileMultiprocessCore
 from PyFunceble.percentage import Percentage
@@ -101,47 +102,61 @@ class Dispatcher:  # pylint: disable=too-few-public-methods, too-many-arguments
             elif file_path:
                 PyFunceble.DirectoryStructure()
 
-                if PyFunceble.CONFIGURATION["multiprocess"]:
-                    preset.maximal_processes()
-                    preset.multiprocess()
-
-                    FileMultiprocessCore(
-                        file_path, "domain"
-                    ).read_and_test_file_content()
-                else:
-                    FileCore(file_path, "domain").read_and_test_file_content()
+                self.__test_file(preset, file_path, "domain")
             elif link_to_test:
                 PyFunceble.DirectoryStructure()
 
-                if PyFunceble.CONFIGURATION["multiprocess"]:
-                    preset.maximal_processes()
-                    preset.multiprocess()
-
-                    FileMultiprocessCore(
-                        link_to_test, "domain"
-                    ).read_and_test_file_content()
-                else:
-                    FileCore(link_to_test, "domain").read_and_test_file_content()
+                self.__test_file(preset, link_to_test, "domain")
             elif url_file_path:
                 PyFunceble.DirectoryStructure()
                 preset.file_url()
 
-                if PyFunceble.CONFIGURATION["multiprocess"]:
-                    preset.maximal_processes()
-                    preset.multiprocess()
-
-                    FileMultiprocessCore(
-                        url_file_path, "url"
-                    ).read_and_test_file_content()
-                else:
-                    FileCore(url_file_path, "url").read_and_test_file_content()
+                self.__test_file(preset, url_file_path, "url")
             elif url_to_test:
                 SimpleCore(url_to_test).url()
 
             Percentage().log()
 
+            if not domain_or_ip and not url_to_test:
+                # We tested a file.
+
+                # We print the statistics of the DNS cache.
+                PyFunceble.CLICore.print_dns_statistics()
+
             ExecutionTime("stop")
 
             PyFunceble.CLICore.stay_safe()
         else:
             PyFunceble.CLICore.print_nothing_to_test()
+
+    @classmethod
+    def __test_file(cls, preset, file, file_type):
+        """
+        Test the given file with the right brain side.
+
+        :param preset: The preset to apply.
+        :type preset: :class:`~PyFunceble.preset.Preset`
+        :param str file: The file (or link) to test.
+        :param str file_type:
+            The file type.
+            Should be one of the following.
+
+                - :code:`domain`
+
+                - :code:`url`
+        """
+
+        if PyFunceble.CONFIGURATION["asynchronous"]:
+            preset.concurrency()
+            preset.asynchronous()
+
+            core = FileAsyncCore
+        elif PyFunceble.CONFIGURATION["multiprocess"]:
+            preset.maximal_processes()
+            preset.multiprocess()
+
+            core = FileMultiprocessCore
+        else:
+            core = FileCore
+
+        core(file, file_type).read_and_test_file_content()
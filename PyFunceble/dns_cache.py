@@ -0,0 +1,453 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the cache of the DNS answers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from collections import OrderedDict
+from threading import Lock
+
+import dns.rdatatype
+
+import PyFunceble
+
+
+class DNSCache:  # pylint: disable=too-many-instance-attributes
+    """
+    Provide a LRU cache of DNS answers which honours the TTL of the records.
+
+    .. note::
+        Negative answers (:code:`NXDOMAIN` and :code:`NODATA`) are
+        cached too (RFC 2308). They are represented by :code:`None`.
+
+    .. note::
+        When :code:`database` is set, the answers are also saved into it
+        and it is consulted when an answer is not in memory.
+
+    .. note::
+        Once :meth:`pop_answers` is called, the new answers are kept
+        for another process instead of being saved into :code:`database`.
+        That process saves them with :meth:`merge_answers`.
+    """
+
+    # Save the number of seconds to cache a negative answer for
+    # when the authority does not give us its SOA record.
+    negative_ttl = 300
+
+    def __init__(self):
+        # We initiate the cached answers.
+        # Note: It's a key -> (expiration, answer) dict.
+        self.cache = OrderedDict()
+        # We initiate the lock which protect the cache.
+        self.lock = Lock()
+
+        # We initiate the number of answers we got from the cache.
+        self.hits = 0
+        # We initiate the number of answers we had to ask for.
+        self.misses = 0
+        # We initiate the number of lookups we did not have to do
+        # because the registrable domain does not exist.
+        self.saved = 0
+        # We initiate the statistics of the query plans.
+        # Note: It's a plan -> step -> {"asked": 0, "found": 0} dict.
+        self.plans = {}
+
+        # We initiate the database which keeps the answers across runs.
+        # Note: It's a PyFunceble.dns_db.DNSDB instance.
+        self.database = None
+        # We initiate the answers we keep for another process.
+        # Note: It's a list of (key, answer, expiration).
+        # Note: None means that we save them into the database ourself.
+        self.answers = None
+
+    def __remember(self, key, answer, expiration):
+        """
+        Keep the given answer in memory.
+
+        .. warning::
+            The lock must be acquired.
+        """
+
+        if PyFunceble.CONFIGURATION["dns_cache_size"] <= 0:
+            # The cache is deactivated.
+
+            return
+
+        # We cache the answer.
+        self.cache[key] = (expiration, answer)
+        self.cache.move_to_end(key)
+
+        while len(self.cache) > PyFunceble.CONFIGURATION["dns_cache_size"]:
+            # We have too many cached answers.
+
+            # We delete the least recently used one.
+            self.cache.popitem(last=False)
+
+    def get(self, key, count=True):
+        """
+        Get the cached answer of the given key.
+
+        :param tuple key: The key to work with.
+        :param bool count: Tell us if we have to count the hit or miss.
+
+        :return:
+            A tuple :code:`(found, answer)`.
+            :code:`answer` is :code:`None` for a negative answer.
+        :rtype: tuple
+        """
+
+        with self.lock:
+            if key in self.cache:
+                # The key is cached.
+
+                # We get its expiration and answer.
+                expiration, answer = self.cache[key]
+
+                if expiration > PyFunceble.time():
+                    # The answer is still valid.
+
+                    # We mark it as the most recently used.
+                    self.cache.move_to_end(key)
+
+                    if count:
+                        # We increase the number of hits.
+                        self.hits += 1
+
+                    return True, answer
+
+                # The answer expired, we delete it.
+                del self.cache[key]
+
+        if self.database is not None:
+            # We have to consult the database.
+
+            # We get the answer from the database.
+            found, answer, expiration = self.database.get(key)
+
+            if found:
+                # The answer was saved by a previous run.
+
+                with self.lock:
+                    # We keep it in memory.
+                    self.__remember(key, answer, expiration)
+
+                    if count:
+                        # We increase the number of hits.
+                        self.hits += 1
+
+                return True, answer
+
+        if count:
+            with self.lock:
+                # We increase the number of misses.
+                self.misses += 1
+
+        return False, None
+
+    def set(self, key, answer, ttl):
+        """
+        Cache the given answer.
+
+        :param tuple key: The key to work with.
+        :param answer: The answer to cache. :code:`None` for a negative answer.
+        :type answer: list|None
+        :param int ttl: The number of seconds the answer is valid.
+        """
+
+        if ttl <= 0:
+            # The answer must not be cached.
+
+            return
+
+        # We get the time the answer expires at.
+        expiration = PyFunceble.time() + ttl
+
+        with self.lock:
+            # We cache the answer.
+            self.__remember(key, answer, expiration)
+
+            if self.answers is not None:
+                # We keep the answer for another process.
+                self.answers.append((key, answer, expiration))
+
+                return
+
+        if self.database is not None:
+            # We save the answer into the database.
+            self.database.add(key, answer, expiration)
+
+    def pop_answers(self):
+        """
+        Provide the answers cached since the last call and keep the next ones
+        for another process.
+
+        :return: A list of :code:`(key, answer, expiration)`.
+        :rtype: list
+
+        .. note::
+            From now, the new answers are not saved into the database.
+            They have to be given to :meth:`merge_answers` by the process
+            which saves them.
+        """
+
+        with self.lock:
+            answers = self.answers or []
+            self.answers = []
+
+        return answers
+
+    def merge_answers(self, answers):
+        """
+        Cache and save the given answers.
+
+        :param list answers:
+            The answers (of another process) to add.
+            Same format as :meth:`pop_answers`.
+        """
+
+        for key, answer, expiration in answers:
+            # We loop through the answers.
+
+            if expiration <= PyFunceble.time():
+                # The answer expired.
+
+                continue
+
+            with self.lock:
+                # We cache the answer.
+                self.__remember(key, answer, expiration)
+
+            if self.database is not None:
+                # We save the answer into the database.
+                self.database.add(key, answer, expiration)
+
+    @classmethod
+    def get_negative_ttl(cls, exception):
+        """
+        Provide the number of seconds to cache the given negative answer.
+
+        :param exception: The exception raised by the resolver.
+        :type exception: dns.resolver.NXDOMAIN|dns.resolver.NoAnswer
+
+        :rtype: int
+
+        .. note::
+            As defined by RFC 2308, we use the minimum between the TTL
+            of the SOA record and its :code:`MINIMUM` field.
+        """
+
+        # We get the response(s) attached to the exception.
+        responses = list(exception.kwargs.get("responses", {}).values())
+
+        if exception.kwargs.get("response") is not None:
+            # There is a response attached to the exception.
+
+            # We add it to the list of responses.
+            responses.append(exception.kwargs["response"])
+
+        for response in responses:
+            # We loop through the list of responses.
+
+            for rrset in response.authority:
+                # We loop through the authority section.
+
+                if rrset.rdtype == dns.rdatatype.SOA:
+                    # We found the SOA record.
+
+                    # We return the negative TTL.
+                    return min(rrset.ttl, rrset[0].minimum)
+
+        return cls.negative_ttl
+
+    def add_saved(self):
+        """
+        Count a lookup we did not have to do.
+        """
+
+        with self.lock:
+            self.saved += 1
+
+    def add_plan_step(self, plan, step, found):
+        """
+        Count a step of a query plan.
+
+        :param str plan: The query plan we are working with.
+        :param str step: The step of the query plan.
+        :param bool found: Tell us if the step gave us something.
+        """
+
+        with self.lock:
+            if plan not in self.plans:
+                self.plans[plan] = {}
+
+            if step not in self.plans[plan]:
+                self.plans[plan][step] = {"asked": 0, "found": 0}
+
+            self.plans[plan][step]["asked"] += 1
+
+            if found:
+                self.plans[plan][step]["found"] += 1
+
+    def get_statistics(self):
+        """
+        Provide the statistics of the cache.
+
+        :return:
+            A dict with the following indexes.
+
+            ::
+
+                {
+                    "hits": 0,
+                    "misses": 0,
+                    "saved": 0,
+                    "size": 0,
+                    "plans": {
+                        "subdomain": {
+                            "A": {"asked": 0, "found": 0}
+                        }
+                    }
+                }
+
+        :rtype: dict
+        """
+
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "saved": self.saved,
+                "size": len(self.cache),
+                "plans": {
+                    plan: {step: dict(counts) for step, counts in steps.items()}
+                    for plan, steps in self.plans.items()
+                },
+            }
+
+    def pop_statistics(self):
+        """
+        Provide the statistics of the cache and reset them.
+
+        :return:
+            Same format as :func:`~PyFunceble.dns_lookup.DNSCache.get_statistics`.
+        :rtype: dict
+
+        .. note::
+            The cached answers are kept.
+        """
+
+        with self.lock:
+            statistics = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "saved": self.saved,
+                "size": len(self.cache),
+                "plans": self.plans,
+            }
+
+            self.hits = 0
+            self.misses = 0
+            self.saved = 0
+            self.plans = {}
+
+        return statistics
+
+    def merge_statistics(self, statistics):
+        """
+        Add the given statistics to ours.
+
+        :param dict statistics:
+            The statistics (of another process) to add.
+            Same format as :func:`~PyFunceble.dns_lookup.DNSCache.get_statistics`.
+        """
+
+        with self.lock:
+            self.hits += statistics["hits"]
+            self.misses += statistics["misses"]
+            self.saved += statistics["saved"]
+
+        for plan, steps in statistics["plans"].items():
+            # We loop through the query plans.
+
+            for step, counts in steps.items():
+                # We loop through their steps.
+
+                with self.lock:
+                    if plan not in self.plans:
+                        self.plans[plan] = {}
+
+                    if step not in self.plans[plan]:
+                        self.plans[plan][step] = {"asked": 0, "found": 0}
+
+                    self.plans[plan][step]["asked"] += counts["asked"]
+                    self.plans[plan][step]["found"] += counts["found"]
+
+    def clear(self):
+        """
+        Empty the cache and reset its statistics.
+        """
+
+        with self.lock:
+            self.cache.clear()
+            self.answers = None
+
+            self.hits = 0
+            self.misses = 0
+            self.saved = 0
+            self.plans = {}
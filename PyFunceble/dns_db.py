@@ -0,0 +1,514 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+This submodule will provide the DNS database logic and interface.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: disable=line-too-long
+
+from hashlib import sha256
+from json import dumps, loads
+from threading import Lock
+
+import PyFunceble
+from PyFunceble.helpers import Dict, File
+
+
+class DNSDB:
+    """
+    Provide the DNS database interface and logic.
+
+    It keeps the DNS answers across runs so that the answers which did
+    not expire yet are not asked for again.
+
+    :param sqlite_db: The SQLite database interface.
+    :param mysql_db: The MySQL/MariaDB database interface.
+
+    .. note::
+        The keys are the one used by :class:`~PyFunceble.dns_cache.DNSCache`
+        which means :code:`(DNS servers, subject, record type)`.
+    """
+
+    # Save the answers.
+    # Note: It's a server -> subject -> record type -> data dict.
+    database = {}
+
+    database_file = None
+    authorized = False
+
+    # Save the minimal number of seconds between two updates of the
+    # last access of an answer.
+    access_interval = 3600
+
+    # Save the lock which protect the database against concurrent writes.
+    lock = Lock()
+
+    def __init__(self, sqlite_db=None, mysql_db=None):
+        # Get the authorization.
+        self.authorized = self.authorization()
+
+        # We set the location of the database file.
+        self.database_file = "{0}{1}".format(
+            PyFunceble.CONFIG_DIRECTORY, PyFunceble.OUTPUTS["default_files"]["dns_db"]
+        )
+
+        self.sqlite_db = sqlite_db
+        self.mysql_db = mysql_db
+
+        self.table_name = self.get_table_name()
+
+        # We load the database.
+        self.load()
+
+    @classmethod
+    def authorization(cls):
+        """
+        Provide the operation authorization.
+        """
+
+        return PyFunceble.CONFIGURATION["dns_database"]
+
+    @classmethod
+    def split_key(cls, key):
+        """
+        Split the given key into the server, subject and record type
+        we save.
+
+        :param tuple key: The key to work with.
+
+        :rtype: tuple
+        """
+
+        nameservers, subject, record_type = key
+
+        return " ".join(nameservers), subject, record_type
+
+    @classmethod
+    def get_digest(cls, server, subject, record_type):
+        """
+        Provide the digest which identify the given answer
+        into the MySQL/MariaDB database.
+
+        :rtype: str
+        """
+
+        return sha256(
+            bytes("{0} {1} {2}".format(server, subject, record_type), "utf-8")
+        ).hexdigest()
+
+    def get_table_name(self):
+        """
+        Return the name of the table to use.
+        """
+
+        if PyFunceble.CONFIGURATION["db_type"] == "sqlite":
+            return self.sqlite_db.tables["dns"]
+        if PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
+            return self.mysql_db.tables["dns"]
+        return "dns"
+
+    def __get_json(self, server, subject, record_type):
+        with self.lock:
+            try:
+                return dict(self.database[server][subject][record_type])
+            except KeyError:
+                return None
+
+    def __get_sqlite(self, server, subject, record_type):
+        query = (
+            "SELECT * FROM {0} WHERE server = :server "
+            "AND subject = :subject AND record_type = :record_type"
+        ).format(self.table_name)
+
+        output = self.sqlite_db.cursor.execute(
+            query, {"server": server, "subject": subject, "record_type": record_type}
+        )
+        fetched = output.fetchone()
+
+        if fetched:
+            return {
+                "answer": loads(fetched["answer"]),
+                "expiration": fetched["expiration_epoch"],
+                "last_access": fetched["last_access_epoch"],
+            }
+        return None
+
+    def __get_mysql(self, server, subject, record_type):
+        query = "SELECT * FROM {0} WHERE digest = %(digest)s".format(self.table_name)
+
+        with self.mysql_db.get_connection() as cursor:
+            cursor.execute(
+                query, {"digest": self.get_digest(server, subject, record_type)}
+            )
+
+            fetched = cursor.fetchone()
+
+        if fetched:
+            return {
+                "answer": loads(fetched["answer"]),
+                "expiration": fetched["expiration_epoch"],
+                "last_access": fetched["last_access_epoch"],
+            }
+        return None
+
+    def get(self, key):
+        """
+        Get the saved answer of the given key.
+
+        :param tuple key: The key to work with.
+
+        :return:
+            A tuple :code:`(found, answer, expiration)`.
+            :code:`answer` is :code:`None` for a negative answer.
+        :rtype: tuple
+        """
+
+        if self.authorized:
+            # We are authorized to operate.
+
+            server, subject, record_type = self.split_key(key)
+
+            if PyFunceble.CONFIGURATION["db_type"] == "json":
+                data = self.__get_json(server, subject, record_type)
+            elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
+                data = self.__get_sqlite(server, subject, record_type)
+            elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
+                data = self.__get_mysql(server, subject, record_type)
+            else:  # pragma: no cover
+                data = None
+
+            if data:
+                # The answer is saved.
+
+                # We get the current time.
+                now = int(PyFunceble.time())
+
+                if data["expiration"] <= now:
+                    # The answer expired.
+
+                    # We delete it.
+                    self.delete(key)
+
+                    return False, None, None
+
+                if now - data["last_access"] >= self.access_interval:
+                    # We did not use the answer for a while.
+
+                    # We save that we used it.
+                    self.add(key, data["answer"], data["expiration"])
+
+                return True, data["answer"], data["expiration"]
+
+        return False, None, None
+
+    def add(self, key, answer, expiration):
+        """
+        Save the given answer.
+
+        :param tuple key: The key to work with.
+        :param answer: The answer to save. :code:`None` for a negative answer.
+        :type answer: list|None
+        :param int expiration: The epoch the answer expires at.
+        """
+
+        if self.authorized:
+            # We are authorized to operate.
+
+            server, subject, record_type = self.split_key(key)
+
+            data = {
+                "server": server,
+                "subject": subject,
+                "record_type": record_type,
+                "answer": dumps(answer),
+                "expiration": int(expiration),
+                "last_access": int(PyFunceble.time()),
+            }
+
+            if PyFunceble.CONFIGURATION["db_type"] == "json":
+                with self.lock:
+                    # We save the answer.
+                    self.database.setdefault(server, {}).setdefault(subject, {})[
+                        record_type
+                    ] = {
+                        "answer": answer,
+                        "expiration": data["expiration"],
+                        "last_access": data["last_access"],
+                    }
+            elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
+                queries = self.sqlite_db.get_upsert_queries(
+                    self.table_name,
+                    {
+                        "server": "server",
+                        "subject": "subject",
+                        "record_type": "record_type",
+                        "answer": "answer",
+                        "expiration_epoch": "expiration",
+                        "last_access_epoch": "last_access",
+                    },
+                    ["server", "subject", "record_type"],
+                    update=["answer", "expiration_epoch", "last_access_epoch"],
+                )
+
+                for query in queries:
+                    # We execute the query.
+                    self.sqlite_db.execute(query, data)
+            elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
+                query = (
+                    "INSERT INTO {0} "
+                    "(server, subject, record_type, answer, "
+                    "expiration_epoch, last_access_epoch, digest) "
+                    "VALUES (%(server)s, %(subject)s, %(record_type)s, %(answer)s, "
+                    "%(expiration)s, %(last_access)s, %(digest)s) "
+                    "ON DUPLICATE KEY UPDATE "
+                    "answer = VALUES(answer), "
+                    "expiration_epoch = VALUES(expiration_epoch), "
+                    "last_access_epoch = VALUES(last_access_epoch)"
+                ).format(self.table_name)
+
+                data["digest"] = self.get_digest(server, subject, record_type)
+
+                # We execute the query.
+                self.mysql_db.execute(query, data)
+
+    def delete(self, key):
+        """
+        Delete the saved answer of the given key.
+
+        :param tuple key: The key to work with.
+        """
+
+        if self.authorized:
+            # We are authorized to operate.
+
+            server, subject, record_type = self.split_key(key)
+
+            if PyFunceble.CONFIGURATION["db_type"] == "json":
+                with self.lock:
+                    try:
+                        del self.database[server][subject][record_type]
+
+                        if not self.database[server][subject]:
+                            del self.database[server][subject]
+                    except KeyError:
+                        pass
+            elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
+                query = (
+                    "DELETE FROM {0} WHERE server = :server "
+                    "AND subject = :subject AND record_type = :record_type"
+                ).format(self.table_name)
+
+                # We execute the query.
+                self.sqlite_db.execute(
+                    query,
+                    {"server": server, "subject": subject, "record_type": record_type},
+                )
+            elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
+                query = "DELETE FROM {0} WHERE digest = %(digest)s".format(
+                    self.table_name
+                )
+
+                # We execute the query.
+                self.mysql_db.execute(
+                    query, {"digest": self.get_digest(server, subject, record_type)}
+                )
+
+    def __evict_json(self, now, size):
+        with self.lock:
+            # We list the saved answers.
+            # Note: It's a list of
+            #   (last access, expiration, server, subject, record type).
+            saved = [
+                (data["last_access"], data["expiration"], server, subject, record_type)
+                for server, subjects in self.database.items()
+                for subject, record_types in subjects.items()
+                for record_type, data in record_types.items()
+            ]
+
+            # We keep the answers which did not expire, the least recently
+            # used first.
+            to_keep = sorted(x for x in saved if x[1] > now)
+
+            if size > 0:
+                # The size of the database is limited.
+
+                # We keep the most recently used ones.
+                to_keep = to_keep[-size:]
+
+            if len(to_keep) == len(saved):
+                # There is nothing to delete.
+
+                return
+
+            database = {}
+
+            for _, _, server, subject, record_type in to_keep:
+                # We rebuild the database with the answers to keep.
+
+                database.setdefault(server, {}).setdefault(subject, {})[
+                    record_type
+                ] = self.database[server][subject][record_type]
+
+            self.database.clear()
+            self.database.update(database)
+
+    def __evict_sqlite(self, now, size):
+        # We delete the expired answers.
+        self.sqlite_db.execute(
+            "DELETE FROM {0} WHERE expiration_epoch <= :now".format(self.table_name),
+            {"now": now},
+        )
+
+        if size > 0:
+            # The size of the database is limited.
+
+            output = self.sqlite_db.cursor.execute(
+                "SELECT COUNT(*) FROM {0}".format(self.table_name)
+            )
+            to_delete = output.fetchone()[0] - size
+
+            if to_delete > 0:
+                # There is too many answers.
+
+                # We delete the least recently used ones.
+                self.sqlite_db.execute(
+                    (
+                        "DELETE FROM {0} WHERE id IN "
+                        "(SELECT id FROM {0} ORDER BY last_access_epoch ASC "
+                        "LIMIT :limit)"
+                    ).format(self.table_name),
+                    {"limit": to_delete},
+                )
+
+    def __evict_mysql(self, now, size):
+        # We delete the expired answers.
+        self.mysql_db.execute(
+            "DELETE FROM {0} WHERE expiration_epoch <= %(now)s".format(
+                self.table_name
+            ),
+            {"now": now},
+        )
+
+        if size > 0:
+            # The size of the database is limited.
+
+            with self.mysql_db.get_connection() as cursor:
+                cursor.execute("SELECT COUNT(*) FROM {0}".format(self.table_name))
+                to_delete = cursor.fetchone()["COUNT(*)"] - size
+
+            if to_delete > 0:
+                # There is too many answers.
+
+                # We delete the least recently used ones.
+                self.mysql_db.execute(
+                    "DELETE FROM {0} ORDER BY last_access_epoch ASC "
+                    "LIMIT %(limit)s".format(self.table_name),
+                    {"limit": to_delete},
+                )
+
+    def evict(self):
+        """
+        Delete the expired answers and the least recently used ones
+        which does not fit into :code:`dns_database_size`.
+        """
+
+        if self.authorized:
+            # We are authorized to operate.
+
+            now = int(PyFunceble.time())
+            size = PyFunceble.CONFIGURATION["dns_database_size"]
+
+            if PyFunceble.CONFIGURATION["db_type"] == "json":
+                self.__evict_json(now, size)
+            elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
+                self.__evict_sqlite(now, size)
+            elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
+                self.__evict_mysql(now, size)
+
+    def load(self):
+        """
+        Load the database file into the database.
+        """
+
+        if (
+            self.authorized
+            and PyFunceble.path.isfile(self.database_file)
+            and PyFunceble.CONFIGURATION["db_type"] == "json"
+        ):
+            # * We are authorized to operate.
+            # and
+            # * The database file exists.
+
+            with self.lock:
+                # We merge the database file into the already initiated database.
+                self.database.update(Dict().from_json(File(self.database_file).read()))
+
+    def save(self):
+        """
+        Evict what we do not want to keep and save the database
+        into the database file.
+        """
+
+        if self.authorized:
+            # We are authorized to operate.
+
+            # We evict the answers we do not want to keep.
+            self.evict()
+
+            if PyFunceble.CONFIGURATION["db_type"] == "json":
+                with self.lock:
+                    # We save the current state of the database.
+                    Dict(self.database).to_json(self.database_file)
@@ -1,4 +1,4 @@
-# pylint:disable=line-too-long
+# pylint:disable=line-too-long, too-many-lines
 """
 The tool to check the availability or syntax of domains, IPv4 or URL.
 
@@ -60,13 +60,20 @@ License:
 """
 # pylint: enable=line-too-long
 
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
 from socket import IPPROTO_TCP, gaierror, getaddrinfo, gethostbyaddr, herror
+from uuid import uuid4
 
+import dns.rdatatype
 import dns.resolver
 import dns.reversename
-from dns.exception import DNSException
+from dns.exception import DNSException, Timeout
 
+import PyFunceble
 from PyFunceble.check import Check
+from PyFunceble.dns_cache import DNSCache
+from PyFunceble.dns_server_pool import DNSServerPool
 
 
 class DNSLookup:  # pylint: disable=too-few-public-methods
@@ -76,8 +83,31 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
     :param str subject: The subject we are working with.
     :param dns_server: The DNS server we are working with.
     :type dns_server: list|tuple|str
+
+    .. note::
+        The resolvers, the cache of answers and the wildcard answers are shared by
+        all instances of the current process.
     """
 
+    # Save the resolvers we already created.
+    # Note: It's a DNS servers -> resolver dict.
+    resolvers = {}
+
+    # Save the resolvers of each server of our pools.
+    # Note: It's a (DNS servers, server) -> resolver dict.
+    server_resolvers = {}
+
+    # Save the pools of servers we already created.
+    # Note: It's a DNS servers -> DNSServerPool dict.
+    pools = {}
+
+    # Save the cache of answers.
+    cache = DNSCache()
+
+    # Save the wildcard answer of the registrable domains we already probed.
+    # Note: It's a (DNS servers, registrable domain) -> A record(s) or None dict.
+    wildcards = {}
+
     def __init__(self, subject, dns_server=None, complete=False):
         if subject:
             if isinstance(subject, str):
@@ -85,30 +115,417 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
             else:
                 raise ValueError("{0} expected".format(type(subject)))
 
-            if dns_server:
-                # A dns server is given.
+            # We get the resolver to use.
+            self.dns_resolver = self.get_resolver(dns_server)
+            # We get the pool of servers to spread our queries over.
+            self.dns_pool = self.get_pool(dns_server)
+            self.complete = complete
 
-                # We initiate the default resolver.
-                dns.resolver.default_resolver = dns.resolver.Resolver(configure=False)
+            # We initiate a variable which will tell us if the result
+            # of the request comes from a wildcard record.
+            self.wildcard = False
+            # We initiate a variable which will tell us if the DNS server(s)
+            # told us that the subject does not exist (NXDOMAIN).
+            self.nonexistent = False
+            # We initiate a variable which will tell us if one of our
+            # queries failed (timeout, SERVFAIL, ...) instead of
+            # giving us an answer.
+            self.failed = False
+
+    @classmethod
+    def get_resolver(cls, dns_server=None):
+        """
+        Provide the resolver of the given DNS server(s).
 
-                if isinstance(dns_server, (list, tuple)):
-                    # We got a list of dns server.
+        :param dns_server: The DNS server we are working with.
+        :type dns_server: list|tuple|str
 
-                    # We parse them.
-                    dns.resolver.default_resolver.nameservers = dns_server
-                else:
-                    # We got a dns server.
+        :rtype: dns.resolver.Resolver
+        """
+
+        if isinstance(dns_server, (list, tuple)):
+            # We got a list of dns server.
+
+            # We get a hashable version of it.
+            key = tuple(dns_server)
+        elif dns_server:
+            # We got a dns server.
+
+            key = (dns_server,)
+        else:
+            # A dns server is not given.
+
+            key = None
 
-                    # We parse it.
-                    dns.resolver.default_resolver.nameservers = [dns_server]
+        if key not in cls.resolvers:
+            # We do not have a resolver for the given DNS server(s).
+
+            if key:
+                # A dns server is given.
+
+                # We initiate the resolver.
+                resolver = dns.resolver.Resolver(configure=False)
+                # We parse the dns server(s).
+                resolver.nameservers = list(key)
             else:
                 # A dns server is not given.
 
                 # We configure everything with what the OS gives us.
-                dns.resolver.default_resolver = dns.resolver.Resolver()
+                resolver = dns.resolver.Resolver()
 
-            self.dns_resolver = dns.resolver
-            self.complete = complete
+            # We save the resolver.
+            cls.resolvers[key] = resolver
+
+        return cls.resolvers[key]
+
+    @classmethod
+    def get_server_resolver(cls, resolver, server):
+        """
+        Provide the resolver which only asks the given server.
+
+        :param resolver: The resolver the server belongs to.
+        :type resolver: dns.resolver.Resolver
+        :param str server: The server to ask.
+
+        :rtype: dns.resolver.Resolver
+
+        .. note::
+            The resolver is a copy of the given one so that we keep
+            its settings (e.g. the ones of the OS).
+        """
+
+        # We construct the key of the resolver.
+        key = (tuple(resolver.nameservers), server)
+
+        if key not in cls.server_resolvers:
+            # We do not have a resolver for the given server.
+
+            # We copy the given resolver.
+            server_resolver = copy(resolver)
+            # And we only ask the given server.
+            server_resolver.nameservers = [server]
+
+            # We save the resolver.
+            cls.server_resolvers[key] = server_resolver
+
+        return cls.server_resolvers[key]
+
+    @classmethod
+    def get_pool(cls, dns_server=None):
+        """
+        Provide the pool of the given DNS server(s).
+
+        :param dns_server: The DNS server we are working with.
+        :type dns_server: list|tuple|str
+
+        :rtype: :class:`~PyFunceble.dns_server_pool.DNSServerPool`
+        """
+
+        # We get the key of the DNS server(s).
+        key = tuple(cls.get_resolver(dns_server).nameservers)
+
+        if key not in cls.pools:
+            # We do not have a pool for the given DNS server(s).
+
+            # We create it.
+            cls.pools[key] = DNSServerPool(key)
+
+        return cls.pools[key]
+
+    @classmethod
+    def get_server_statistics(cls, reset=False):
+        """
+        Provide the statistics of all the DNS servers we worked with.
+
+        :param bool reset: Tell us if we have to reset the statistics.
+
+        :return:
+            A server -> statistics dict.
+
+            ::
+
+                {
+                    "1.1.1.1": {
+                        "queries": 0,
+                        "latency": 0.0,
+                        "timeouts": 0,
+                        "servfails": 0,
+                        "ejections": 0
+                    }
+                }
+
+            :code:`latency` is the total number of seconds we waited.
+        :rtype: dict
+        """
+
+        result = {}
+
+        for pool in cls.pools.values():
+            # We loop through our pools.
+
+            with pool.lock:
+                statistics = {x: dict(y) for x, y in pool.statistics.items()}
+
+            if reset:
+                pool.reset_statistics()
+
+            for server, counts in statistics.items():
+                # We loop through the servers of the pool.
+
+                if server not in result:
+                    result[server] = counts
+                else:
+                    for index, value in counts.items():
+                        result[server][index] += value
+
+        return result
+
+    @classmethod
+    def merge_server_statistics(cls, statistics):
+        """
+        Add the given statistics to the ones of our servers.
+
+        :param dict statistics:
+            The statistics (of another process) to add.
+            Same format as :func:`~PyFunceble.dns_lookup.DNSLookup.get_server_statistics`.
+        """
+
+        # We get the pool of the configured DNS server(s).
+        pool = cls.get_pool(PyFunceble.CONFIGURATION["dns_server"])
+
+        for server, counts in statistics.items():
+            # We loop through the given servers.
+
+            with pool.lock:
+                if server not in pool.statistics:
+                    pool.statistics[server] = {x: 0 for x in counts}
+
+                for index, value in counts.items():
+                    pool.statistics[server][index] += value
+
+    def __resolve(self, subject, record_type, lifetime=3.0):  # pragma: no cover
+        """
+        Send the query of the given record to the healthiest server(s).
+
+        :param subject: The subject we are working with.
+        :type subject: str|dns.name.Name
+        :param str record_type: The record type to query.
+        :param float lifetime: The number of second before timeout.
+
+        :rtype: dns.resolver.Answer
+
+        :raise DNSException: When no server could answer.
+        """
+
+        # We get the number of servers we are allowed to try.
+        # Note: The lifetime is shared between them.
+        attempts = min(len(self.dns_pool.servers), 2)
+
+        # We initiate the list of servers we tried.
+        tried = []
+        # We initiate the last exception we got.
+        exception = dns.resolver.NoNameservers()
+
+        for _ in range(attempts):
+            # We loop through the allowed attempts.
+
+            # We choose the server to use.
+            server = self.dns_pool.choose(exclude=tried)
+            tried.append(server)
+
+            # We save the time we started.
+            start = PyFunceble.time()
+
+            try:
+                # We query the record.
+                response = self.get_server_resolver(self.dns_resolver, server).query(
+                    subject, record_type, lifetime=lifetime / attempts
+                )
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                # The server answered, the record does not exist.
+
+                self.dns_pool.report(server, PyFunceble.time() - start, "ok")
+                raise
+            except Timeout as timeout:
+                # The server did not answer in time.
+
+                self.dns_pool.report(server, PyFunceble.time() - start, "timeout")
+                exception = timeout
+                continue
+            except dns.resolver.NoNameservers as servfail:
+                # The server could not answer (SERVFAIL, REFUSED, ...).
+
+                self.dns_pool.report(server, PyFunceble.time() - start, "servfail")
+                exception = servfail
+                continue
+
+            self.dns_pool.report(server, PyFunceble.time() - start, "ok")
+            return response
+
+        raise exception
+
+    def __query(self, subject, record_type, lifetime=3.0):
+        """
+        Query the given record of the given subject through our cache.
+
+        :param subject: The subject we are working with.
+        :type subject: str|dns.name.Name
+        :param str record_type: The record type to query.
+        :param float lifetime: The number of second before timeout.
+
+        :return: A list of record(s).
+        :rtype: list|None
+        """
+
+        # We construct the key of the answer.
+        key = (
+            tuple(self.dns_resolver.nameservers),
+            str(subject).lower().rstrip("."),
+            record_type,
+        )
+
+        # We get the answer from the cache.
+        found, answer = self.cache.get(key)
+
+        if found:
+            # The answer is cached.
+
+            # We return it.
+            return answer
+
+        try:
+            # We query the record.
+            response = self.__resolve(subject, record_type, lifetime=lifetime)
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as exception:
+            # We got a negative answer.
+
+            # We get the number of seconds to cache it for.
+            ttl = self.cache.get_negative_ttl(exception)
+
+            # We cache it.
+            self.cache.set(key, None, ttl)
+
+            if isinstance(exception, dns.resolver.NXDOMAIN):
+                # The subject does not exist.
+
+                # We save that nothing exists under it either.
+                self.cache.set(key[:2] + ("NXDOMAIN",), True, ttl)
+
+                if key[1] == self.subject.lower().rstrip("."):
+                    # We were looking for the subject itself.
+
+                    # We inform everyone that it does not exist.
+                    self.nonexistent = True
+
+            return None
+        except DNSException:
+            # The query failed, we do not cache anything.
+
+            # We inform everyone that we could not get an answer.
+            self.failed = True
+
+            return None
+
+        # We format the answer.
+        answer = [str(x) for x in response]
+
+        # We cache the answer until it expires.
+        self.cache.set(key, answer, int(response.expiration - PyFunceble.time()))
+
+        return answer
+
+    def has_nonexistent_parent(self, subject=None):
+        """
+        Check if the registrable domain of the given subject does not exist.
+
+        :param str subject: The subject we are working with.
+
+        :rtype: bool
+
+        .. note::
+            A name which does not exist (:code:`NXDOMAIN`) has no descendant,
+            so we do not have to look for the subject itself.
+        """
+
+        if not subject:
+            subject = self.subject
+
+        # We get the registrable domain of the subject.
+        registrable_domain = Check(subject).get_registrable_domain()
+
+        if not registrable_domain or registrable_domain == subject.lower().rstrip("."):
+            # * There is no registrable domain.
+            # or
+            # * The subject is the registrable domain.
+
+            return False
+
+        # We construct the key of the NXDOMAIN answer of the registrable domain.
+        key = (tuple(self.dns_resolver.nameservers), registrable_domain, "NXDOMAIN")
+
+        # We get it from the cache.
+        found, _ = self.cache.get(key, count=False)
+
+        if not found:
+            # We do not know if the registrable domain exists.
+
+            # We look for its NS record.
+            # Note: Its answer is cached and shared by its descendants.
+            self.ns_record(registrable_domain)
+
+            # We get the answer from the cache.
+            found, _ = self.cache.get(key, count=False)
+
+        return found
+
+    def get_wildcard(self, subject=None):  # pragma: no cover
+        """
+        Get the wildcard answer of the registrable domain of the given subject.
+
+        :param str subject: The subject we are working with.
+
+        :return:
+            The A record(s) every subdomain of the registrable domain
+            resolves to or :code:`None` if there is no wildcard record.
+        :rtype: list|None
+
+        .. note::
+            We probe the registrable domain once with a random label and keep the
+            answer until the end of the run.
+        """
+
+        if not subject:
+            subject = self.subject
+
+        if not PyFunceble.CONFIGURATION["dns_wildcard_detection"]:
+            # We are not authorized to probe.
+
+            return None
+
+        # We get the registrable domain of the subject.
+        registrable_domain = Check(subject).get_registrable_domain()
+
+        if not registrable_domain or registrable_domain == subject.lower().rstrip("."):
+            # * There is no registrable domain.
+            # or
+            # * The subject is the registrable domain.
+
+            return None
+
+        # We construct the key of the registrable domain.
+        key = (tuple(self.dns_resolver.nameservers), registrable_domain)
+
+        if key not in self.wildcards:
+            # We did not probe the registrable domain yet.
+
+            # We look for the A record of a random label under the registrable domain.
+            # Note: A random label can only resolve through a wildcard record.
+            self.wildcards[key] = (
+                self.a_record("{0}.{1}".format(uuid4().hex, registrable_domain))
+                or None
+            )
+
+        return self.wildcards[key]
 
     def a_record(self, subject=None, lifetime=3.0):  # pragma: no cover
         """
@@ -124,15 +541,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         if not subject:
             subject = self.subject
 
-        try:
-            # We get the A record of the given subject.
-            return [
-                str(x) for x in self.dns_resolver.query(subject, "A", lifetime=lifetime)
-            ]
-        except DNSException:
-            pass
-
-        return None
+        # We get the A record of the given subject.
+        return self.__query(subject, "A", lifetime=lifetime)
 
     def aaaa_record(self, subject=None, lifetime=3.0):  # pragma: no cover
         """
@@ -148,16 +558,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         if not subject:
             subject = self.subject
 
-        try:
-            # We get the A record of the given subject.
-            return [
-                str(x)
-                for x in self.dns_resolver.query(subject, "AAAA", lifetime=lifetime)
-            ]
-        except DNSException:
-            pass
-
-        return None
+        # We get the AAAA record of the given subject.
+        return self.__query(subject, "AAAA", lifetime=lifetime)
 
     def cname_record(self, subject=None, lifetime=3.0):  # pragma: no cover
         """
@@ -173,16 +575,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         if not subject:
             subject = self.subject
 
-        try:
-            # We get the A record of the given subject.
-            return [
-                str(x)
-                for x in self.dns_resolver.query(subject, "CNAME", lifetime=lifetime)
-            ]
-        except DNSException:
-            pass
-
-        return None
+        # We get the CNAME record of the given subject.
+        return self.__query(subject, "CNAME", lifetime=lifetime)
 
     def mx_record(self, subject=None, lifetime=3.0):  # pragma: no cover
         """
@@ -198,16 +592,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         if not subject:
             subject = self.subject
 
-        try:
-            # We get the MX record of the given subject.
-            return [
-                str(x)
-                for x in self.dns_resolver.query(subject, "MX", lifetime=lifetime)
-            ]
-        except DNSException:
-            pass
-
-        return None
+        # We get the MX record of the given subject.
+        return self.__query(subject, "MX", lifetime=lifetime)
 
     def ns_record(self, subject=None, lifetime=3.0):
         """
@@ -223,16 +609,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         if not subject:
             subject = self.subject
 
-        try:
-            # We get the NS record of the given subject.
-            return [
-                str(x)
-                for x in self.dns_resolver.query(subject, "NS", lifetime=lifetime)
-            ]
-        except DNSException:
-            pass
-
-        return None
+        # We get the NS record of the given subject.
+        return self.__query(subject, "NS", lifetime=lifetime)
 
     def txt_record(self, subject=None, lifetime=3.0):  # pragma: no cover
         """
@@ -248,16 +626,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         if not subject:
             subject = self.subject
 
-        try:
-            # We get the TXT record of the given subject.
-            return [
-                str(x)
-                for x in self.dns_resolver.query(subject, "TXT", lifetime=lifetime)
-            ]
-        except DNSException:
-            pass
-
-        return None
+        # We get the TXT record of the given subject.
+        return self.__query(subject, "TXT", lifetime=lifetime)
 
     def ptr_record(self, subject=None, reverse_name=True, lifetime=3.0):
         """
@@ -280,14 +650,61 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
             else:  # pragma: no cover
                 to_request = subject
 
-            # We get the PTR record of the currently read A record.
-            return [
-                str(x) for x in dns.resolver.query(to_request, "PTR", lifetime=lifetime)
-            ]
         except DNSException:  # pragma: no cover
-            pass
+            return None
+
+        # We get the PTR record of the currently read A record.
+        return self.__query(to_request, "PTR", lifetime=lifetime)
+
+    def get_addresses(self, result=None):
+        """
+        Get the addresses (A and AAAA records) of the subject.
+
+        :param dict result:
+            The result of :meth:`request` to take the addresses from.
+
+        :return:
+            The addresses, the IPv4 first or :code:`None` if we could not
+            get an answer from our DNS server(s).
+        :rtype: list|None
+
+        .. note::
+            If the given result does not have any address, we ask for
+            the A records of the subject then for its AAAA records.
+
+        .. note::
+            An empty list is only returned when our DNS server(s) told
+            us that the subject does not have any address.
+        """
 
-        return None  # pragma: no cover
+        # We initiate the addresses.
+        addresses = []
+
+        for index in ["A", "AAAA", "addr_info"]:
+            # We loop through the indexes which may have addresses.
+
+            if result and result.get(index):
+                # The result has some addresses.
+
+                # We keep the ones we do not know yet.
+                addresses.extend(x for x in result[index] if x not in addresses)
+
+        if not addresses:
+            # The result does not have any address.
+
+            # We reset the failure state of our queries.
+            self.failed = False
+
+            # We ask for them.
+            addresses = self.a_record() or self.aaaa_record()
+
+            if not addresses and self.failed:
+                # We could not get an answer for one of our queries.
+
+                # We can't tell that the subject does not have any address.
+                return None
+
+        return addresses or []
 
     def get_addr_info(self, subject=None):
         """
@@ -348,32 +765,103 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
 
         return None
 
-    def __request_not_ipv4(self):
+    def __request_plan(self, plan):
         """
-        Handle the request for a subject which is not an IPv4.
+        Follow the given query plan until one of its steps gives us something.
+
+        :param str plan:
+            The query plan to follow.
+            Should be one of the indexes of :code:`dns_query_plan`.
+
+        :return: The answer of the first step which gave us something.
+        :rtype: dict
+
+        :raise ValueError: When a step of the query plan is unknown.
         """
 
-        result = {}
+        # We initiate the step -> method to call dict.
+        steps = {
+            "A": self.a_record,
+            "AAAA": self.aaaa_record,
+            "CNAME": self.cname_record,
+            "MX": self.mx_record,
+            "NS": self.ns_record,
+            "PTR": self.ptr_record,
+            "TXT": self.txt_record,
+            "addr_info": self.get_addr_info,
+            "host_by_addr": self.get_host_by_addr,
+        }
 
-        # We get the NS record of the given subject.
-        result["NS"] = self.ns_record()
+        for step in PyFunceble.CONFIGURATION["dns_query_plan"][plan]:
+            # We loop through the steps of the query plan.
+
+            if step not in steps:
+                raise ValueError(
+                    "Unknown step of the {0} query plan: {1}".format(plan, step)
+                )
+
+            # We get the answer of the step.
+            answer = steps[step]()
+
+            # We count the step.
+            self.cache.add_plan_step(plan, step, bool(answer))
+
+            if answer:
+                # The step gave us something.
+
+                if step == "host_by_addr":
+                    # The answer is already formatted.
+
+                    return answer
+
+                # We return the answer, we do not have to go further.
+                return {step: answer}
+
+        # None of the steps gave us something.
+        return {}
+
+    def __request_not_ipv4(self):
+        """
+        Handle the request for a subject which is not an IPv4.
+        """
 
-        if self.complete:  # pragma: no cover
+        if not self.complete:
+            # We do not want all records.
 
-            # We get the A record of the given subject.
-            result["A"] = self.a_record()
+            if Check(self.subject).is_subdomain():
+                # We are working with a subdomain.
 
-            # We get the AAAA record of the given subject.
-            result["AAAA"] = self.aaaa_record()
+                # We follow the subdomain query plan.
+                return self.__request_plan("subdomain")
 
-            # We get the CNAME record of the given subject.
-            result["CNAME"] = self.cname_record()
+            # We follow the domain query plan.
+            return self.__request_plan("domain")
 
-            # We get the MX record of the given subject.
-            result["MX"] = self.mx_record()
+        result = {}
 
-            # We get the TXT record of the given subject.
-            result["TXT"] = self.txt_record()
+        # We initiate the record type -> method to call dict.
+        queries = {
+            "NS": self.ns_record,
+            "A": self.a_record,
+            "AAAA": self.aaaa_record,
+            "CNAME": self.cname_record,
+            "MX": self.mx_record,
+            "TXT": self.txt_record,
+        }
+
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            # We send all the queries at once so that we only wait for
+            # the slowest of them.
+            futures = {
+                record_type: executor.submit(method)
+                for record_type, method in queries.items()
+            }
+
+            for record_type, future in futures.items():
+                # We loop through the sent queries.
+
+                # And we get their records.
+                result[record_type] = future.result()
 
             if "A" in result and result["A"]:
                 # We could get some A record(s).
@@ -381,19 +869,20 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
                 # We initiate the PTR.
                 result["PTR"] = []
 
-                for a_result in result["A"]:
-                    # We loop through the list of A records.
-
-                    if "." not in a_result:  # pragma: no cover
-                        # There is no "." in the currently
-                        # read A record.
+                # We send the PTR queries of the A records at once.
+                # Note: We ignore the A records without "."
+                futures = [
+                    executor.submit(self.ptr_record, a_result)
+                    for a_result in result["A"]
+                    if "." in a_result
+                ]
 
-                        # We continue the loop.
-                        continue
+                for future in futures:
+                    # We loop through the sent PTR queries.
 
                     try:
                         # We get the PTR record of the currently read A record.
-                        result["PTR"].extend(self.ptr_record(a_result))
+                        result["PTR"].extend(future.result())
                     except TypeError:  # pragma: no cover
                         pass
 
@@ -431,20 +920,8 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         Handle the request for a subject which is IPv4.
         """
 
-        result = {}
-
-        # We get the PTR record of the given subject.
-        result["PTR"] = self.ptr_record()
-
-        if "PTR" not in result or not result["PTR"]:  # pragma: no cover
-            del result["PTR"]
-
-        if not result:  # pragma: no cover
-            # We could not get DNS records about the given subject.
-
-            result = self.get_host_by_addr()
-
-        return result
+        # We follow the IPv4 query plan.
+        return self.__request_plan("ipv4")
 
     def request(self):
         """
@@ -484,10 +961,60 @@ class DNSLookup:  # pylint: disable=too-few-public-methods
         if not Check(self.subject).is_ipv4():
             # We are looking for something which is not an IPv4.
 
+            if self.has_nonexistent_parent():
+                # The registrable domain of the subject does not exist.
+
+                # We inform everyone that the subject does not exist either.
+                self.nonexistent = True
+
+                # We count the lookup we did not have to do.
+                self.cache.add_saved()
+
+                # We return an empty result, the subject can't exist.
+                return result
+
             temp_result = self.__request_not_ipv4()
 
             if isinstance(temp_result, dict):
                 result.update(temp_result)
+
+            if result:
+                # We got something.
+                # Note: The system resolver may know a subject our DNS
+                # server(s) do not know.
+
+                # We inform everyone that the subject exists.
+                self.nonexistent = False
+
+                if not self.complete and result.get("A"):
+                    # * We do not want all records.
+                    # and
+                    # * The subject has some A record(s).
+
+                    # We get the wildcard answer of the registrable domain.
+                    wildcard = self.get_wildcard()
+
+                    # We inform everyone if the subject resolves like any
+                    # random subdomain of its registrable domain.
+                    # Note: A subject below an existing node or into a delegated
+                    # zone is not covered by the wildcard record, that's why
+                    # we compare the answers.
+                    self.wildcard = bool(wildcard) and sorted(wildcard) == sorted(
+                        result["A"]
+                    )
+            elif not self.nonexistent:
+                # We did not get anything.
+
+                # We check if the NXDOMAIN answer of the subject is cached.
+                # Note: It is the case when our negative answers came from the cache.
+                self.nonexistent, _ = self.cache.get(
+                    (
+                        tuple(self.dns_resolver.nameservers),
+                        self.subject.lower().rstrip("."),
+                        "NXDOMAIN",
+                    ),
+                    count=False,
+                )
         else:
             # We are working with something which is an IPv4.
 
@@ -0,0 +1,802 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+This submodule will provide the bulk asynchronous DNS prober.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import asyncio
+from secrets import randbelow
+from socket import AF_INET, AF_INET6, SO_RCVBUF, SO_SNDBUF, SOL_SOCKET, inet_ntop
+from struct import error as struct_error
+from struct import pack, unpack_from
+
+import dns.rdata
+import dns.rdatatype
+from dns.exception import DNSException
+
+from PyFunceble.dns_lookup import DNSLookup
+
+
+class ProberProtocol(asyncio.DatagramProtocol):
+    """
+    Provide one of the UDP sockets of the prober.
+    The responses are matched to their queries by query ID and question.
+
+    :param float timeout: The number of seconds to wait for a response.
+    """
+
+    def __init__(self, timeout):
+        super(ProberProtocol, self).__init__()
+
+        self.timeout = timeout
+
+        # We initiate the transport of the socket.
+        self.transport = None
+        # We initiate the queries waiting for a response.
+        # Note: It's a query ID -> (question, nameserver, future, timer) dict.
+        self.pending = {}
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+        # We get the socket.
+        sock = transport.get_extra_info("socket")
+
+        # We increase the size of its buffers so that a burst of responses
+        # does not get dropped while we are busy.
+        sock.setsockopt(SOL_SOCKET, SO_RCVBUF, 4 * 1024 * 1024)
+        sock.setsockopt(SOL_SOCKET, SO_SNDBUF, 1024 * 1024)
+
+    def datagram_received(self, data, addr):
+        # We get the ID of the response.
+        query_id = int.from_bytes(data[:2], "big")
+
+        if query_id not in self.pending:
+            # The response is not expected (late or forged), we ignore it.
+            return
+
+        # We get the query of the response.
+        question, nameserver, future, timer = self.pending[query_id]
+
+        if (
+            addr[0] == nameserver
+            and data[2] & 0x80
+            and data[12 : 12 + len(question)].lower() == question
+        ):
+            # * The response comes from the nameserver we asked.
+            # and
+            # * It is a response.
+            # and
+            # * It answers our question.
+
+            del self.pending[query_id]
+            timer.cancel()
+
+            if not future.done():
+                # We give the response to who is waiting for it.
+                future.set_result(data)
+
+    def error_received(self, exc):  # pragma: no cover
+        for _, _, future, timer in self.pending.values():
+            # We loop through the queries waiting for a response.
+
+            timer.cancel()
+
+            if not future.done():
+                # We inform who is waiting about the error.
+                future.set_exception(exc)
+
+        self.pending.clear()
+
+    def __expire(self, query_id):
+        """
+        Stop waiting for the response of the given query.
+
+        :param int query_id: The ID of the query.
+        """
+
+        # We get the query.
+        _, _, future, _ = self.pending.pop(query_id)
+
+        if not future.done():
+            # We inform who is waiting that the response did not come in time.
+            future.set_exception(asyncio.TimeoutError())
+
+    def send(self, question, nameserver, port):
+        """
+        Send the given question.
+
+        :param bytes question: The question section of the query.
+        :param str nameserver: The nameserver to send the query to.
+        :param int port: The port of the nameserver.
+
+        :return:
+            The future of the response.
+            Its result is the response in wire format.
+        :rtype: asyncio.Future
+        """
+
+        # We get an unpredictable ID which is not used by another query.
+        query_id = randbelow(65536)
+
+        while query_id in self.pending:
+            query_id = randbelow(65536)
+
+        # We get the event loop.
+        loop = asyncio.get_event_loop()
+
+        # We initiate the future of the response.
+        future = loop.create_future()
+
+        # We register the query.
+        self.pending[query_id] = (
+            question,
+            nameserver,
+            future,
+            loop.call_later(self.timeout, self.__expire, query_id),
+        )
+
+        # And we send it.
+        self.transport.sendto(
+            DNSProber.get_query(query_id, question), (nameserver, port)
+        )
+
+        return future
+
+
+class DNSProber:  # pylint: disable=too-many-instance-attributes
+    """
+    Resolve a large number of subjects at once.
+    Thousands of queries are multiplexed over a few UDP sockets.
+
+    :param dns_server: The DNS server(s) we are working with.
+    :type dns_server: list|tuple|str
+    :param int port: The port of the DNS server(s).
+    :param int sockets: The number of UDP sockets (per address family).
+    :param float timeout: The number of seconds to wait for a response.
+    :param int retries: The number of times to retry a query which failed.
+    :param int max_outstanding:
+        The maximal number of queries waiting for a response at once.
+
+    .. note::
+        The answers are read from and written into the cache of
+        :class:`~PyFunceble.dns_lookup.DNSLookup`.
+
+    .. note::
+        A truncated response is asked again over TCP.
+
+    .. note::
+        The queries are encoded and the responses decoded by ourself because
+        building a :code:`dns.message.Message` for each of them would
+        cost us more than the network.
+    """
+
+    def __init__(
+        self,
+        dns_server=None,
+        port=None,
+        sockets=4,
+        timeout=2.0,
+        retries=2,
+        max_outstanding=4096,
+    ):  # pylint: disable=too-many-arguments
+        # We get the resolver of the given DNS server(s).
+        resolver = DNSLookup.get_resolver(dns_server)
+
+        # We get the nameservers to send our queries to.
+        self.nameservers = [str(x) for x in resolver.nameservers]
+        self.port = port if port else resolver.port
+
+        self.sockets = sockets
+        self.timeout = timeout
+        self.retries = retries
+        self.max_outstanding = max_outstanding
+
+        # We initiate our sockets.
+        # Note: It's an address family -> list of ProberProtocol dict.
+        self.channels = {}
+        # We initiate the number of queries we sent.
+        # Note: We use it to spread our queries over our sockets and nameservers.
+        self.sent = 0
+
+    @classmethod
+    def get_family(cls, nameserver):
+        """
+        Provide the address family of the given nameserver.
+
+        :param str nameserver: The nameserver to work with.
+        """
+
+        if ":" in nameserver:
+            return AF_INET6
+        return AF_INET
+
+    @classmethod
+    def get_question(cls, name, record_type):
+        """
+        Encode the question section of the query of the given record.
+
+        :param str name: The (formatted) subject to query.
+        :param int record_type: The record type to query.
+
+        :return: The question or :code:`None` if the subject can't be queried.
+        :rtype: bytes|None
+        """
+
+        # We initiate the encoded name.
+        question = b""
+
+        for label in name.split("."):
+            # We loop through the labels of the name.
+
+            try:
+                # We encode the label.
+                label = label.encode("idna")
+            except UnicodeError:
+                return None
+
+            if not 0 < len(label) < 64:
+                # The label is empty or too long.
+
+                return None
+
+            question += bytes([len(label)]) + label
+
+        if len(question) > 254:
+            # The name is too long.
+
+            return None
+
+        # We return the name followed by its type and class (IN).
+        return question + b"\x00" + pack(">HH", record_type, 1)
+
+    @classmethod
+    def get_query(cls, query_id, question):
+        """
+        Encode the query of the given question.
+
+        :param int query_id: The ID of the query.
+        :param bytes question: The question section of the query.
+
+        :rtype: bytes
+        """
+
+        # We return the header (recursion desired and 1 question) followed by
+        # the question.
+        return pack(">HHHHHH", query_id, 0x0100, 1, 0, 0, 0) + question
+
+    @classmethod
+    def __skip_name(cls, data, offset):
+        """
+        Provide the offset of what follows the name at the given offset.
+
+        :param bytes data: The response we are working with.
+        :param int offset: The offset of the name.
+
+        :rtype: int
+        """
+
+        while True:
+            # We get the length of the current label.
+            length = data[offset]
+
+            if length >= 0xC0:
+                # The rest of the name is a pointer.
+                return offset + 2
+
+            if not length:
+                # The name ends here.
+                return offset + 1
+
+            offset += length + 1
+
+    @classmethod
+    def __read_record(cls, data, offset):
+        """
+        Read the header of the record which starts at the given offset.
+
+        :param bytes data: The response in wire format.
+        :param int offset: The offset of the record.
+
+        :return:
+            A dict with the following indexes.
+
+            ::
+
+                {
+                    "type": 1,
+                    "class": 1,
+                    "ttl": 3600,
+                    "start": 0,
+                    "end": 0
+                }
+
+            :code:`start` and :code:`end` are the offsets of the data of the record.
+
+        :rtype: dict
+
+        :raise DNSException: When the record is truncated.
+        """
+
+        # We skip the name of the record.
+        offset = cls.__skip_name(data, offset)
+
+        # We get the type, class, TTL and length of the record.
+        rdtype, rdclass, ttl, length = unpack_from(">HHIH", data, offset)
+        offset += 10
+
+        if offset + length > len(data):
+            raise DNSException("Truncated record.")
+
+        return {
+            "type": rdtype,
+            "class": rdclass,
+            "ttl": ttl,
+            "start": offset,
+            "end": offset + length,
+        }
+
+    @classmethod
+    def __decode_record(cls, data, record):
+        """
+        Decode the data of the given record.
+
+        :param bytes data: The response in wire format.
+        :param dict record: The header of the record.
+
+        :return: The data of the record in text format.
+        :rtype: str
+        """
+
+        # We get the length of the data of the record.
+        length = record["end"] - record["start"]
+
+        if record["type"] == dns.rdatatype.A and length == 4:
+            return inet_ntop(AF_INET, data[record["start"] : record["end"]])
+
+        if record["type"] == dns.rdatatype.AAAA and length == 16:
+            return inet_ntop(AF_INET6, data[record["start"] : record["end"]])
+
+        return dns.rdata.from_wire(
+            record["class"], record["type"], data, record["start"], length
+        ).to_text()
+
+    @classmethod
+    def parse_response(cls, data, question):
+        """
+        Decode the given response.
+
+        :param bytes data: The response in wire format.
+        :param bytes question: The question section of the query.
+
+        :return:
+            A dict with the following indexes.
+
+            ::
+
+                {
+                    "rcode": 0,
+                    "truncated": False,
+                    "records": [],
+                    "ttl": None,
+                    "negative_ttl": None
+                }
+
+            :code:`ttl` is the smallest TTL of the answer section and
+            :code:`negative_ttl` is the one given by the SOA record of the
+            authority section (RFC 2308).
+
+        :rtype: dict
+
+        :raise DNSException: When the response is malformed.
+        """
+
+        try:
+            # We get the flags and the number of records of the answer and
+            # authority sections.
+            flags, _, answer_count, authority_count = unpack_from(">HHHH", data, 2)
+            # We get the record type we asked for.
+            record_type = unpack_from(">H", question, len(question) - 4)[0]
+
+            result = {
+                "rcode": flags & 0xF,
+                "truncated": bool(flags & 0x0200),
+                "records": [],
+                "ttl": None,
+                "negative_ttl": None,
+            }
+
+            # We start right after the question.
+            offset = 12 + len(question)
+
+            for index in range(answer_count + authority_count):
+                # We loop through the records of the answer and authority sections.
+
+                # We get the header of the record.
+                record = cls.__read_record(data, offset)
+
+                if index < answer_count:
+                    # We are reading the answer section.
+
+                    if result["ttl"] is None or record["ttl"] < result["ttl"]:
+                        # We keep the smallest TTL of the chain.
+                        result["ttl"] = record["ttl"]
+
+                    if record["type"] == record_type:
+                        # The record is one of the records we asked for.
+
+                        result["records"].append(cls.__decode_record(data, record))
+                elif (
+                    record["type"] == dns.rdatatype.SOA
+                    and record["end"] - record["start"] >= 20
+                ):
+                    # We are reading the SOA record of the authority section.
+
+                    # We get the minimum between its TTL and MINIMUM field.
+                    result["negative_ttl"] = min(
+                        record["ttl"], unpack_from(">I", data, record["end"] - 4)[0]
+                    )
+
+                offset = record["end"]
+        except (IndexError, struct_error, ValueError) as exception:
+            raise DNSException("Malformed response: {0}".format(exception))
+
+        return result
+
+    async def open(self):
+        """
+        Open our sockets.
+        """
+
+        # We get the event loop.
+        loop = asyncio.get_event_loop()
+
+        for family in {self.get_family(x) for x in self.nameservers}:
+            # We loop through the address families of our nameservers.
+
+            if family in self.channels:
+                # The sockets of the family are already opened.
+
+                continue
+
+            self.channels[family] = []
+
+            for _ in range(self.sockets):
+                # We open the sockets of the family.
+                _, protocol = await loop.create_datagram_endpoint(
+                    lambda: ProberProtocol(self.timeout),
+                    family=family,
+                    local_addr=("::" if family == AF_INET6 else "0.0.0.0", 0),
+                )
+
+                self.channels[family].append(protocol)
+
+    def close(self):
+        """
+        Close our sockets.
+        """
+
+        for protocols in self.channels.values():
+            # We loop through our sockets.
+
+            for protocol in protocols:
+                # And we close them.
+                protocol.transport.close()
+
+        self.channels = {}
+
+    async def __send_tcp(self, question, nameserver):
+        """
+        Send the query of the given question over TCP.
+
+        :param bytes question: The question section of the query.
+        :param str nameserver: The nameserver to send the query to.
+
+        :return: The response in wire format.
+        :rtype: bytes
+        """
+
+        # We get the query to send.
+        query_id = randbelow(65536)
+        query = self.get_query(query_id, question)
+
+        # We open the connection.
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(nameserver, self.port), self.timeout
+        )
+
+        try:
+            # We send the query prefixed with its length.
+            writer.write(len(query).to_bytes(2, "big") + query)
+
+            # We get the length of the response.
+            length = int.from_bytes(
+                await asyncio.wait_for(reader.readexactly(2), self.timeout), "big"
+            )
+
+            # We get the response.
+            data = await asyncio.wait_for(reader.readexactly(length), self.timeout)
+        finally:
+            # We close the connection.
+            writer.close()
+
+        if (
+            int.from_bytes(data[:2], "big") != query_id
+            or data[12 : 12 + len(question)].lower() != question
+        ):
+            # The response does not answer our query.
+
+            raise DNSException("Unexpected response.")
+
+        return data
+
+    async def resolve(self, subject, record_type="A"):
+        """
+        Resolve the given record of the given subject.
+
+        :param str subject: The subject we are working with.
+        :param str record_type: The record type to query.
+
+        :return: A list of record(s).
+        :rtype: list|None
+        """
+
+        # We format the subject.
+        name = str(subject).lower().rstrip(".")
+
+        # We construct the key of the answer.
+        # Note: It's the same as the one of PyFunceble.dns_lookup.DNSLookup.
+        key = (tuple(self.nameservers), name, record_type)
+
+        # We get the answer from the cache.
+        found, answer = DNSLookup.cache.get(key)
+
+        if found:
+            # The answer is cached.
+
+            # We return it.
+            return answer
+
+        # We get the question to ask.
+        question = self.get_question(name, dns.rdatatype.from_text(record_type))
+
+        if not question:
+            # The subject can't be queried.
+            return None
+
+        # We get the index of the first socket and nameserver to use.
+        start = self.sent
+        self.sent += 1
+
+        for attempt in range(self.retries + 1):
+            # We loop through the allowed attempts.
+
+            # We get the nameserver to ask.
+            nameserver = self.nameservers[(start + attempt) % len(self.nameservers)]
+            # We get the sockets of the address family of the nameserver.
+            protocols = self.channels[self.get_family(nameserver)]
+
+            try:
+                # We send the query and decode its response.
+                response = self.parse_response(
+                    await protocols[(start + attempt) % len(protocols)].send(
+                        question, nameserver, self.port
+                    ),
+                    question,
+                )
+
+                if response["truncated"]:
+                    # The response is truncated.
+
+                    # We ask again over TCP.
+                    response = self.parse_response(
+                        await self.__send_tcp(question, nameserver), question
+                    )
+            except (asyncio.TimeoutError, EOFError, OSError, DNSException):
+                # The query failed.
+
+                # We try again.
+                continue
+
+            if response["rcode"] not in [0, 3]:
+                # The nameserver could not answer (neither NOERROR nor NXDOMAIN).
+
+                # We try another one.
+                continue
+
+            if not response["records"]:
+                # * The subject does not exist (NXDOMAIN).
+                # or
+                # * There is no record of the given type (NODATA).
+
+                # We get the number of seconds to cache it for.
+                ttl = response["negative_ttl"]
+
+                if ttl is None:
+                    ttl = DNSLookup.cache.negative_ttl
+
+                # We cache it.
+                DNSLookup.cache.set(key, None, ttl)
+
+                if response["rcode"] == 3:
+                    # The subject does not exist.
+
+                    # We save that nothing exists under it either.
+                    DNSLookup.cache.set(key[:2] + ("NXDOMAIN",), True, ttl)
+
+                return None
+
+            # We cache the answer until the first record of the chain expires.
+            DNSLookup.cache.set(key, response["records"], response["ttl"])
+
+            return response["records"]
+
+        # We could not get an answer.
+        return None
+
+    async def resolve_many(self, subjects, record_type="A"):
+        """
+        Resolve the given record of the given subjects.
+
+        :param subjects: The subjects we are working with.
+        :type subjects: list|iterable
+        :param str record_type: The record type to query.
+
+        :return:
+            An asynchronous iterator of :code:`(subject, records)` in the order
+            of the responses.
+            :code:`records` is the same as
+            :func:`~PyFunceble.dns_prober.DNSProber.resolve`.
+        """
+
+        # We check the record type before sending anything.
+        dns.rdatatype.from_text(record_type)
+
+        # We open our sockets.
+        await self.open()
+
+        # We initiate the number of queries which are allowed to wait at once.
+        semaphore = asyncio.Semaphore(self.max_outstanding)
+        # We initiate the queue of results.
+        # Note: It is bounded so that a slow consumer slows us down.
+        results = asyncio.Queue(maxsize=self.max_outstanding)
+        # We initiate the list of running queries.
+        tasks = set()
+
+        async def query(subject):
+            try:
+                # We resolve the subject.
+                await results.put((subject, await self.resolve(subject, record_type)))
+            finally:
+                semaphore.release()
+
+        async def dispatch():
+            try:
+                for subject in subjects:
+                    # We loop through the subjects.
+
+                    # We wait until we are allowed to send another query.
+                    await semaphore.acquire()
+
+                    # We resolve the subject in the background.
+                    task = asyncio.ensure_future(query(subject))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+                if tasks:
+                    # There are running queries.
+
+                    # We wait for them.
+                    await asyncio.wait(set(tasks))
+            finally:
+                # We inform the consumer that we are done.
+                await results.put(None)
+
+        # We start dispatching the subjects.
+        dispatcher = asyncio.ensure_future(dispatch())
+
+        try:
+            while True:
+                # We get the next result.
+                result = await results.get()
+
+                if result is None:
+                    # Every subject was resolved.
+
+                    # We raise what went wrong while dispatching (if any).
+                    await dispatcher
+
+                    # We break the loop.
+                    break
+
+                yield result
+        finally:
+            for task in [dispatcher] + list(tasks):
+                # We loop through what is still running.
+
+                # And we cancel it.
+                task.cancel()
+
+            # We close our sockets.
+            self.close()
+
+
+async def resolve_many(subjects, record_type="A", dns_server=None, **kwargs):
+    """
+    Resolve the given record of the given subjects.
+
+    :param subjects: The subjects we are working with.
+    :type subjects: list|iterable
+    :param str record_type: The record type to query.
+    :param dns_server: The DNS server(s) we are working with.
+    :type dns_server: list|tuple|str
+
+    :return: An asynchronous iterator of :code:`(subject, records)`.
+
+    .. note::
+        The other given arguments are given to :class:`~PyFunceble.dns_prober.DNSProber`.
+
+    ::
+
+        async for subject, records in resolve_many(["example.org"]):
+            print(subject, records)
+    """
+
+    async for result in DNSProber(dns_server=dns_server, **kwargs).resolve_many(
+        subjects, record_type=record_type
+    ):
+        yield result
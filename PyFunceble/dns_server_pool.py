@@ -0,0 +1,240 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will provide the pool of DNS servers.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+from random import choices
+from threading import Lock
+
+import PyFunceble
+
+
+class DNSServerPool:
+    """
+    Spread the queries over the given DNS servers according to their health.
+
+    :param list nameservers: The DNS servers we are working with.
+
+    .. note::
+        The health of a server is given by its average latency and error
+        (timeout or :code:`SERVFAIL`) rate. A server which keeps failing is
+        ejected for a while.
+    """
+
+    # Save the number of consecutive failures before we eject a server.
+    max_failures = 3
+    # Save the number of seconds we eject a server for.
+    ejection_time = 30
+    # Save the weight of the last query into the averages.
+    smoothing = 0.2
+
+    def __init__(self, nameservers):
+        # We initiate the lock which protect the servers.
+        self.lock = Lock()
+
+        # We initiate the state of the servers.
+        self.servers = {}
+
+        for nameserver in nameservers:
+            # We loop through the list of servers.
+
+            self.servers[str(nameserver)] = {
+                "latency": None,
+                "error_rate": 0.0,
+                "failures": 0,
+                "ejected_until": 0,
+            }
+
+        # We initiate the statistics of the servers.
+        self.statistics = {}
+        self.reset_statistics()
+
+    def reset_statistics(self):
+        """
+        Reset the statistics of the servers.
+        """
+
+        with self.lock:
+            self.statistics = {
+                x: {
+                    "queries": 0,
+                    "latency": 0.0,
+                    "timeouts": 0,
+                    "servfails": 0,
+                    "ejections": 0,
+                }
+                for x in self.servers
+            }
+
+    def choose(self, exclude=None):
+        """
+        Choose the server to send a query to.
+
+        :param list exclude: The servers we do not want.
+
+        :return: The chosen server or :code:`None` if there is none left.
+        :rtype: str|None
+        """
+
+        if not exclude:
+            exclude = []
+
+        with self.lock:
+            # We get the servers we are allowed to choose.
+            servers = [x for x in self.servers if x not in exclude]
+
+            if not servers:
+                return None
+
+            # We get the healthy ones.
+            healthy = [
+                x
+                for x in servers
+                if self.servers[x]["ejected_until"] <= PyFunceble.time()
+            ]
+
+            if not healthy:
+                # Every server is ejected.
+
+                # We return the one which comes back first.
+                return min(servers, key=lambda x: self.servers[x]["ejected_until"])
+
+            # We get the known latencies.
+            latencies = [
+                self.servers[x]["latency"]
+                for x in healthy
+                if self.servers[x]["latency"] is not None
+            ]
+
+            # We get the latency to give to the servers we do not know yet.
+            # Note: We give them the best one so that they get tried.
+            default_latency = min(latencies) if latencies else 0.05
+
+            # We get the weight of each server.
+            weights = []
+
+            for server in healthy:
+                # We loop through the healthy servers.
+
+                # We get its latency.
+                latency = self.servers[server]["latency"]
+
+                if latency is None:
+                    latency = default_latency
+
+                # The faster and the more reliable, the heavier.
+                weights.append(
+                    max(1.0 - self.servers[server]["error_rate"], 0.01)
+                    / max(latency, 0.001)
+                )
+
+        # We return a server according to the weights.
+        return choices(healthy, weights=weights)[0]
+
+    def report(self, server, latency, outcome):
+        """
+        Report the outcome of a query.
+
+        :param str server: The server the query was sent to.
+        :param float latency: The number of seconds we waited.
+        :param str outcome:
+            The outcome of the query.
+            Should be one of the following.
+
+                - :code:`ok`
+                - :code:`servfail`
+                - :code:`timeout`
+        """
+
+        with self.lock:
+            # We get the state and statistics of the server.
+            state = self.servers[server]
+            statistics = self.statistics[server]
+
+            statistics["queries"] += 1
+            statistics["latency"] += latency
+
+            # We update the average latency.
+            if state["latency"] is None:
+                state["latency"] = latency
+            else:
+                state["latency"] += self.smoothing * (latency - state["latency"])
+
+            # We update the average error rate.
+            state["error_rate"] += self.smoothing * (
+                float(outcome != "ok") - state["error_rate"]
+            )
+
+            if outcome == "ok":
+                # The server answered.
+
+                state["failures"] = 0
+                return
+
+            # The server failed.
+            statistics[outcome + "s"] += 1
+            state["failures"] += 1
+
+            if state["failures"] >= self.max_failures:
+                # The server keeps failing.
+
+                # We eject it for a while.
+                state["ejected_until"] = PyFunceble.time() + self.ejection_time
+                statistics["ejections"] += 1
@@ -0,0 +1,477 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will manage the extra rules.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import PyFunceble
+from PyFunceble.generate import Generate
+from PyFunceble.helpers import Regex
+from PyFunceble.http_code import HTTPBody
+
+
+class ExtraRules:  # pylint: disable=too-few-public-methods # pragma: no cover
+    """
+    Manage some extra rules.,
+
+    :param str subject: The subject we are working with.
+
+    :param str subject_type:
+        The type of the subject we are working with.
+        Should be one of the following.
+
+            - :code:`domain`
+            - :code:`url`
+
+    :param http_status_code:
+        The extracted status code or a callable which gives it.
+        The callable is only called when we need the status code.
+    :type http_status_code: str|int|callable
+    """
+
+    def __init__(self, subject, subject_type, http_status_code):
+        # We share the subject we are working with.
+        self.subject = subject
+        # We share the subject type.
+        self.subject_type = subject_type
+        # We share the status code.
+        self.__status_code = http_status_code
+
+        # We set the header that we will send when communicating with webservers.
+        self.headers = {"User-Agent": PyFunceble.CONFIGURATION["user_agent"]}
+
+        # We set a list of regex and methods to call if matched.
+        self.regexes_active_to_inactive_potentially_down = {
+            r"\.blogspot\.": self.__blogspot,
+            r"\.canalblog\.com$": self.__special_down,
+            r"\.doubleclick\.net$": self.__special_down,
+            r"\.liveadvert\.com$": self.__special_down,
+            r"\.skyrock\.com$": self.__special_down,
+            r"\.tumblr\.com$": self.__special_down,
+        }
+
+        # We set a list of regex and methods to call if matched.
+        self.regexes_active_to_inactive_potentially_up = {
+            r"\.blogspot\.": self.__blogspot,
+            r"\.wordpress\.com$": self.__wordpress_dot_com,
+        }
+
+    @property
+    def status_code(self):
+        """
+        Provide the status code.
+
+        :rtype: str|int
+        """
+
+        if callable(self.__status_code):
+            # We did not get the status code yet.
+
+            # We get it.
+            self.__status_code = self.__status_code()
+
+        return self.__status_code
+
+    @classmethod
+    def __special_down(cls):
+        """
+        Set what we return for the SPECIAL status de-escalation.
+
+        :return: :code:`(new status, new source)`
+        :rtype: tuple
+        """
+
+        return PyFunceble.STATUS["official"]["down"], "SPECIAL"
+
+    @classmethod
+    def __special_up(cls):
+        """
+        Set what we return for the SPECIAL status escalation.
+
+        :return: :code:`(new status, new source)`
+        :rtype: tuple
+        """
+
+        return PyFunceble.STATUS["official"]["up"], "SPECIAL"
+
+    @classmethod
+    def __http_status_code_up(cls):
+        """
+        Set what we return for the HTTP Code status escalation.
+
+        :return: :code:`(new status, new source)`
+        :rtype: tuple
+        """
+
+        return PyFunceble.STATUS["official"]["up"], "HTTP Code"
+
+    def __blogspot(self):
+        """
+        Handle the blogspot SPECIAL case.
+
+        :return:
+            :code:`(new status, new source)` or :code:`None` if there is any
+            change to apply.
+        :rtype: tuple|None
+        """
+
+        # We iniate a list of elements in the HTML which will tell us more about
+        # the status of the domain.
+        regex_blogger = ["create-blog.g?", "87065", "doesn&#8217;t&nbsp;exist"]
+
+        if self.subject_type in ["domain", "file_domain"]:
+            # The element we are testing is a domain.
+
+            # We construct the url to get.
+            url_to_get = "http://%s" % self.subject
+        elif self.subject_type in ["url", "file_url"]:
+            # The element we are testing is a URL.
+
+            # We construct the url to get.
+            url_to_get = self.subject
+        else:
+            raise ValueError("Given subject type not registered.")
+
+        if HTTPBody(url_to_get, regex_blogger, headers=self.headers).match():
+            # One of the elements is into the HTML of the home page.
+
+            # We update the status and source.
+            return self.__special_down()
+
+        # We return None, there is no changes.
+        return None
+
+    def __wordpress_dot_com(self):
+        """
+        Handle the wordpress.com SPECIAL case.
+
+        :return:
+            :code:`(new status, new source)` or :code:`None` if there is any
+            change to apply.
+        :rtype: tuple|None
+        """
+
+        # We initiate a variable which whill have to be into the HTML
+        # in order to be considered as inactive.
+        does_not_exist = "doesn&#8217;t&nbsp;exist"
+
+        if HTTPBody(
+            "http://{}:80".format(self.subject), [does_not_exist], headers=self.headers
+        ).match():
+            # The marker is into the page content.
+
+            # We return the new status and source.
+            return self.__special_down()
+
+        # We return None, there is no changes.
+        return None
+
+    def __handle_potentially_inactive(self, previous_state):
+        """
+        Handle the potentially inactive case.
+
+        :param str previous_state: The previously catched status.
+
+        :return:
+            :code:`(new status, new source)` or :code:`None` if there is any
+            change to apply.
+        :rtype: tuple|None
+        """
+
+        if (
+            PyFunceble.HTTP_CODE["active"]
+            and self.status_code in PyFunceble.HTTP_CODE["list"]["potentially_down"]
+        ):
+            # * The http status request is activated.
+            # and
+            # * The extracted http status code is in the list of
+            #   potentially down list.
+
+            # We generate the analytics files.
+            Generate(self.subject, self.subject_type, previous_state).analytic_file(
+                "potentially_down"
+            )
+
+            if not PyFunceble.CONFIGURATION["no_special"]:
+                # We are authorized to play with the SPEICIAL rules.
+
+                for regx in self.regexes_active_to_inactive_potentially_down:
+                    # We loop through the list of available regex.
+
+                    if Regex(
+                        data=self.subject, regex=regx, return_data=False, escape=False
+                    ).match():
+                        # The element we are currently testing match the
+                        # regex we are currently reading.
+
+                        # We get the output of the function associated
+                        # with the regex.
+                        output = self.regexes_active_to_inactive_potentially_down[
+                            regx
+                        ]()
+
+                        if output is not None:
+                            # The output is not None.
+
+                            # We return the new source and state.
+                            return output
+
+        # We return None, there is no changes.
+        return None
+
+    def __handle_potentially_up(self):
+        """
+        Handle the potentially up  case.
+
+        :return:
+            :code:`(new status, new source)` or :code:`None` if there is any
+            change to apply.
+        :rtype: tuple|None
+        """
+
+        if (
+            PyFunceble.HTTP_CODE["active"]
+            and self.status_code in PyFunceble.HTTP_CODE["list"]["potentially_up"]
+        ):
+            # * The http status code request is activated.
+            # and
+            # * The extracted http status code is into the list of potentially up codes.
+
+            if not PyFunceble.CONFIGURATION["no_special"]:
+                # We are authorized to play with the SPEICIAL rules.
+
+                for regx in self.regexes_active_to_inactive_potentially_up:
+                    # We loop through the list of available regex.
+
+                    if Regex(
+                        data=self.subject, regex=regx, return_data=False, escape=False
+                    ).match():
+                        # The element we are currently testing match the
+                        # regex we are currently reading.
+
+                        # We get the output of the function associated
+                        # with the regex.
+                        output = self.regexes_active_to_inactive_potentially_up[regx]()
+
+                        if output is not None:
+                            # The output is not None.
+
+                            # We return the new source and state.
+                            return output
+
+        # We return None, there is no changes.
+        return None
+
+    def __handle_http_code(self, previous_state):
+        """
+        Handle the HTTP Code status escalation.
+
+        :param str previous_state: The previously catched status.
+
+        :return:
+            :code:`(new status, new source)` or :code:`None` if there is any
+            change to apply.
+        :rtype: tuple|None
+        """
+
+        try:
+            if self.status_code in PyFunceble.HTTP_CODE["list"]["up"]:
+                # The extracted http code is in the list of up codes.
+
+                # We generate the analytics files.
+                Generate(self.subject, self.subject_type, previous_state).analytic_file(
+                    PyFunceble.STATUS["official"]["up"]
+                )
+
+                if previous_state.lower() not in PyFunceble.STATUS["list"]["up"]:
+                    # And we return the new status and source
+                    return self.__http_status_code_up()
+
+            if self.status_code in PyFunceble.HTTP_CODE["list"]["potentially_up"]:
+                # The extracted http status code is in the list of potentially up status.
+
+                # We generate the analytics files.
+                Generate(self.subject, self.subject_type, previous_state).analytic_file(
+                    "potentially_up"
+                )
+
+                if previous_state.lower() not in PyFunceble.STATUS["list"]["up"]:
+                    # And we return the new status and source
+                    return self.__http_status_code_up()
+
+            if (
+                previous_state.lower() not in PyFunceble.STATUS["list"]["down"]
+                or previous_state.lower() not in PyFunceble.STATUS["list"]["invalid"]
+            ) and self.status_code in PyFunceble.HTTP_CODE["list"]["potentially_down"]:
+                # The extracted http code is in the list of potentially down status code.
+
+                # We generate the analytics files.
+                Generate(self.subject, self.subject_type, previous_state).analytic_file(
+                    "potentially_down"
+                )
+        except KeyError:
+            pass
+
+        # We return None, there is no changes.
+        return None
+
+    def __handle_ipv4_range(self):
+        """
+        Handle the IP range status escalation.
+
+        :return:
+            :code:`(new status, new source)` or :code:`None` if there is any
+            change to apply.
+        :rtype: tuple|None
+        """
+
+        if (
+            not PyFunceble.CONFIGURATION["no_special"]
+            and PyFunceble.Check(self.subject).is_ipv4_range()
+        ):
+            # * We can run/check the special rule.
+            # and
+            # * The element we are currently testing is an IPv4 with range.
+
+            # We return the new status and source.
+            return self.__special_up()
+
+        # We return None, there is no changes.
+        return None
+
+    def handle(
+        self, previous_state, previous_source
+    ):  # pylint:disable= too-many-return-statements
+        """
+        Globally handle the case of the currently tested domain.
+        """
+
+        # We preset the new status and the source to None.
+        new_status = None
+        source = None
+
+        # We convert the given previous state to lower case.
+        previous_state_modified = previous_state.lower()
+
+        if previous_state_modified in PyFunceble.STATUS["list"]["up"]:
+            # The previous state is in the list of up status.
+
+            try:
+                # We try to get the new status and source from another handler.
+
+                new_status, source = self.__handle_potentially_inactive(previous_state)
+
+                return new_status, source
+            except TypeError:
+                pass
+
+            try:
+                # We try to get the new status and source from another handler.
+
+                new_status, source = self.__handle_potentially_up()
+                return new_status, source
+            except TypeError:
+                pass
+
+        if previous_state_modified in PyFunceble.STATUS["list"]["valid"]:
+            # The previous state is in the list of valid status.
+
+            # We return the given state and source, nothing changes.
+            return previous_state, previous_source
+
+        if previous_state_modified in PyFunceble.STATUS["list"]["down"]:
+            # The previous state is in the list of down status.
+
+            try:
+                # We try to get the new status and source from another handler.
+
+                new_status, source = self.__handle_ipv4_range()
+
+                return new_status, source
+            except TypeError:
+                pass
+
+            if PyFunceble.HTTP_CODE["active"]:
+                # The http status code request is activated.
+
+                try:
+                    # We try to get the new status and source from another handler.
+
+                    new_status, source = self.__handle_http_code(previous_state)
+
+                    return new_status, source
+                except TypeError:
+                    pass
+
+        if previous_state_modified in PyFunceble.STATUS["list"]["invalid"]:
+            # The previous state is in the list of invalid status.
+
+            if PyFunceble.HTTP_CODE["active"]:
+                # The http status code request is activated.
+
+                try:
+                    # We try to get the new status and source from another handler.
+
+                    new_status, source = self.__handle_http_code(previous_state)
+
+                    return new_status, source
+                except TypeError:
+                    pass
+
+        # We return the given state and source, nothing changes.
+        return previous_state, previous_source
@@ -0,0 +1,402 @@
+# pylint: disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+Provide the logic for a file test from the CLI with an event loop.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+from urllib.request import getproxies
+
+import PyFunceble
+from PyFunceble.file_core import FileCore
+from PyFunceble.generate import Generate
+from PyFunceble.http_code import (
+    HTTPCode,
+    HTTPHostCache,
+    HTTPRedirects,
+    HTTPSession,
+)
+from PyFunceble.http_prober import HTTPProber
+
+
+class FileAsyncCore(FileCore):  # pragma: no cover
+    """
+    Brain of PyFunceble for file testing with an event loop.
+
+    :param str file: The file we are testing.
+    :param str file_type:
+        The file type.
+        Should be one of the following.
+
+            - :code:`domain`
+
+            - :code:`url`
+
+    .. note::
+        The libraries we use to communicate with the network (DNS, WHOIS and HTTP)
+        are blocking. That's why the event loop hands the test of each subject
+        to a small pool of threads (see :meth:`get_maximal_threads`) and keeps
+        the bookkeeping (databases, counters, generated files, screen and
+        autosave) for itself.
+
+    .. note::
+        While testing URL, the HTTP status codes are got by
+        :class:`~PyFunceble.http_prober.HTTPProber` into the event loop
+        before the tests are handed to the pool of threads.
+    """
+
+    def __init__(self, file, file_type="domain"):
+        super(FileAsyncCore, self).__init__(file, file_type=file_type)
+
+        # We initiate the prober of the HTTP status codes.
+        # Note: It is created once we are into the event loop.
+        self.http_prober = None
+
+    @classmethod
+    def get_maximal_threads(cls):
+        """
+        Get the maximal number of threads to hand the tests to.
+
+        :rtype: int
+
+        .. note::
+            We follow the default of :code:`ThreadPoolExecutor`
+            (the number of CPU plus 4, up to 32) so that a high
+            :code:`concurrency` does not start thousands of threads.
+        """
+
+        return min(
+            PyFunceble.CONFIGURATION["concurrency"], 32, (cpu_count() or 1) + 4
+        )
+
+    def is_http_probing_allowed(self):
+        """
+        Check if we can get the HTTP status codes with
+        :class:`~PyFunceble.http_prober.HTTPProber`.
+
+        :rtype: bool
+        """
+
+        return (
+            self.file_type == "url"
+            and PyFunceble.HTTP_CODE["active"]
+            and not PyFunceble.CONFIGURATION["syntax"]
+            and not getproxies()
+        )
+
+    def __save_results(self, done):
+        """
+        Save the results of the given finished tests.
+
+        :param set done: A set of finished futures.
+        """
+
+        for future in done:
+            # We loop through the list of finished tests.
+
+            # We get the result of the test.
+            # Note: If an exception was raised into the thread, it is
+            # raised here.
+            result = future.result()
+
+            # We write what the test generated.
+            Generate.write_deferred(result.pop("outputs"))
+
+            # We save the result of the test.
+            self._save_result(result)
+
+            # We increase the number of tested subjects.
+            self.tested += 1
+
+        # We update the counters.
+        self.autocontinue.update_counters()
+
+    def __test_subject(self, subject):
+        """
+        Test the given subject from our pool of threads.
+
+        :param str subject: The subject to test.
+
+        :return:
+            The result of the test.
+            See :func:`~PyFunceble.file_core.FileCore._test_subject`.
+            What the test generated (files and screen) is given under
+            the :code:`outputs` index so that it is written by the event loop.
+        :rtype: dict
+        """
+
+        # We defer what the test generates.
+        Generate.start_deferring()
+
+        try:
+            # We test the subject.
+            result = self._test_subject(subject)
+        finally:
+            # We get what the test generated.
+            outputs = Generate.stop_deferring()
+
+        result["outputs"] = outputs
+
+        return result
+
+    async def __probe_and_test(self, subject, executor):
+        """
+        Get the HTTP status code of the given subject, then test it.
+
+        :param str subject: The subject to test.
+        :param concurrent.futures.ThreadPoolExecutor executor:
+            The pool of threads to run the test into.
+
+        :return:
+            The result of the test.
+            See :func:`~PyFunceble.file_core.FileCore._test_subject`.
+        :rtype: dict
+        """
+
+        # We get the HTTP status code and give it to the test.
+        HTTPCode.probed[subject] = await self.http_prober.probe(subject)
+
+        try:
+            # We test the subject.
+            return await asyncio.get_event_loop().run_in_executor(
+                executor, self.__test_subject, subject
+            )
+        finally:
+            # We forget the HTTP status code, in case it was not read.
+            HTTPCode.probed.pop(subject, None)
+
+    async def __run_async_test(self, to_test, executor):
+        """
+        Test the given list to test with our event loop.
+
+        :param itertools.chain to_test: A chain representing a list of subject to test.
+        :param concurrent.futures.ThreadPoolExecutor executor:
+            The pool of threads to run the tests into.
+        """
+
+        # We get the current event loop.
+        loop = asyncio.get_event_loop()
+
+        # We initiate the set of tests which are in flight.
+        pending = set()
+
+        # We save the time we started.
+        start_time = PyFunceble.time()
+
+        for line in to_test:
+            # We loop through the list of subject to test.
+
+            if self.autosave.is_time_exceed():
+                # The operation end time was exceeded.
+
+                # We stop dispatching.
+                break
+
+            if isinstance(line, tuple):
+                # The line is a tuple.
+
+                # We spread the index from the line.
+                index, line = line
+
+                # An index was given, we remove the index and line from
+                # the mining database.
+                self.mining.remove(index, line)
+
+            # We get the subject to test.
+            subject = self._get_subject(line)
+
+            if not subject:
+                # There is nothing to test.
+
+                # We continue the loop.
+                continue
+
+            if len(pending) >= PyFunceble.CONFIGURATION["concurrency"]:
+                # We reached the maximal number of tests in flight.
+
+                # We wait for at least one of them to finish.
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                # And we save what was tested.
+                self.__save_results(done)
+
+            if self.http_prober:
+                # We get the HTTP status codes into our event loop.
+
+                # We start the request and test of the subject.
+                pending.add(
+                    asyncio.ensure_future(self.__probe_and_test(subject, executor))
+                )
+            else:
+                # We start the test of the subject.
+                pending.add(
+                    loop.run_in_executor(executor, self.__test_subject, subject)
+                )
+
+        if pending:
+            # Some tests are still in flight.
+
+            # We wait for them to finish.
+            done, _ = await asyncio.wait(pending)
+
+            # And we save what was tested.
+            self.__save_results(done)
+
+        # We update the time we spent testing.
+        self.testing_time += PyFunceble.time() - start_time
+
+        # We sort the content of all files we generated.
+        self._sort_generated_files()
+
+        if self.autosave.is_time_exceed():
+            # The operation end time was exceeded.
+
+            # We flush the databases.
+            self._flush_databases()
+
+            # We process the saving of everything.
+            self.autosave.process()
+
+    async def __run(self, file):
+        """
+        Test the given file, the mined subjects and the complements.
+
+        :param file: The file object to read.
+        """
+
+        with ThreadPoolExecutor(max_workers=self.get_maximal_threads()) as executor:
+            # We initiate our pool of threads.
+
+            if self.is_http_probing_allowed():
+                # We can get the HTTP status codes into our event loop.
+
+                # We initiate our prober.
+                self.http_prober = HTTPProber()
+
+            # We process the test/save of the original list to test.
+            await self.__run_async_test(
+                self._get_list_to_of_subjects_to_test_from_file(file), executor
+            )
+
+            # We process the test/save of the mined data to test.
+            await self.__run_async_test(self.mining.list_of_mined(), executor)
+
+            # We get the list of complements to test.
+            complements = self.get_complements()
+
+            if complements:
+                # We process the test/save of the complements.
+                await self.__run_async_test(complements, executor)
+
+                # We inform all subsystem that we are not testing for complements anymore.
+                self.complements_test_started = False
+
+    def read_and_test_file_content(self):  # pragma: no cover
+        """
+        Read a file block by block and test its content.
+        """
+
+        # We print the CLI header.
+        PyFunceble.CLICore.print_header()
+
+        with open(self.file, "r", encoding="utf-8") as file:
+            # We open the file we have to test.
+
+            # We initiate our event loop.
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+
+            try:
+                # We test everything.
+                loop.run_until_complete(self.__run(file))
+            finally:
+                # We close our event loop.
+                loop.close()
+
+        # We print the number of subjects we tested per second.
+        self.print_throughput(
+            "with a concurrency of {0}".format(PyFunceble.CONFIGURATION["concurrency"])
+        )
+
+        # We generate the JSON formatted files if needed.
+        self.generate_json_format()
+        # We clean the autocontinue subsystem, we finished
+        # the test.
+        self.autocontinue.clean()
+        # We flush the databases.
+        self._flush_databases()
+        # We process the autosaving if necessary.
+        self.autosave.process(test_completed=True)
+        # We stop consulting the DNS database.
+        PyFunceble.DNSLookup.cache.database = None
+        # We close the pooled HTTP connections.
+        HTTPSession.close()
+        # We forget the unreachable hosts.
+        HTTPHostCache.clear()
+        # We forget the redirections.
+        HTTPRedirects.clear()
+        # We close the database connection
+        if self.sqlite_db.authorized:
+            self.sqlite_db.close()
+        if self.mysql_db.authorized:
+            self.mysql_db.close()
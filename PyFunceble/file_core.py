@@ -60,8 +60,7 @@ License:
 """
 # pylint: enable=line-too-long
 
-from itertools import chain
-from multiprocessing import Pool
+from collections import OrderedDict
 
 from domain2idna import get as domain2idna
 
@@ -69,8 +68,10 @@ import PyFunceble
 from PyFunceble.adblock import AdBlock
 from PyFunceble.auto_continue import AutoContinue
 from PyFunceble.auto_save import AutoSave
+from PyFunceble.dns_db import DNSDB
 from PyFunceble.generate import Generate
-from PyFunceble.helpers import Download, List, Regex
+from PyFunceble.helpers import Dict, Download, File, List, Regex
+from PyFunceble.http_code import HTTPHostCache, HTTPRedirects, HTTPSession
 from PyFunceble.inactive_db import InactiveDB
 from PyFunceble.mining import Mining
 from PyFunceble.mysql import MySQL
@@ -123,6 +124,12 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
         )
         # We get/initiate the whois database.
         self.whois_db = WhoisDB(sqlite_db=self.sqlite_db, mysql_db=self.mysql_db)
+        # We get/initiate the DNS database.
+        self.dns_db = DNSDB(sqlite_db=self.sqlite_db, mysql_db=self.mysql_db)
+
+        if self.dns_db.authorized:
+            # We let the DNS lookups consult it before the network.
+            PyFunceble.DNSLookup.cache.database = self.dns_db
         # We get/initiate the mining subsystem.
         self.mining = Mining(
             self.file, sqlite_db=self.sqlite_db, mysql_db=self.mysql_db
@@ -139,6 +146,11 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
         # we start testing for complements.
         self.complements_test_started = False
 
+        # We initiate the number of tested subjects.
+        self.tested = 0
+        # We initiate the number of seconds we spent testing.
+        self.testing_time = 0
+
         # We download the file if it is a list.
         self.download_link()
 
@@ -226,11 +238,7 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
                 # The simple mode is activated.
 
                 # We print the domain and the status.
-                print(
-                    "{0} {1}".format(
-                        self.get_simple_coloration(status) + subject, status
-                    )
-                )
+                self.print_simple(subject, status)
 
             if self.complements_test_started:
                 # We started to test the complements.
@@ -274,11 +282,7 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
                 # The simple mode is activated.
 
                 # We print the domain and the status.
-                print(
-                    "{0} {1}".format(
-                        self.get_simple_coloration(status) + subject, status
-                    )
-                )
+                self.print_simple(subject, status)
 
             if self.complements_test_started:
                 # We started to test the complements.
@@ -292,6 +296,26 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
         # We return None, there is nothing to test.
         return None
 
+    @classmethod
+    def print_simple(cls, subject, status):
+        """
+        Print the given subject and status while the simple mode is activated.
+
+        :param str subject: The tested subject.
+        :param str status: The status of the subject.
+        """
+
+        # We construct what we print.
+        to_print = "{0} {1}".format(
+            cls.get_simple_coloration(status) + subject, status
+        )
+
+        if not Generate.defer(print, to_print):
+            # The outputs of the current thread are not deferred.
+
+            # We print the subject and the status.
+            print(to_print)
+
     @classmethod
     def _format_line(cls, line):
         """
@@ -356,7 +380,7 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
         # We return an empty string as we do not want to work with commented line.
         return ""
 
-    def __process_test(self, subject):  # pragma: no cover
+    def _process_test(self, subject):  # pragma: no cover
         """
         Given a subject, we perform its test.
 
@@ -411,29 +435,15 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
 
         return complements
 
-    def _test_line(
-        self, line, manager_data=None
-    ):  # pylint: disable=too-many-branches  # pragma: no cover
+    def _get_subject(self, line):
         """
-        Given a line, we test it.
+        Given a line, we get the subject to test.
 
         :param str line: A line to work with.
-        :param multiprocessing.Manager.list manager_data: A Server process.
-        """
 
-        if PyFunceble.CONFIGURATION["db_type"] == "json" and manager_data is not None:
-            autocontinue = AutoContinue(self.file, parent_process=False)
-            inactive_db = InactiveDB(self.file)
-            mining = Mining(self.file)
-        else:
-            # We use the previously initiated autocontinue instance.
-            autocontinue = self.autocontinue
-
-            # We use the previously initiated inactive database instance.
-            inactive_db = self.inactive_db
-
-            # We use the previously initiated mining instance.
-            mining = self.mining
+        :return: The subject to test or :code:`None` if there is nothing to test.
+        :rtype: str|None
+        """
 
         # We remove cariage from the given line.
         line = line.strip()
@@ -466,37 +476,81 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
             # We return None, there is nothing to test.
             return None
 
-        if PyFunceble.CONFIGURATION["filter"]:
-            # We have to filter.
+        if PyFunceble.CONFIGURATION["filter"] and not Regex(
+            subject, PyFunceble.CONFIGURATION["filter"], return_data=False
+        ).match():
+            # * We have to filter.
+            # and
+            # * The line does not match the given filter.
+
+            # We return None, there is nothing to test.
+            return None
+
+        # We return the subject to test.
+        return subject
+
+    def _test_subject(self, subject):  # pragma: no cover
+        """
+        Given a subject, we test it.
 
-            if Regex(
-                subject, PyFunceble.CONFIGURATION["filter"], return_data=False
-            ).match():
-                # The line match the given filter.
+        :param str subject: The subject to test.
 
-                # We get the status of the current line.
-                status = self.__process_test(subject)
-            else:
-                # The line does not match the given filter.
+        :return:
+            The result of the test.
+
+            The returned format is the following:
+
+                ::
+
+                    {
+                        "subject": subject,
+                        "status": status,
+                        "mined": [mined, mined]
+                    }
+        :rtype: dict
 
-                # We return None.
-                return None
+        .. note::
+            None of our databases is updated here, the returned result
+            have to be given to :func:`~PyFunceble.file_core.FileCore._save_result`.
+        """
+
+        # We get the status of the current subject.
+        status = self._process_test(subject)
+
+        if status.lower() in self.list_of_up_statuses:
+            # The status is in the list of UP status.
+
+            # We mine if necessary.
+            mined = self.mining.get_mined(subject, self.file_type)
         else:
-            # We do not have to filter.
+            # The status is not in the list of UP status.
 
-            # We get the status of the current line.
-            status = self.__process_test(subject)
+            # There is nothing to mine.
+            mined = []
+
+        return {"subject": subject, "status": status, "mined": mined}
+
+    def _save_result(self, result):  # pragma: no cover
+        """
+        Save the given test result into our databases.
+
+        :param dict result:
+            A result from
+            :func:`~PyFunceble.file_core.FileCore._test_subject`.
+        """
+
+        subject, status = result["subject"], result["status"]
 
         # We add the line into the auto continue database.
-        autocontinue.add(subject, status)
+        self.autocontinue.add(subject, status)
 
         if status.lower() in self.list_of_up_statuses:
             # The status is in the list of UP status.
 
-            # We mine if necessary.
-            mining.mine(subject, self.file_type)
+            # We save what we mined.
+            self.mining.add(subject, result["mined"])
 
-            if subject in inactive_db:
+            if subject in self.inactive_db:
                 # The subject is in the inactive database.
 
                 # We generate the suspicous file.
@@ -506,98 +560,334 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
 
                 # And we remove the current subject from
                 # the inactive database.
-                inactive_db.remove(subject)
+                self.inactive_db.remove(subject)
         else:
             # The status is not in the list of UP status.
 
             # We add the current subject into the
             # inactive database.
-            inactive_db.add(subject, status)
+            self.inactive_db.add(subject, status)
 
-        if (
-            self.complements_test_started
-            and PyFunceble.CONFIGURATION["db_type"] == "json"
-        ):
-            # We started the test of the complements.
+    def _test_line(self, line):  # pragma: no cover
+        """
+        Given a line, we test it.
+
+        :param str line: A line to work with.
+        """
 
-            if "complements" in autocontinue.database:
-                # The complement index is present.
+        # We get the subject to test.
+        subject = self._get_subject(line)
 
-                while subject in autocontinue.database["complements"]:
-                    # We loop untill the line is not present into the
-                    # database.
+        if not subject:
+            # There is nothing to test.
 
-                    # We remove the currently tested element.
-                    autocontinue.database["complements"].remove(subject)
+            # We return None.
+            return None
 
-                    # We save the current state.
-                    autocontinue.save()
+        # We test the subject and save its result.
+        self._save_result(self._test_subject(subject))
 
-        if manager_data is None:
-            # We are not in a multiprocess environment.
+        # We update the counters
+        self.autocontinue.update_counters()
 
-            # We update the counters
-            autocontinue.update_counters()
+        if self.autosave.is_time_exceed():
+            # The operation end time was exceeded.
 
-            # We process the autosaving if it is necessary.
-            self.autosave.process(test_completed=False)
-        elif PyFunceble.CONFIGURATION["db_type"] == "json":
-            # We are in a multiprocess environment.
+            # We flush the databases before the autosaving.
+            self._flush_databases()
 
-            # We save everything we initiated into the server process
-            manager_data.append(
-                {
-                    "autocontinue": autocontinue.database,
-                    "inactive_db": inactive_db.database,
-                    "mining": mining.database,
-                }
-            )
+        # We process the autosaving if it is necessary.
+        self.autosave.process(test_completed=False)
 
         # We return None.
         return None
 
+    def _flush_databases(self):
+        """
+        Write everything our databases keep in memory or in
+        an open transaction.
+        """
+
+        # We save the inactive database.
+        self.inactive_db.save()
+        # We save the DNS database.
+        self.dns_db.save()
+        # We save the auto-continue database.
+        # Note: It compacts its journal.
+        self.autocontinue.save()
+
+        if self.sqlite_db.authorized:
+            # We are working with the SQLite database.
+
+            # We commit the current transaction.
+            self.sqlite_db.commit()
+
+    def print_throughput(self, label):
+        """
+        Print the number of subjects tested per second.
+
+        :param str label:
+            The description of how we tested.
+            (e.g. :code:`with 25 processes`)
+        """
+
+        if not PyFunceble.CONFIGURATION["quiet"] and self.testing_time:
+            # * The quiet mode is not activated.
+            # and
+            # * We tested something.
+
+            print(
+                PyFunceble.Fore.MAGENTA
+                + PyFunceble.Style.BRIGHT
+                + "\n{0} subjects tested {1} ({2:.2f} subjects/sec).".format(
+                    self.tested, label, self.tested / self.testing_time
+                )
+            )
+
+    @classmethod
+    def _sort_generated_files(cls):  # pragma: no cover
+        """
+        Sort the content of all files we generated.
+        """
+
+        for root, _, files in PyFunceble.walk(
+            PyFunceble.OUTPUT_DIRECTORY + PyFunceble.OUTPUTS["parent_directory"]
+        ):
+            # We loop through the list of directories of the output directory.
+
+            for file in files:
+                # We loop through the list of file of the
+                # currently read directory.
+
+                if file.endswith(".json"):
+                    # The currently read filename ends
+                    # with .json.
+
+                    # We continue the loop.
+                    continue
+
+                if file in [".keep", ".gitignore"]:
+                    # The currently read filename is
+                    # into a list of filename that are not relevant
+                    # for us.
+
+                    # We continue the loop.
+                    continue
+
+                # We create an instance of our File().
+                file_instance = File(
+                    "{0}{1}{2}".format(root, PyFunceble.directory_separator, file)
+                )
+                # We get the content of the current file.
+                file_content = file_instance.read().splitlines()
+
+                if not PyFunceble.CONFIGURATION["hierarchical_sorting"]:
+                    # We do not have to sort hierarchicaly.
+
+                    # We sort the lines of the file standarly.
+                    formatted = List(file_content[3:]).custom_format(Sort.standard)
+                else:
+                    # We do have to sort hierarchicaly.
+
+                    # We sort the lines of the file hierarchicaly.
+                    formatted = List(file_content[3:]).custom_format(Sort.hierarchical)
+
+                # We finally put the formatted data in place.
+                file_instance.write(
+                    "\n".join(file_content[:3] + formatted), overwrite=True
+                )
+
+    def generate_json_format(self):  # pragma: no cover
+        """
+        Generate the JSON formatted file.
+
+        .. note::
+            This is needed because otherwise we might get a format issue.
+        """
+
+        if PyFunceble.CONFIGURATION["generate_json"]:
+            # We have to generate the JSON format.
+
+            for status, data in self.autocontinue.database[self.file].items():
+                # We loop through the autocontinue data.
+
+                # We save the data at their final location.
+                Dict(data).to_json(
+                    PyFunceble.OUTPUT_DIRECTORY
+                    + PyFunceble.OUTPUTS["parent_directory"]
+                    + PyFunceble.OUTPUTS["json"]["directory"]
+                    + status
+                    + PyFunceble.OUTPUTS["json"]["filename"]
+                )
+
+    def __read_subjects(self, file_object):
+        """
+        Read the given file object and yield the subjects it provides.
+
+        :param file_object: The file object to read.
+        """
+
+        if PyFunceble.CONFIGURATION["adblock"]:
+            # We have to decode the adblock format.
+
+            # We yield the decoded subjects.
+            # Note: The adblock decoding needs the whole file.
+            for subject in AdBlock(file_object).decode():
+                yield subject
+        else:
+            for line in file_object:
+                # We loop through the lines of the file.
+
+                # We get the subject of the currently read line.
+                subject = self._get_subject(line)
+
+                if subject:
+                    # There is something to test.
+
+                    yield subject
+
+    def __get_subjects_to_test(self, file_object, to_skip):
+        """
+        Read the given file object and yield the subjects we have to test.
+
+        :param file_object: The file object to read.
+        :param set to_skip: The subjects we do not have to test.
+
+        .. note::
+            In order to keep the memory usage bounded, we only remember the last
+            :code:`input_buffer_size` subjects for the deduplication and we sort
+            (if needed) by block of :code:`input_buffer_size` subjects.
+        """
+
+        # We get the maximal number of subjects to keep in memory.
+        buffer_size = max(PyFunceble.CONFIGURATION["input_buffer_size"], 1)
+
+        # We check if we have to sort the subjects.
+        # Note: While testing with multiple processes or asynchronously, the
+        # order is not kept so we do not sort.
+        sort_input = (
+            PyFunceble.CONFIGURATION["sort_input"]
+            and not PyFunceble.CONFIGURATION["multiprocess"]
+            and not PyFunceble.CONFIGURATION["asynchronous"]
+        )
+
+        # We initiate the last seen subjects.
+        seen = OrderedDict()
+        # We initiate the block of subjects to sort.
+        block = []
+
+        for subject in self.__read_subjects(file_object):
+            # We loop through the subjects of the file.
+
+            if subject in seen:
+                # The subject was recently seen.
+
+                # We continue the loop.
+                continue
+
+            # We remember the subject.
+            seen[subject] = None
+
+            if len(seen) > buffer_size:
+                # We remember too many subjects.
+
+                # We forget the oldest one.
+                seen.popitem(last=False)
+
+            if subject in to_skip:
+                # The subject does not have to be tested.
+
+                # We continue the loop.
+                continue
+
+            if not sort_input:
+                # We do not have to sort.
+
+                yield subject
+                continue
+
+            # We append the subject to the block to sort.
+            block.append(subject)
+
+            if len(block) >= buffer_size:
+                # The block is full.
+
+                # We yield its sorted content.
+                for element in self.__sort_subjects(block):
+                    yield element
+
+                # And we start a new block.
+                block = []
+
+        for element in self.__sort_subjects(block):
+            # We loop through the sorted remaining subjects.
+
+            yield element
+
+    @classmethod
+    def __sort_subjects(cls, subjects):
+        """
+        Sort the given list of subjects.
+
+        :param list subjects: The subjects to sort.
+        """
+
+        if not PyFunceble.CONFIGURATION["hierarchical_sorting"]:
+            # We do not have to sort hierarchicaly.
+
+            # We sort the subjects standarly.
+            return List(subjects).custom_format(Sort.standard)
+
+        # We sort the subjects hierarchicaly.
+        return List(subjects).custom_format(Sort.hierarchical)
+
     def _get_list_to_of_subjects_to_test_from_file(
         self, file_object
     ):  # pragma: no cover
         """
-        Give a file object, we construct/get the list of subject to test.
+        Give a file object, we yield the subject to test.
+
+        :param file_object: The file object to read.
         """
 
         to_retest_inactive_db = self.inactive_db.get_to_retest()
 
-        if PyFunceble.CONFIGURATION["multiprocess"]:
-            with Pool(PyFunceble.CONFIGURATION["maximal_processes"]) as pool:
-                if not PyFunceble.CONFIGURATION["adblock"]:
-                    formatted_subjects = set(pool.map(self._format_line, file_object))
-                else:
-                    formatted_subjects = {x for x in AdBlock(file_object).decode()}
-        else:
-            if not PyFunceble.CONFIGURATION["adblock"]:
-                formatted_subjects = {self._format_line(x) for x in file_object}
-            else:
-                formatted_subjects = {x for x in AdBlock(file_object).decode()}
-
-        subjects_to_test = (
-            formatted_subjects
-            - self.autocontinue.get_already_tested()
-            - self.inactive_db.get_already_tested()
-            - to_retest_inactive_db
+        # We get the subjects we do not have to test.
+        to_skip = (
+            self.autocontinue.get_already_tested()
+            | self.inactive_db.get_already_tested()
+            | to_retest_inactive_db
         )
 
-        if not subjects_to_test:
-            subjects_to_test = list(formatted_subjects)
-        else:
-            subjects_to_test = list(subjects_to_test)
+        # We initiate a variable which will tell us if
+        # we found something to test.
+        found = False
 
-        if not PyFunceble.CONFIGURATION["multiprocess"]:
-            if not PyFunceble.CONFIGURATION["hierarchical_sorting"]:
-                subjects_to_test = List(subjects_to_test).custom_format(Sort.standard)
-            else:
-                subjects_to_test = List(subjects_to_test).custom_format(
-                    Sort.hierarchical
-                )
+        for subject in self.__get_subjects_to_test(file_object, to_skip):
+            # We loop through the subjects to test.
+
+            found = True
+
+            yield subject
+
+        if not found and to_skip - to_retest_inactive_db:
+            # * We did not find anything to test.
+            # and
+            # * Some subjects were skipped because they were already tested.
+
+            # We read the file again.
+            file_object.seek(0)
+
+            # And we test everything (but the subjects to retest).
+            for subject in self.__get_subjects_to_test(
+                file_object, to_retest_inactive_db
+            ):
+                yield subject
+
+        for subject in to_retest_inactive_db:
+            # We loop through the subjects to retest.
 
-        return chain(subjects_to_test, to_retest_inactive_db)
+            yield subject
 
     def read_and_test_file_content(self):  # pragma: no cover
         """
@@ -641,10 +931,20 @@ class FileCore:  # pylint: disable=too-many-instance-attributes
         # We clean the autocontinue subsystem, we finished
         # the test.
         self.autocontinue.clean()
+        # We flush the databases.
+        self._flush_databases()
         # We process the autosaving if necessary.
         self.autosave.process(test_completed=True)
+        # We stop consulting the DNS database.
+        PyFunceble.DNSLookup.cache.database = None
+        # We close the pooled HTTP connections.
+        HTTPSession.close()
+        # We forget the unreachable hosts.
+        HTTPHostCache.clear()
+        # We forget the redirections.
+        HTTPRedirects.clear()
         # We close the database connection
         if self.sqlite_db.authorized:
-            self.sqlite_db.connection.close()
+            self.sqlite_db.close()
         if self.mysql_db.authorized:
-            self.mysql_db.get_connection().close()
+            self.mysql_db.close()
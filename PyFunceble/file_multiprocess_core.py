@@ -60,63 +60,82 @@ License:
 """
 # pylint: enable=line-too-long
 
-from itertools import chain
-from multiprocessing import Manager, Pipe, Process, active_children
+from itertools import chain, islice
+from multiprocessing import Process, Queue
+from queue import Empty
 from traceback import format_exc
 
 import PyFunceble
+from PyFunceble.db_writer import DBWriter
 from PyFunceble.file_core import FileCore
-from PyFunceble.helpers import Dict, File, List
-from PyFunceble.sort import Sort
+from PyFunceble.http_code import HTTPHostCache, HTTPRedirects, HTTPSession
 
 
 class OurProcessWrapper(Process):  # pragma: no cover
     """
     Wrapper of Process.
-    The object of this class is just to overwrite :code:`Process.run()`
-    in order to catch exceptions.
+    The object of this class is a long-lived worker which pulls chunks
+    of subjects from a queue until it receives the stop signal (:code:`None`).
+
+    :param multiprocessing.Queue tasks: The queue to pull the chunks from.
+    :param multiprocessing.Queue results:
+        The queue to send the results of each chunk through.
 
     .. note::
         This class takes the same arguments as :code:`Process`.
+        The given :code:`target` is called once per subject with the subject
+        as first argument followed by the given :code:`args`.
+        Its returned value (if not :code:`None`) is sent to the parent process.
     """
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, tasks, results, *args, **kwargs):
         super(OurProcessWrapper, self).__init__(*args, **kwargs)
 
-        self.conn1, self.conn2 = Pipe()
-        self._exception_receiver = None
+        self.tasks = tasks
+        self.results = results
 
     def run(self):
         """
         Overwrites :code:`Process.run()`.
         """
 
-        try:
-            # We run a normal process.
-            Process.run(self)
+        while True:
+            # We get the next chunk to test.
+            chunk = self.tasks.get()
 
-            # We send None as message as there was no exception.
-            self.conn2.send(None)
-        except Exception as exception:  # pylint: disable= broad-except
-            # We get the traceback.
-            traceback = format_exc()
+            if chunk is None:
+                # We got the stop signal.
 
-            # We send the exception and its traceback to the pipe.
-            self.conn2.send((exception, traceback))
+                # We break the loop.
+                break
 
-    @property
-    def exception(self):
-        """
-        Provide a way to check if an exception was send.
-        """
+            # We initiate the list of results of the current chunk.
+            records = []
 
-        if self.conn1.poll():
-            # There is something to read.
+            try:
+                for subject in chunk:
+                    # We loop through the subjects of the chunk.
 
-            # We get and save the exception.
-            self._exception_receiver = self.conn1.recv()
+                    # We test the subject.
+                    record = self._target(subject, *self._args, **self._kwargs)
 
-        return self._exception_receiver
+                    if record is not None:
+                        # Something was tested.
+
+                        # We keep its result.
+                        records.append(record)
+            except BaseException:  # pylint: disable= broad-except
+                # We send what was tested along with the traceback
+                # to the parent process.
+                # Note: We also catch SystemExit and KeyboardInterrupt
+                # so that the parent process is always informed.
+                self.results.put((records, format_exc()))
+
+                # And we stop working.
+                break
+
+            # We send the results of the chunk to the parent process.
+            self.results.put((records, None))
 
 
 class FileMultiprocessCore(FileCore):  # pragma: no cover
@@ -133,282 +152,315 @@ class FileMultiprocessCore(FileCore):  # pragma: no cover
             - :code:`url`
     """
 
-    def __init__(self, file, file_type="domain"):
-        super(FileMultiprocessCore, self).__init__(file, file_type=file_type)
+    # Save the number of subjects a process pulls at once.
+    chunk_size = 5
 
-    @classmethod
-    def __sort_generated_files(cls):
+    def __get_subjects(self, to_test):
         """
-        Sort the content of all files we generated.
+        Yield the subjects to test from the given chain.
+
+        :param itertools.chain to_test: A chain representing a list of subject to test.
         """
 
-        for root, _, files in PyFunceble.walk(
-            PyFunceble.OUTPUT_DIRECTORY + PyFunceble.OUTPUTS["parent_directory"]
-        ):
-            # We loop through the list of directories of the output directory.
+        for subject in to_test:
+            # We loop through the list of subject to test.
+
+            if isinstance(subject, tuple):
+                # The subject is a tuple.
+
+                # We spread the index from the subject.
+                index, subject = subject
+
+                # An index was given, we remove the index and subject from
+                # the mining database.
+                self.mining.remove(index, subject)
 
-            for file in files:
-                # We loop through the list of file of the
-                # currently read directory.
+            yield subject
 
-                if file.endswith(".json"):
-                    # The currently read filename ends
-                    # with .json.
+    def __test_line(self, line):
+        """
+        Given a line, we test it without saving anything.
+
+        :param str line: A line to work with.
+
+        :return:
+            The result of the test or :code:`None` if there is nothing to test.
+        :rtype: dict|None
 
-                    # We continue the loop.
-                    continue
+        .. note::
+            This method is called from our processes. The returned result
+            is saved by the parent process.
+        """
 
-                if file in [".keep", ".gitignore"]:
-                    # The currently read filename is
-                    # into a list of filename that are not relevant
-                    # for us.
+        # We get the subject to test.
+        subject = self._get_subject(line)
 
-                    # We continue the loop.
-                    continue
+        if subject:
+            # There is something to test.
 
-                # We create an instance of our File().
-                file_instance = File(
-                    "{0}{1}{2}".format(root, PyFunceble.directory_separator, file)
-                )
-                # We get the content of the current file.
-                file_content = file_instance.read().splitlines()
+            # We reset the statistics of the DNS cache and servers.
+            # Note: The ones we inherited from the parent process are already counted.
+            PyFunceble.DNSLookup.cache.pop_statistics()
+            PyFunceble.DNSLookup.get_server_statistics(reset=True)
+            # We keep the new DNS answers for the parent process.
+            # Note: Our copy of the DNS database is never saved.
+            PyFunceble.DNSLookup.cache.pop_answers()
 
-                if not PyFunceble.CONFIGURATION["hierarchical_sorting"]:
-                    # We do not have to sort hierarchicaly.
+            # We test the subject.
+            record = self._test_subject(subject)
 
-                    # We sort the lines of the file standarly.
-                    formatted = List(file_content[3:]).custom_format(Sort.standard)
-                else:
-                    # We do have to sort hierarchicaly.
+            # We send the statistics of the test to the parent process.
+            record["dns_statistics"] = PyFunceble.DNSLookup.cache.pop_statistics()
+            record["dns_server_statistics"] = PyFunceble.DNSLookup.get_server_statistics(
+                reset=True
+            )
+            # We send the new DNS answers to the parent process.
+            record["dns_answers"] = PyFunceble.DNSLookup.cache.pop_answers()
 
-                    # We sort the lines of the file hierarchicaly.
-                    formatted = List(file_content[3:]).custom_format(Sort.hierarchical)
+            # We return the result of its test.
+            return record
 
-                # We finally put the formatted data in place.
-                file_instance.write(
-                    "\n".join(file_content[:3] + formatted), overwrite=True
-                )
+        # There is nothing to test.
+        return None
 
-    def __process_exception(self, processes, manager_data):
+    def __save_results(self, records):
         """
-        Check if an exception is present into the given pool of processes.
+        Save the given results of our processes.
+
+        :param list records:
+            A list of results from
+            :func:`~PyFunceble.file_core.FileCore._test_subject`.
+        """
+
+        for record in records:
+            # We loop through the list of results.
+
+            # We add the statistics of the DNS cache and servers of the process to ours.
+            PyFunceble.DNSLookup.cache.merge_statistics(record.pop("dns_statistics"))
+            PyFunceble.DNSLookup.merge_server_statistics(
+                record.pop("dns_server_statistics")
+            )
+            # We cache and save the new DNS answers of the process.
+            PyFunceble.DNSLookup.cache.merge_answers(record.pop("dns_answers"))
+
+            # And we save the currently read one.
+            self._save_result(record)
+
+        # We increase the number of tested subjects.
+        self.tested += len(records)
+
+        # We update the counters.
+        self.autocontinue.update_counters()
+
+    @classmethod
+    def get_results(cls, processes, results, timeout=1):
+        """
+        Wait for a process to send the results of a chunk.
 
         :param list processes: A list of processes.
+        :param multiprocessing.Queue results:
+            The queue the processes send their results through.
+        :param int timeout:
+            The number of seconds to wait before checking that our processes
+            are still alive.
+
+        :return:
+            The results of the chunk and the traceback (if any).
+            If a process died without telling us, we return an empty list
+            of results and a message instead of the traceback.
+        :rtype: tuple
         """
 
-        exception_present = False
+        while True:
+            try:
+                # We wait for a process to finish a chunk.
+                return results.get(timeout=timeout)
+            except Empty:
+                # No process finished a chunk in time.
+
+                for process in processes:
+                    # We loop through the list of processes.
+
+                    if not process.is_alive():
+                        # The currently read process died while it was
+                        # supposed to test something (killed, crashed, ...).
+
+                        # We return a message instead of the traceback.
+                        return (
+                            [],
+                            "{0} died unexpectedly (exit code: {1}).".format(
+                                process.name, process.exitcode
+                            ),
+                        )
+
+    def __stop_processes(self, processes, tasks, terminate=False):
+        """
+        Stop the given pool of processes.
+
+        :param list processes: A list of processes.
+        :param multiprocessing.Queue tasks: The queue the processes are pulling from.
+        :param bool terminate: Tell us if we have to kill the processes.
+        """
 
         for process in processes:
             # We loop through the list of processes.
 
-            if exception_present:
+            if terminate:
                 # We kill the process.
                 process.terminate()
+            else:
+                # We send the stop signal.
+                tasks.put(None)
 
-            if process.exception:
-                # There in an exception in the currently
-                # read process.
+        for process in processes:
+            # We loop through the list of processes.
 
-                # We get the traceback
-                _, traceback = process.exception
+            # And we wait for it to finish.
+            process.join()
 
-                # We print the traceback.
-                print(traceback)
+    def __start_writers(self):
+        """
+        Start the single writer of our SQL databases.
+
+        .. note::
+            Once started, our processes send their writes to the writer
+            instead of writing into the database themselves.
+        """
+
+        for database in [self.sqlite_db, self.mysql_db]:
+            # We loop through our SQL databases.
+
+            if database.authorized:
+                # We are working with the currently read database.
+
+                # We start its writer.
+                database.writer = DBWriter(database)
+                database.writer.start()
+
+    def __stop_writers(self):
+        """
+        Stop the single writer of our SQL databases.
+        """
 
-                exception_present = True
+        for database in [self.sqlite_db, self.mysql_db]:
+            # We loop through our SQL databases.
 
-        if exception_present:
-            # We finally exit.
-            self.__merge_processes_data(manager_data)
+            if database.writer is not None:
+                # The writer of the currently read database is running.
 
-            exit(1)
+                # We stop it.
+                database.writer.stop()
+                database.writer = None
 
-    def __run_multiprocess_test(self, to_test, manager):
+    def __run_multiprocess_test(self, to_test):
         """
         Test the given list to test with multiple process.
 
         :param itertools.chain to_test: A chain representing a list of subject to test.
-        :param multiprocessing.Manager manager: A Server process.
         """
 
+        # We initiate the queue of chunks to test.
+        tasks = Queue()
+        # We initiate the queue the processes send their results through.
+        results = Queue()
+
+        # We start the writer of our databases.
+        self.__start_writers()
+
+        # We initiate our pool of processes.
+        processes = [
+            OurProcessWrapper(tasks, results, target=self.__test_line)
+            for _ in range(PyFunceble.CONFIGURATION["maximal_processes"])
+        ]
+
+        for process in processes:
+            # We loop through our pool of processes.
+
+            # And we start them.
+            process.start()
+
+        # We get the subjects to test.
+        subjects = self.__get_subjects(to_test)
+
         # We initiate a variable which will tell us if we
-        # finished to test every subject of the given list
+        # finished to dispatch every subject of the given list
         # to test.
         finished = False
-        # We initiate a variable for the case that no list of tuple is
-        # given.
-        #
-        # Indeed, as we allow the mining subsystem to run with multiprocess,
-        # this is needed.
-        index = "funilrys"
+        # We initiate the number of chunks which are being tested.
+        in_flight = 0
 
-        # We create the manager data.
-        manager_data = manager.list()
+        # We save the time we started.
+        start_time = PyFunceble.time()
 
         while True:
-            # We get the list of active process.
-            active = active_children()
-            # We initiate a variable which will save the process which are still running.
-            processes = []
-
             while (
-                len(active) <= PyFunceble.CONFIGURATION["maximal_processes"]
-                and len(processes) <= PyFunceble.CONFIGURATION["maximal_processes"]
+                not finished
+                and in_flight < len(processes) * 2
                 and not self.autosave.is_time_exceed()
             ):
-                # We loop untill we reach the maximal number of processes.
-
-                try:
-                    # We get the subject we are going to work with..
-                    subject = next(to_test)
-
-                    if isinstance(subject, tuple):
-                        # The subject is a tuple.
-
-                        # We spread the index from the subject.
-                        index, subject = subject
-
-                    # We initiate a process.
-                    process = OurProcessWrapper(
-                        target=self._test_line, args=(subject, manager_data)
-                    )
-                    # # We save it into our list of process.
-                    processes.append(process)
-                    # We then start the job.
-                    process.start()
-
-                    if index != "funilrys":
-                        # An index was given, we remove the index and subject from
-                        # the mining database.
-                        self.mining.remove(index, subject)
-
-                    # We increase the process number.
-                    active = active_children()
-                    # And we continue the loop.
-                    continue
-                except StopIteration:
+                # We loop until every process has something to work on.
+
+                # We get the next chunk.
+                chunk = list(islice(subjects, self.chunk_size))
+
+                if not chunk:
                     # There is no subject into the list to test.
 
                     finished = True
-                    active = active_children()
 
-                    # We break the loop
+                    # We break the loop.
                     break
 
-            while len(active) != 1:
-                active = active_children()
+                # We dispatch the chunk.
+                tasks.put(chunk)
+                in_flight += 1
 
-            if finished or self.autosave.is_time_exceed():
+            if not in_flight:
+                # Every dispatched chunk was tested.
 
-                self.__merge_processes_data(manager_data)
+                # We break the loop.
                 break
 
-        self.__process_exception(processes, manager_data)
+            # We wait for a process to finish a chunk.
+            records, traceback = self.get_results(processes, results)
+            in_flight -= 1
 
-    def __merge_processes_data(self, manager_data):
-        """
-        Assemble the data saved into the server process.
+            # We save the results of the chunk.
+            self.__save_results(records)
 
-        :param multiprocessing.Manager.list manager_data: A Server process.
-        """
+            if traceback:
+                # There in an exception in a process.
 
-        if PyFunceble.CONFIGURATION["db_type"] == "json":
-            if not self.autosave.authorized:
-                print(
-                    PyFunceble.Fore.MAGENTA
-                    + PyFunceble.Style.BRIGHT
-                    + "\nMerging cross processes data... This process might take some time."
-                )
-
-            for data in manager_data:
-                # We loop through the server process list members.
-
-                if self.autosave.authorized:
-                    print(
-                        PyFunceble.Fore.MAGENTA
-                        + PyFunceble.Style.BRIGHT
-                        + "Merging process data ..."
-                    )
-
-                if self.autocontinue.authorized:
-                    # We are authorized to operate with the
-                    # autocontinue subsystem.
-
-                    # We assemble the currenlty read data with the data of the current
-                    # session.
-                    self.autocontinue.database = Dict(self.autocontinue.database).merge(
-                        data["autocontinue"], strict=False
-                    )
-
-                if self.inactive_db.authorized:
-                    # We are authorized to operate with the
-                    # inactive database subsystem.
-
-                    # We assemble the currenlty read data with the data of the current
-                    # session.
-                    self.inactive_db.database = Dict(self.inactive_db.database).merge(
-                        data["inactive_db"], strict=False
-                    )
-
-                if self.mining.authorized:
-                    # We are authorized to operate with the
-                    # mining subsystem.
-
-                    # We assemble the currenlty read data with the data of the current
-                    # session.
-                    self.mining.database = Dict(self.mining.database).merge(
-                        data["mining"], strict=False
-                    )
-
-            # We save the autocontinue database.
-            self.autocontinue.save()
-            # We save the inactive database.
-            self.inactive_db.save()
-            # We save the mining database.
-            self.mining.save()
-
-        if self.autosave.is_time_exceed():
-            # The operation end time was exceeded.
+                # We print the traceback.
+                print(traceback)
 
-            # We update all counters.
-            self.autocontinue.update_counters()
+                # We kill the processes.
+                self.__stop_processes(processes, tasks, terminate=True)
+                # We stop the writer of our databases.
+                self.__stop_writers()
 
-            # We sort the content of all files we generated.
-            self.__sort_generated_files()
+                # We finally exit.
+                exit(1)
 
-            # We process the saving of everything.
-            self.autosave.process()
-        else:
-            # We are not auto saving.
+        # We stop our pool of processes.
+        self.__stop_processes(processes, tasks)
+        # We stop the writer of our databases.
+        self.__stop_writers()
 
-            # We update all counters.
-            self.autocontinue.update_counters()
+        # We update the time we spent testing.
+        self.testing_time += PyFunceble.time() - start_time
 
-            # We sort the content of all files we generated.
-            self.__sort_generated_files()
+        # We sort the content of all files we generated.
+        self._sort_generated_files()
 
-    def generate_json_format(self):
-        """
-        Generate the JSON formatted file.
-
-        .. note::
-            This is needed because otherwise we might get a format issue.
-        """
-
-        if PyFunceble.CONFIGURATION["generate_json"]:
-            # We have to generate the JSON format.
+        if self.autosave.is_time_exceed():
+            # The operation end time was exceeded.
 
-            for status, data in self.autocontinue.database[self.file].items():
-                # We loop through the autocontinue data.
+            # We flush the databases.
+            self._flush_databases()
 
-                # We save the data at their final location.
-                Dict(data).to_json(
-                    PyFunceble.OUTPUT_DIRECTORY
-                    + PyFunceble.OUTPUTS["parent_directory"]
-                    + PyFunceble.OUTPUTS["json"]["directory"]
-                    + status
-                    + PyFunceble.OUTPUTS["json"]["filename"]
-                )
+            # We process the saving of everything.
+            self.autosave.process()
 
     def read_and_test_file_content(self):  # pragma: no cover
         """
@@ -421,36 +473,53 @@ class FileMultiprocessCore(FileCore):  # pragma: no cover
         with open(self.file, "r", encoding="utf-8") as file:
             # We open the file we have to test.
 
-            with Manager() as manager:
-                # We initiate a server process.
+            # We process the test/save of the original list to test.
+            self.__run_multiprocess_test(
+                self._get_list_to_of_subjects_to_test_from_file(file)
+            )
 
-                # We process the test/save of the original list to test.
-                self.__run_multiprocess_test(
-                    self._get_list_to_of_subjects_to_test_from_file(file), manager
-                )
+        # We get the list of mined data to test.
+        to_test = chain(self.mining.list_of_mined())
 
-                # We get the list of mined data to test.
-                to_test = chain(self.mining.list_of_mined())
+        # We process the test/save of the mined data to test.
+        self.__run_multiprocess_test(to_test)
 
-                # We process the test/save of the mined data to test.
-                self.__run_multiprocess_test(to_test, manager)
+        # We get the list of complements to test.
+        complements = self.get_complements()
 
-                # We get the list of complements to test.
-                complements = self.get_complements()
+        if complements:
+            # We process the test/save of the original list to test.
+            to_test = chain(complements)
 
-                if complements:
-                    # We process the test/save of the original list to test.
-                    to_test = chain(complements)
+            self.__run_multiprocess_test(to_test)
 
-                    self.__run_multiprocess_test(to_test, manager)
+            # We inform all subsystem that we are not testing for complements anymore.
+            self.complements_test_started = False
 
-                    # We inform all subsystem that we are not testing for complements anymore.
-                    self.complements_test_started = False
+        # We print the number of subjects we tested per second.
+        self.print_throughput(
+            "with {0} processes".format(PyFunceble.CONFIGURATION["maximal_processes"])
+        )
 
         # We generate the JSON formatted files if needed.
         self.generate_json_format()
         # We clean the autocontinue subsystem, we finished
         # the test.
         self.autocontinue.clean()
+        # We flush the databases.
+        self._flush_databases()
         # We process the autosaving if necessary.
         self.autosave.process(test_completed=True)
+        # We stop consulting the DNS database.
+        PyFunceble.DNSLookup.cache.database = None
+        # We close the pooled HTTP connections.
+        HTTPSession.close()
+        # We forget the unreachable hosts.
+        HTTPHostCache.clear()
+        # We forget the redirections.
+        HTTPRedirects.clear()
+        # We close the database connection
+        if self.sqlite_db.authorized:
+            self.sqlite_db.close()
+        if self.mysql_db.authorized:
+            self.mysql_db.close()
@@ -59,6 +59,8 @@ License:
     SOFTWARE.
 """
 # pylint: enable=line-too-long
+from threading import local
+
 import PyFunceble
 from PyFunceble import directory_separator
 from PyFunceble.percentage import Percentage
@@ -90,8 +92,16 @@ class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes,
 
     :param bool ip_validation:
         The IP validation check of the currently written subject.
+
+    .. note::
+        A thread can defer its outputs (files, counters and screen) with
+        :meth:`start_deferring`. They are then written by the thread
+        which gives them to :meth:`write_deferred`.
     """
 
+    # Save the outputs which are deferred by the current thread.
+    deferred = local()
+
     def __init__(
         self,
         subject,
@@ -152,6 +162,69 @@ class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes,
             # We initiate an empty header to use with our request.
             self.headers = {}
 
+    @classmethod
+    def start_deferring(cls):
+        """
+        Start to defer the outputs of the current thread.
+        """
+
+        cls.deferred.outputs = []
+
+    @classmethod
+    def stop_deferring(cls):
+        """
+        Stop to defer the outputs of the current thread.
+
+        :return:
+            The deferred outputs.
+            They have to be given to :meth:`write_deferred`.
+        :rtype: list
+        """
+
+        outputs = getattr(cls.deferred, "outputs", None) or []
+        cls.deferred.outputs = None
+
+        return outputs
+
+    @classmethod
+    def defer(cls, method, *args):
+        """
+        Save the given call for later if the current thread defers its outputs.
+
+        :param callable method: The method which outputs something.
+        :param tuple args: The arguments to give to the method.
+
+        :return: The deferral state.
+        :rtype: bool
+        """
+
+        outputs = getattr(cls.deferred, "outputs", None)
+
+        if outputs is None:
+            # The current thread does not defer its outputs.
+
+            # We inform everyone that the call has to be done now.
+            return False
+
+        # We save the call for later.
+        outputs.append((method, args))
+
+        return True
+
+    @classmethod
+    def write_deferred(cls, outputs):
+        """
+        Write the given deferred outputs.
+
+        :param list outputs: The outputs from :meth:`stop_deferring`.
+        """
+
+        for method, args in outputs:
+            # We loop through the deferred outputs.
+
+            # And we write them.
+            method(*args)
+
     @classmethod
     def _do_not_produce_file(cls):
         """
@@ -470,6 +543,7 @@ class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes,
             if (
                 PyFunceble.CONFIGURATION["generate_json"]
                 and not PyFunceble.CONFIGURATION["multiprocess"]
+                and not PyFunceble.CONFIGURATION["asynchronous"]
             ):
                 # The json list generation is activated.
 
@@ -535,6 +609,10 @@ class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes,
         Generate :code:`complements` files base on the current status.
         """
 
+        if self.defer(self.complements_file):
+            # The outputs of the current thread are written later.
+            return
+
         if self.subject_type.startswith("file_"):
             # We are testing files.
 
@@ -578,6 +656,10 @@ class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes,
         :param str old_status: The old status of the domain.
         """
 
+        if self.defer(self.analytic_file, new_status, old_status):
+            # The outputs of the current thread are written later.
+            return
+
         if not old_status:
             # The old status is not given.
 
@@ -854,6 +936,10 @@ class Generate:  # pragma: no cover pylint:disable=too-many-instance-attributes,
         Generate a file according to the domain status.
         """
 
+        if self.defer(self.status_file):
+            # The outputs of the current thread are written later.
+            return None
+
         # We generate the hosts file.
         self.info_files()
 
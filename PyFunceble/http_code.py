@@ -60,10 +60,594 @@ License:
 """
 # pylint: enable=line-too-long
 
+from codecs import getincrementaldecoder
+from http.cookiejar import DefaultCookiePolicy
+from os import getpid
+from threading import Lock, local
+from urllib.parse import urljoin, urlsplit
+
 import urllib3.exceptions as urllib3_exceptions
 from urllib3 import disable_warnings
 
 import PyFunceble
+from PyFunceble.helpers import Regex
+
+
+class HTTPSession:
+    """
+    Provide the pooled HTTP sessions shared by everything which
+    communicates with webservers.
+
+    .. note::
+        Each thread of each process gets its own session so that the
+        connections to a same host are kept alive and reused.
+
+    .. note::
+        The sessions do not keep any cookie between two requests.
+    """
+
+    # Save the session of each thread.
+    local = local()
+
+    # Save the sessions we created so that we can close them.
+    sessions = []
+    # Save the number of times we closed the sessions.
+    # Note: It let the threads know that their session was closed.
+    generation = 0
+
+    # Save the lock which protect the list of sessions.
+    lock = Lock()
+
+    # Save the number of hosts to keep a pool of connections for.
+    hosts = 100
+
+    @classmethod
+    def get_session(cls):
+        """
+        Provide the session of the current thread.
+
+        :rtype: :class:`requests.Session`
+        """
+
+        if (
+            getattr(cls.local, "pid", None) != getpid()
+            or cls.local.generation != cls.generation
+        ):
+            # * The current thread does not have a session yet.
+            # or
+            # * The session was created by another process.
+            # or
+            # * The session was closed.
+
+            # We initiate the pools of connections.
+            adapter = PyFunceble.requests.adapters.HTTPAdapter(
+                pool_connections=cls.hosts,
+                pool_maxsize=PyFunceble.CONFIGURATION["http_pool_size"],
+            )
+
+            # We initiate the session.
+            session = PyFunceble.requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+
+            # We refuse to keep the cookies between two requests.
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+            with cls.lock:
+                cls.sessions.append(session)
+
+                cls.local.session = session
+                cls.local.pid = getpid()
+                cls.local.generation = cls.generation
+
+        return cls.local.session
+
+    @classmethod
+    def close(cls):
+        """
+        Close all the sessions we created.
+        """
+
+        with cls.lock:
+            for session in cls.sessions:
+                # We loop through the sessions.
+
+                # We close the currently read one.
+                session.close()
+
+            cls.sessions.clear()
+            cls.generation += 1
+
+
+class HTTPHostCache:
+    """
+    Remember the hosts whose webserver does not answer so that we stop
+    waiting for them.
+
+    .. note::
+        A host is a :code:`(scheme, host, port)` tuple.
+
+    .. note::
+        Once a host failed (connection error or timeout)
+        :code:`http_unreachable_threshold` times within
+        :code:`http_unreachable_window` seconds, it is considered as
+        unreachable for :code:`http_unreachable_window` seconds.
+    """
+
+    # Save the moments of the recent failures of each host.
+    # Note: It's a host -> list of moments dict.
+    failures = {}
+    # Save the hosts which are considered as unreachable.
+    # Note: It's a host -> expiration dict.
+    unreachable = {}
+
+    # Save the lock which protect our dicts.
+    lock = Lock()
+
+    @classmethod
+    def get_host(cls, url):
+        """
+        Provide the host of the given URL.
+
+        :param str url: The URL to work with.
+
+        :return: The :code:`(scheme, host, port)` tuple or :code:`None`.
+        :rtype: tuple|None
+        """
+
+        try:
+            # We split the URL.
+            parsed = urlsplit(url)
+
+            # We get its port.
+            port = parsed.port
+        except ValueError:
+            return None
+
+        if not parsed.hostname:
+            # There is no host.
+
+            return None
+
+        # We get the scheme.
+        scheme = parsed.scheme.lower()
+
+        if not port:
+            # The port is not given.
+
+            # We get the default one.
+            port = 443 if scheme == "https" else 80
+
+        return scheme, parsed.hostname.lower(), port
+
+    @classmethod
+    def authorization(cls):
+        """
+        Check if we are allowed to use the cache.
+
+        :rtype: bool
+        """
+
+        return PyFunceble.CONFIGURATION["http_unreachable_threshold"] > 0
+
+    @classmethod
+    def is_unreachable(cls, url):
+        """
+        Check if the host of the given URL is considered as unreachable.
+
+        :param str url: The URL to work with.
+
+        :rtype: bool
+        """
+
+        if not cls.authorization():
+            # We are not allowed to use the cache.
+
+            return False
+
+        # We get the host of the URL.
+        host = cls.get_host(url)
+
+        with cls.lock:
+            if host not in cls.unreachable:
+                # The host is not known as unreachable.
+
+                return False
+
+            if cls.unreachable[host] > PyFunceble.time():
+                # The host is still considered as unreachable.
+
+                return True
+
+            # The host is not considered as unreachable anymore.
+
+            # We remove it.
+            del cls.unreachable[host]
+
+        return False
+
+    @classmethod
+    def add_failure(cls, url):
+        """
+        Save that the host of the given URL did not answer.
+
+        :param str url: The URL to work with.
+        """
+
+        if not cls.authorization():
+            # We are not allowed to use the cache.
+
+            return
+
+        # We get the host of the URL.
+        host = cls.get_host(url)
+
+        if not host:
+            # There is no host.
+
+            return
+
+        # We get the current time.
+        current_time = PyFunceble.time()
+        # We get the number of seconds to remember a failure.
+        window = PyFunceble.CONFIGURATION["http_unreachable_window"]
+
+        with cls.lock:
+            # We get the recent failures of the host and append the current one.
+            failures = [
+                x for x in cls.failures.get(host, []) if x > current_time - window
+            ] + [current_time]
+
+            if len(failures) >= PyFunceble.CONFIGURATION["http_unreachable_threshold"]:
+                # The host failed too many times.
+
+                # We consider it as unreachable.
+                cls.unreachable[host] = current_time + window
+
+                # And we forget its failures.
+                cls.failures.pop(host, None)
+            else:
+                # We save the failures of the host.
+                cls.failures[host] = failures
+
+    @classmethod
+    def add_success(cls, url):
+        """
+        Save that the host of the given URL answered.
+
+        :param str url: The URL to work with.
+        """
+
+        if not cls.authorization():
+            # We are not allowed to use the cache.
+
+            return
+
+        # We get the host of the URL.
+        host = cls.get_host(url)
+
+        with cls.lock:
+            # We forget the failures of the host.
+            cls.failures.pop(host, None)
+            cls.unreachable.pop(host, None)
+
+    @classmethod
+    def clear(cls):
+        """
+        Forget everything we know about the hosts.
+        """
+
+        with cls.lock:
+            cls.failures.clear()
+            cls.unreachable.clear()
+
+
+class HTTPRedirects:
+    """
+    Walk through the redirections of a URL with :code:`HEAD` requests.
+
+    .. note::
+        Each redirection (URL -> location) is cached until the end of the
+        test. Therefore, the chains shared by multiple subjects are only
+        walked once.
+
+    .. note::
+        We only fall back to a :code:`GET` request (without downloading its
+        body) when the webserver does not accept :code:`HEAD` requests.
+    """
+
+    # Save the location each URL redirects to.
+    # Note: It's a URL -> location dict. The location is None if the URL
+    # does not redirect.
+    # Note: The URL we could not ask are not cached.
+    cache = {}
+
+    # Save the lock which protect the cache.
+    lock = Lock()
+
+    # Save the status codes of the redirections.
+    redirect_codes = [301, 302, 303, 307, 308]
+    # Save the status codes of the webservers which refuse HEAD requests.
+    refused_codes = [405, 501]
+
+    @classmethod
+    def __request(cls, url, headers=None):
+        """
+        Get the location the given URL redirects to.
+
+        :param str url: The URL to call.
+        :param dict headers: The headers to send.
+
+        :return:
+            A tuple :code:`(answered, location)`.
+            :code:`answered` is :code:`False` if we could not ask the URL.
+            :code:`location` is :code:`None` if the URL does not redirect.
+        :rtype: tuple
+        """
+
+        # We get the session of the current thread.
+        session = HTTPSession.get_session()
+
+        try:
+            # We get the head of the URL.
+            req = session.head(
+                url,
+                timeout=PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
+                headers=headers,
+                allow_redirects=False,
+            )
+
+            if req.status_code in cls.refused_codes:
+                # The webserver does not accept HEAD requests.
+
+                # We ask again without downloading the body.
+                req.close()
+                req = session.get(
+                    url,
+                    timeout=PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
+                    headers=headers,
+                    allow_redirects=False,
+                    stream=True,
+                )
+
+            # We close the connection, we do not need the body.
+            req.close()
+
+            if req.status_code not in cls.redirect_codes:
+                # The URL does not redirect.
+
+                return True, None
+
+            # We get the location.
+            location = session.get_redirect_target(req)
+
+            if location:
+                # The location is given.
+
+                # We return the absolute location.
+                return True, urljoin(url, location)
+
+            # The location is not given, we can not follow it.
+            return True, None
+        except (
+            PyFunceble.requests.exceptions.RequestException,
+            PyFunceble.socket.timeout,
+            urllib3_exceptions.HTTPError,
+            UnicodeDecodeError,  # The probability that this happend in production is minimal.
+        ):
+            pass
+
+        # We were unable to ask the URL.
+        return False, None
+
+    @classmethod
+    def get_location(cls, url, headers=None):
+        """
+        Get the location the given URL redirects to.
+
+        :param str url: The URL to call.
+        :param dict headers: The headers to send.
+
+        :return: The location or :code:`None`.
+        :rtype: str|None
+        """
+
+        with cls.lock:
+            if url in cls.cache:
+                # The redirection is cached.
+
+                # We return it.
+                return cls.cache[url]
+
+        # We get the location.
+        answered, location = cls.__request(url, headers=headers)
+
+        if answered:
+            # The URL answered.
+
+            with cls.lock:
+                # We cache the redirection.
+                cls.cache[url] = location
+
+        return location
+
+    @classmethod
+    def walk(cls, url, headers=None):
+        """
+        Walk through the redirections of the given URL.
+
+        :param str url: The URL to start from.
+        :param dict headers: The headers to send.
+
+        :return:
+            The list of URL which redirected us, in order.
+            The first one is the given URL and the final one is not included.
+        :rtype: list
+        """
+
+        # We initiate the list of URL which redirected us.
+        result = []
+
+        while len(result) < PyFunceble.CONFIGURATION["maximal_redirects"]:
+            # We did not follow too many redirections.
+
+            # We get the location of the current URL.
+            location = cls.get_location(url, headers=headers)
+
+            if not location:
+                # The current URL does not redirect.
+
+                # We stop walking.
+                break
+
+            # We save the current URL.
+            result.append(url)
+
+            if location in result:
+                # We are in a redirecting loop.
+
+                # We stop walking.
+                break
+
+            # We continue with the location.
+            url = location
+
+        return result
+
+    @classmethod
+    def clear(cls):
+        """
+        Forget all the redirections.
+        """
+
+        with cls.lock:
+            cls.cache.clear()
+
+
+class HTTPBody:  # pylint: disable=too-few-public-methods
+    """
+    Look for some markers into the body of a webpage without downloading
+    all of it.
+
+    :param str url: The URL of the webpage.
+    :param list markers:
+        The markers to look for.
+        Each of them is matched as a string and as a regex.
+    :param dict headers: The headers to send.
+
+    .. note::
+        We stop reading as soon as a marker is found, once
+        :code:`http_body_size` bytes were read or once
+        :code:`seconds_before_http_timeout` seconds passed.
+    """
+
+    # Save the number of bytes we read at once.
+    chunk_size = 4096
+
+    def __init__(self, url, markers, headers=None):
+        # We share the URL.
+        self.url = url
+        # We share the markers.
+        self.markers = markers
+        # We share the headers.
+        self.headers = headers
+
+    def __is_marked(self, content):
+        """
+        Check if one of the markers is into the given content.
+
+        :param str content: The content to look into.
+
+        :rtype: bool
+        """
+
+        for marker in self.markers:
+            # We loop through the list of markers.
+
+            if marker in content or Regex(
+                content, marker, return_data=False, escape=False
+            ).match():
+                # * The currently read marker is present into the content.
+                # or
+                # * Something in the content match the currently read marker.
+
+                return True
+
+        return False
+
+    def match(self):
+        """
+        Check if one of the markers is into the body of the webpage.
+
+        :rtype: bool
+        """
+
+        # We get the maximal number of seconds we are allowed to spend.
+        timeout = PyFunceble.CONFIGURATION["seconds_before_http_timeout"]
+        # We get the moment we have to give up.
+        end_time = PyFunceble.time() + timeout
+
+        # We initiate the number of bytes we read.
+        size = 0
+        # We initiate the content we read.
+        content = ""
+
+        try:
+            # We ask for the webpage without downloading its body.
+            req = HTTPSession.get_session().get(
+                self.url, headers=self.headers, timeout=timeout, stream=True
+            )
+
+            try:
+                try:
+                    # We get the decoder of the encoding of the webpage.
+                    decoder = getincrementaldecoder(req.encoding or "utf-8")(
+                        errors="replace"
+                    )
+                except LookupError:
+                    # The encoding is unknown.
+
+                    # We decode with the default one.
+                    decoder = getincrementaldecoder("utf-8")(errors="replace")
+
+                for chunk in req.iter_content(chunk_size=self.chunk_size):
+                    # We loop through the chunks of the body.
+
+                    # We keep what we are allowed to read.
+                    chunk = chunk[: PyFunceble.CONFIGURATION["http_body_size"] - size]
+                    size += len(chunk)
+
+                    # We append the decoded chunk to the content.
+                    content += decoder.decode(chunk)
+
+                    if self.__is_marked(content):
+                        # A marker was found.
+
+                        return True
+
+                    if (
+                        size >= PyFunceble.CONFIGURATION["http_body_size"]
+                        or PyFunceble.time() >= end_time
+                    ):
+                        # * We read as much as we are allowed to.
+                        # or
+                        # * We spent as much time as we are allowed to.
+
+                        # We stop reading.
+                        break
+            finally:
+                # We close the connection, the rest of the body is not needed.
+                req.close()
+        except (
+            PyFunceble.requests.exceptions.RequestException,
+            PyFunceble.socket.timeout,
+            urllib3_exceptions.HTTPError,
+            UnicodeDecodeError,  # The probability that this happend in production is minimal.
+        ):
+            pass
+
+        # We return False, no marker was found.
+        return False
 
 
 class HTTPCode:  # pylint: disable=too-few-public-methods
@@ -83,11 +667,26 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
         - :code:`file_url`
 
         - :code:`file_domain`
+
+    :param list addresses:
+        The addresses (A and AAAA records) of the domain we are working with.
+        If given, we connect to them instead of resolving the domain again.
+        If empty, the domain has no address and we do not ask anything.
+
+    .. note::
+        If the host is known as unreachable by
+        :class:`~PyFunceble.http_code.HTTPHostCache`, we do not ask anything
+        and :code:`self.unreachable` is set to :code:`True`.
     """
 
     default = "*" * 3
 
-    def __init__(self, subject, subject_type):  # pragma: no cover
+    # Save the HTTP status codes which were already got by
+    # :class:`~PyFunceble.http_prober.HTTPProber`.
+    # Note: It's a URL -> HTTP status code dict and each of them is read once.
+    probed = {}
+
+    def __init__(self, subject, subject_type, addresses=None):  # pragma: no cover
         subject_type = subject_type.lower()
 
         if subject_type in ["url", "file_url"]:
@@ -111,6 +710,12 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
 
         # We share the subject type.
         self.subject_type = subject_type
+        # We share the host we are working with.
+        self.host = subject
+        # We share the addresses of the host.
+        self.addresses = addresses
+        # We initiate the indicator of the host being known as unreachable.
+        self.unreachable = False
 
         if PyFunceble.CONFIGURATION["user_agent"]:
             # The user-agent is given.
@@ -124,6 +729,71 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
             # We return an empty header.
             self.headers = {}
 
+    def _access_addresses(self):  # pragma: no cover
+        """
+        Get the HTTP code status from the addresses of the host.
+
+        :return: The matched HTTP status code.
+        :rtype: int|None
+
+        .. note::
+            The addresses are tried in the given order until one of
+            them accepts our connection.
+        """
+
+        # We set the header which tells the server the host we want.
+        headers = dict(self.headers, Host=self.host)
+
+        for address in self.addresses:
+            # We loop through the addresses.
+
+            if ":" in address:
+                # We are working with an IPv6.
+
+                # We enclose it.
+                address = "[%s]" % address
+
+            try:
+                # We get the head of the constructed URL.
+                req = HTTPSession.get_session().head(
+                    "http://%s:80" % address,
+                    timeout=PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
+                    headers=headers,
+                )
+
+                # We save that the host answered.
+                HTTPHostCache.add_success(self.subject)
+
+                # And we try to get the status code.
+                return req.status_code
+            except (PyFunceble.requests.exceptions.Timeout, PyFunceble.socket.timeout):
+                # We save that the host did not answer.
+                HTTPHostCache.add_failure(self.subject)
+
+                # We do not try the other addresses, it would take too much time.
+                break
+            except (
+                urllib3_exceptions.InvalidHeader,
+                UnicodeDecodeError,  # The probability that this happend in production is minimal.
+            ):
+                # We do not try the other addresses, it would take too much time.
+                break
+            except (
+                PyFunceble.requests.ConnectionError,
+                PyFunceble.requests.exceptions.InvalidURL,
+            ):
+                # We try the next address.
+                continue
+        else:
+            if self.addresses:
+                # None of the addresses accepted our connection.
+
+                # We save that the host did not answer.
+                HTTPHostCache.add_failure(self.subject)
+
+        # We return None, we were unable to extract the status code.
+        return None
+
     def _access(self):  # pragma: no cover
         """
         Get the HTTP code status.
@@ -132,6 +802,39 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
         :rtype: int|None
         """
 
+        if self.subject in self.probed:
+            # The HTTP status code was already got by the prober.
+
+            # We get it.
+            http_code = self.probed.pop(self.subject, None)
+
+            if http_code is None:
+                # The prober could not get it.
+
+                # We check if it is because the host is unreachable.
+                self.unreachable = HTTPHostCache.is_unreachable(self.subject)
+
+            # We return it.
+            return http_code
+
+        if HTTPHostCache.is_unreachable(self.subject):
+            # The host did not answer us lately.
+
+            # We do not wait for it again.
+            self.unreachable = True
+
+            # We return None, we were unable to extract the status code.
+            return None
+
+        if (
+            self.subject_type in ["domain", "file_domain"]
+            and self.addresses is not None
+        ):
+            # We already know the addresses of the domain.
+
+            # We get the HTTP status code from them.
+            return self._access_addresses()
+
         try:
             # We try to get the HTTP status code.
 
@@ -139,7 +842,7 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
                 # We are globally testing a URL.
 
                 # We get the head of the URL.
-                req = PyFunceble.requests.head(
+                req = HTTPSession.get_session().head(
                     self.subject,
                     timeout=PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
                     headers=self.headers,
@@ -149,22 +852,34 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
                 # We are not globally testing a URL.
 
                 # We get the head of the constructed URL.
-                req = PyFunceble.requests.head(
+                req = HTTPSession.get_session().head(
                     self.subject,
                     timeout=PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
                     headers=self.headers,
                 )
 
+            # We save that the host answered.
+            HTTPHostCache.add_success(self.subject)
+
             # And we try to get the status code.
             return req.status_code
 
         except (
             PyFunceble.requests.ConnectionError,
+            PyFunceble.requests.exceptions.Timeout,
+            PyFunceble.socket.timeout,
+        ):
+            # The host did not answer.
+
+            # We save it.
+            HTTPHostCache.add_failure(self.subject)
+
+            # We return None.
+            return None
+        except (
             PyFunceble.requests.exceptions.InvalidSchema,
             PyFunceble.requests.exceptions.InvalidURL,
             PyFunceble.requests.exceptions.MissingSchema,
-            PyFunceble.requests.exceptions.Timeout,
-            PyFunceble.socket.timeout,
             urllib3_exceptions.InvalidHeader,
             UnicodeDecodeError,  # The probability that this happend in production is minimal.
         ):
@@ -174,49 +889,60 @@ class HTTPCode:  # pylint: disable=too-few-public-methods
             # We return None.
             return None
 
-    def get(self):
+    @classmethod
+    def format_status_code(cls, http_code):
         """
-        Return the HTTP code status.
+        Format the given HTTP status code.
 
-        :return: The matched and formatted status code.
-        :rtype: str|int|None
+        :param int http_code: The HTTP status code to format.
+
+        :return: The formatted status code.
+        :rtype: str|int
         """
 
-        if PyFunceble.HTTP_CODE["active"]:
-            # The http status code extraction is activated.
+        # We initiate a variable which will save the list of allowed
+        # http status code.
+        list_of_valid_http_code = []
 
-            # We get the http status code.
-            http_code = self._access()
+        for codes in [
+            PyFunceble.HTTP_CODE["list"]["up"],
+            PyFunceble.HTTP_CODE["list"]["potentially_down"],
+            PyFunceble.HTTP_CODE["list"]["potentially_up"],
+        ]:
+            # We loop throught the list of http status code.
 
-            # We initiate a variable which will save the list of allowed
-            # http status code.
-            list_of_valid_http_code = []
+            # We extend the list of valid with the currently read
+            # codes.
+            list_of_valid_http_code.extend(codes)
 
-            for codes in [
-                PyFunceble.HTTP_CODE["list"]["up"],
-                PyFunceble.HTTP_CODE["list"]["potentially_down"],
-                PyFunceble.HTTP_CODE["list"]["potentially_up"],
-            ]:
-                # We loop throught the list of http status code.
+        if http_code not in list_of_valid_http_code or http_code is None:
+            # * The extracted http code is not in the list of valid http code.
+            # or
+            # * The extracted http code is equal to `None`.
 
-                # We extend the list of valid with the currently read
-                # codes.
-                list_of_valid_http_code.extend(codes)
+            # We return the default http code.
+            return cls.default
 
-            if http_code not in list_of_valid_http_code or http_code is None:
-                # * The extracted http code is not in the list of valid http code.
-                # or
-                # * The extracted http code is equal to `None`.
+        # * The extracted http code is in the list of valid http code.
+        # or
+        # * The extracted http code is not equal to `None`.
 
-                # We return the default http code.
-                return self.default
+        # We return the extracted http status code.
+        return http_code
 
-            # * The extracted http code is in the list of valid http code.
-            # or
-            # * The extracted http code is not equal to `None`.
+    def get(self):
+        """
+        Return the HTTP code status.
 
-            # We return the extracted http status code.
-            return http_code
+        :return: The matched and formatted status code.
+        :rtype: str|int|None
+        """
+
+        if PyFunceble.HTTP_CODE["active"]:
+            # The http status code extraction is activated.
+
+            # We get and return the formatted http status code.
+            return self.format_status_code(self._access())
 
         # The http status code extraction is activated.
 
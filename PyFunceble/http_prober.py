@@ -0,0 +1,453 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+This submodule will provide the asynchronous HTTP status code prober.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import asyncio
+import ssl
+from urllib.parse import urlsplit
+
+import PyFunceble
+from PyFunceble.http_code import HTTPCode, HTTPHostCache
+
+
+class HTTPProber:
+    """
+    Get the HTTP status code of a large number of URL at once.
+    The requests are multiplexed over an event loop instead of a thread
+    per request.
+
+    :param int concurrency: The maximal number of requests in flight at once.
+    :param int host_concurrency:
+        The maximal number of requests in flight at once to the same host.
+    :param float timeout:
+        The number of seconds to wait for the connection and then
+        for the status line.
+
+    .. note::
+        We only send a :code:`HEAD` request and read the status line of the
+        response. The redirections are not followed, just like
+        :class:`~PyFunceble.http_code.HTTPCode` does.
+
+    .. note::
+        The hosts which do not answer are saved into (and skipped thanks to)
+        :class:`~PyFunceble.http_code.HTTPHostCache`.
+    """
+
+    def __init__(self, concurrency=None, host_concurrency=None, timeout=None):
+        if concurrency is None:
+            concurrency = PyFunceble.CONFIGURATION["concurrency"]
+
+        if host_concurrency is None:
+            host_concurrency = PyFunceble.CONFIGURATION["http_host_concurrency"]
+
+        if timeout is None:
+            timeout = PyFunceble.CONFIGURATION["seconds_before_http_timeout"]
+
+        self.concurrency = concurrency
+        self.host_concurrency = host_concurrency
+        self.timeout = timeout
+
+        # We initiate the number of requests which are allowed to be in
+        # flight at once.
+        # Note: It is created once we are into the event loop.
+        self.semaphore = None
+        # We initiate the number of requests which are allowed to be in flight
+        # at once for each host.
+        # Note: It's a host -> [semaphore, number of users] dict.
+        self.hosts = {}
+
+        if PyFunceble.CONFIGURATION["verify_ssl_certificate"]:
+            # We have to verify the certificates.
+
+            # We get the default context.
+            self.ssl_context = ssl.create_default_context()
+        else:
+            # We do not have to verify the certificates.
+
+            # We get a context which accepts everything.
+            self.ssl_context = ssl.create_default_context()
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        if PyFunceble.CONFIGURATION["user_agent"]:
+            # The user-agent is given.
+
+            # We share it.
+            self.user_agent = PyFunceble.CONFIGURATION["user_agent"]
+        else:
+            # The user-agent is not given or is empty.
+
+            # We do not send any.
+            self.user_agent = None
+
+    @classmethod
+    def parse_url(cls, url):
+        """
+        Split the given URL into what we need to request it.
+
+        :param str url: The URL to work with.
+
+        :return:
+            A dict with the following indexes.
+
+            ::
+
+                {
+                    "scheme": "https",
+                    "host": "example.org",
+                    "port": 443,
+                    "target": "/hello?world",
+                    "host_header": "example.org"
+                }
+
+        :rtype: dict
+
+        :raise ValueError: When the URL can't be requested.
+        """
+
+        # We split the URL.
+        parsed = urlsplit(url)
+        scheme = parsed.scheme.lower()
+
+        if scheme not in ["http", "https"] or not parsed.hostname:
+            # We can't request the URL.
+
+            raise ValueError("Unsupported URL: {0}".format(url))
+
+        # We get the path and query of the URL.
+        target = parsed.path or "/"
+
+        if parsed.query:
+            target += "?" + parsed.query
+
+        # We get the host (and port) to announce.
+        host_header = parsed.netloc.rsplit("@", 1)[-1]
+
+        try:
+            host_header.encode("ascii")
+        except UnicodeError:
+            # The host is internationalized.
+
+            # We convert it to IDNA.
+            host_header = host_header.encode("idna").decode("ascii")
+
+        return {
+            "scheme": scheme,
+            "host": parsed.hostname,
+            "port": parsed.port or (443 if scheme == "https" else 80),
+            "target": PyFunceble.requests.utils.requote_uri(target),
+            "host_header": host_header,
+        }
+
+    def get_request(self, target, host_header):
+        """
+        Encode the request of the given target.
+
+        :param str target: The path (and query) to request.
+        :param str host_header: The value of the :code:`Host` header.
+
+        :rtype: bytes
+        """
+
+        # We initiate the lines of the request.
+        lines = [
+            "HEAD {0} HTTP/1.1".format(target),
+            "Host: {0}".format(host_header),
+            "Accept: */*",
+            "Connection: close",
+        ]
+
+        if self.user_agent:
+            # A user-agent is given.
+
+            # We send it.
+            lines.append("User-Agent: {0}".format(self.user_agent))
+
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    @classmethod
+    def parse_status_line(cls, line):
+        """
+        Decode the given status line.
+
+        :param bytes line: The first line of the response.
+
+        :return: The status code.
+        :rtype: int
+
+        :raise ValueError: When the status line is malformed.
+        """
+
+        # We split the status line.
+        parts = line.split(None, 2)
+
+        if len(parts) < 2 or not parts[0].startswith(b"HTTP/") or len(parts[1]) != 3:
+            # The status line is malformed.
+
+            raise ValueError("Malformed status line: {0}".format(line))
+
+        return int(parts[1])
+
+    async def __request(self, url):
+        """
+        Request the given URL.
+
+        :param dict url: The parsed URL to request.
+
+        :return: The status code.
+        :rtype: int
+        """
+
+        if url["scheme"] == "https":
+            # We have to communicate over TLS.
+
+            options = {"ssl": self.ssl_context, "server_hostname": url["host"]}
+        else:
+            options = {}
+
+        # We open the connection.
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(url["host"], url["port"], **options),
+            self.timeout,
+        )
+
+        try:
+            # We send the request.
+            writer.write(self.get_request(url["target"], url["host_header"]))
+
+            # We get the status code from the status line.
+            return self.parse_status_line(
+                await asyncio.wait_for(reader.readline(), self.timeout)
+            )
+        finally:
+            # We close the connection.
+            writer.close()
+
+    async def probe(self, url):
+        """
+        Get the HTTP status code of the given URL.
+
+        :param str url: The URL we are working with.
+
+        :return: The (unformatted) status code.
+        :rtype: int|None
+        """
+
+        try:
+            # We parse the URL.
+            parsed = self.parse_url(url)
+        except ValueError:
+            return None
+
+        if self.semaphore is None:
+            # We are sending our first request.
+
+            # We initiate the global limit.
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+
+        # We get the limit of the host.
+        host = parsed["host"].lower()
+
+        if host not in self.hosts:
+            self.hosts[host] = [asyncio.Semaphore(self.host_concurrency), 0]
+
+        self.hosts[host][1] += 1
+
+        try:
+            # We wait until the host is free, then until we are allowed to
+            # send another request.
+            # Note: We take the host first so that the requests waiting for a
+            # busy host do not take the place of the others.
+            async with self.hosts[host][0], self.semaphore:
+                if HTTPHostCache.is_unreachable(url):
+                    # The host did not answer us lately.
+
+                    # We do not wait for it again.
+                    return None
+
+                # We get the status code.
+                http_code = await self.__request(parsed)
+
+                # We save that the host answered.
+                HTTPHostCache.add_success(url)
+
+                return http_code
+        except (asyncio.TimeoutError, OSError):
+            # The host did not answer.
+
+            # We save it.
+            HTTPHostCache.add_failure(url)
+
+            # We return None.
+            return None
+        except (ValueError, UnicodeError):
+            # If one of the listed exception is matched, that means that something
+            # went wrong and we were unable to extract the status code.
+
+            # We return None.
+            return None
+        finally:
+            self.hosts[host][1] -= 1
+
+            if not self.hosts[host][1]:
+                # Nobody else is waiting for the host.
+
+                # We forget its limit.
+                del self.hosts[host]
+
+    async def probe_many(self, urls):
+        """
+        Get the HTTP status code of the given URL.
+
+        :param urls: The URL we are working with.
+        :type urls: list|iterable
+
+        :return:
+            An asynchronous iterator of :code:`(url, http_status_code)` in the
+            order of the responses.
+            :code:`http_status_code` is formatted like
+            :func:`~PyFunceble.http_code.HTTPCode.get` does.
+        """
+
+        # We initiate the queue of results.
+        # Note: It is bounded so that a slow consumer slows us down.
+        results = asyncio.Queue(maxsize=self.concurrency)
+        # We initiate the number of URL which are allowed to wait at once.
+        # Note: The URL waiting for a busy host are counted too.
+        waiting = asyncio.Semaphore(self.concurrency * 4)
+        # We initiate the list of running requests.
+        tasks = set()
+
+        async def request(url):
+            try:
+                # We get and format the status code of the URL.
+                await results.put(
+                    (url, HTTPCode.format_status_code(await self.probe(url)))
+                )
+            finally:
+                waiting.release()
+
+        async def dispatch():
+            try:
+                for url in urls:
+                    # We loop through the URL.
+
+                    # We wait until we are allowed to handle another URL.
+                    await waiting.acquire()
+
+                    # We request the URL in the background.
+                    task = asyncio.ensure_future(request(url))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+
+                if tasks:
+                    # There are running requests.
+
+                    # We wait for them.
+                    await asyncio.wait(set(tasks))
+            finally:
+                # We inform the consumer that we are done.
+                await results.put(None)
+
+        # We start dispatching the URL.
+        dispatcher = asyncio.ensure_future(dispatch())
+
+        try:
+            while True:
+                # We get the next result.
+                result = await results.get()
+
+                if result is None:
+                    # Every URL was requested.
+
+                    # We raise what went wrong while dispatching (if any).
+                    await dispatcher
+
+                    # We break the loop.
+                    break
+
+                yield result
+        finally:
+            for task in [dispatcher] + list(tasks):
+                # We loop through what is still running.
+
+                # And we cancel it.
+                task.cancel()
+
+
+async def probe_many(urls, **kwargs):
+    """
+    Get the HTTP status code of the given URL.
+
+    :param urls: The URL we are working with.
+    :type urls: list|iterable
+
+    :return: An asynchronous iterator of :code:`(url, http_status_code)`.
+
+    .. note::
+        The other given arguments are given to :class:`~PyFunceble.http_prober.HTTPProber`.
+
+    ::
+
+        async for url, http_status_code in probe_many(["https://example.org"]):
+            print(url, http_status_code)
+    """
+
+    async for result in HTTPProber(**kwargs).probe_many(urls):
+        yield result
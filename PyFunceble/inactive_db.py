@@ -60,6 +60,7 @@ License:
 """
 # pylint: enable=line-too-long
 
+from bisect import bisect_right, insort
 from hashlib import sha256
 
 import PyFunceble
@@ -73,10 +74,6 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
     :param str filename: The name of the file we are processing.
     """
 
-    # We initiate a variable which will save the
-    # cache about who are present or not into the database.
-    is_present_cache = {}
-
     # Saves the whole database content.
     database = {}
 
@@ -113,6 +110,17 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
         self.table_name = self.get_table_name()
 
+        # We initiate the index of the subjects.
+        # Note: It's a subject -> timestamp dict.
+        self.index = {}
+        # We initiate the sorted list of timestamps.
+        self.timestamps = []
+        # We initiate the database the index was built from.
+        self.indexed = None
+
+        # We initiate the last time we saved the database.
+        self.last_save = 0
+
         # We initiate the database.
         self.initiate()
 
@@ -121,21 +129,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             # We are authorized to operate.
 
             if PyFunceble.CONFIGURATION["db_type"] == "json":
-                if subject not in self.is_present_cache:
-                    for element in [
-                        x for x in self.database[self.filename].keys() if x.isdigit()
-                    ]:
-                        if subject in self[element]:
-                            self.is_present_cache[subject] = True
-                            break
-                        else:  # pragma: no cover
-                            self.is_present_cache[subject] = False
-                            continue
-
-                    if subject not in self.is_present_cache:
-                        self.is_present_cache[subject] = False
-
-                return self.is_present_cache[subject]
+                return subject in self.get_index()
 
             if PyFunceble.CONFIGURATION["db_type"] == "sqlite":
                 query = (
@@ -144,15 +138,9 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                     "WHERE subject = :subject AND file_path = :file"
                 ).format(self.table_name)
 
-                try:
-                    output = self.sqlite_db.cursor.execute(
-                        query, {"subject": subject, "file": self.filename}
-                    )
-                except self.sqlite_db.locked_errors:
-                    PyFunceble.sleep(0.3)
-                    output = self.sqlite_db.cursor.execute(
-                        query, {"subject": subject, "file": self.filename}
-                    )
+                output = self.sqlite_db.cursor.execute(
+                    query, {"subject": subject, "file": self.filename}
+                )
                 fetched = output.fetchone()
 
                 return fetched[0] != 0
@@ -218,6 +206,55 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
         return PyFunceble.CONFIGURATION["inactive_database"]
 
+    def get_index(self):
+        """
+        Provide the index of the subjects of the currently tested file.
+
+        :return: A subject -> timestamp dict.
+        :rtype: dict
+
+        .. note::
+            The index (and the sorted list of timestamps) is rebuilt
+            only if the database was replaced.
+        """
+
+        if self.indexed is not self.database:
+            # The database was replaced since the last indexation.
+
+            # We initiate the index.
+            self.index = {}
+
+            if self.filename in self.database:
+                # The currently tested file is into the database.
+
+                # We get the timestamps of the currently tested file.
+                timestamps = [
+                    x for x in self.database[self.filename].keys() if x.isdigit()
+                ]
+
+                for timestamp in sorted(timestamps, key=int):
+                    # We loop through the timestamps from the oldest.
+
+                    for subject in self.database[self.filename][timestamp]:
+                        # We loop through the subjects of the currently
+                        # read timestamp.
+
+                        # And we index them.
+                        self.index[subject] = timestamp
+
+                # We save the sorted list of timestamps.
+                self.timestamps = sorted(int(x) for x in timestamps)
+            else:
+                # The currently tested file is not into the database.
+
+                # We empty the sorted list of timestamps.
+                self.timestamps = []
+
+            # And we save the database we indexed.
+            self.indexed = self.database
+
+        return self.index
+
     def get_table_name(self):
         """
         Return the name of the table to use.
@@ -308,6 +345,9 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 # We initiate an empty database.
                 self.database = {self.filename: {}}
 
+            # We force the indexation of the loaded database.
+            self.indexed = None
+
     def save(self):
         """
         Save the current database into the database file.
@@ -319,6 +359,24 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             # We save the current database state into the database file.
             Dict(self.database).to_json(self.database_file)
 
+            # We save the time we saved the database.
+            self.last_save = PyFunceble.time()
+
+    def save_behind(self):
+        """
+        Save the current database into the database file if the
+        flush interval is exceeded.
+        """
+
+        if (
+            PyFunceble.time() - self.last_save
+            >= PyFunceble.CONFIGURATION["inactive_database_flush_interval"]
+        ):
+            # The last save is older than the flush interval.
+
+            # We save the database.
+            self.save()
+
     def initiate(self):
         """
         Initiate the databse.
@@ -362,16 +420,14 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 # The file we are testing is into the database and its content
                 # is not empty.
 
-                # We get the indexes of the current file (in the dabase).
-                database_keys = [
-                    x for x in self.database[self.filename].keys() if x.isdigit()
-                ]
+                # We get the (indexed) timestamps of the current file.
+                self.get_index()
 
-                if database_keys:
-                    # The list of keys is not empty.
+                if self.timestamps:
+                    # The list of timestamps is not empty.
 
                     # We get the most recent date.
-                    recent_date = max(database_keys)
+                    recent_date = self.timestamps[-1]
                 else:  # pragma: no cover
                     # The list of keys is empty.
 
@@ -414,43 +470,57 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 timestamp = str(self._timestamp())
 
                 if self.filename in self.database:
+                    # * The file path is into the database.
+
+                    self.__remove_json(subject)
+                else:
                     # * The file path is not into the database.
 
-                    self.remove(subject)
+                    # We initiate the file path into the database.
+                    self.database[self.filename] = {}
+
+                # We get the (up to date) index.
+                index = self.get_index()
+
+                if timestamp not in self.database[self.filename]:
+                    # The timestamp is not into the database.
 
-                # We initiate the file path and its content into the database.
-                self[timestamp] = {subject: status}
+                    # We initiate it.
+                    self.database[self.filename][timestamp] = {}
 
-                # And we save the database.
-                self.save()
+                    # And we append it to the sorted list of timestamps.
+                    insort(self.timestamps, int(timestamp))
+
+                if isinstance(self.database[self.filename][timestamp], dict):
+                    # The content of the timestamp is in the expected format.
+
+                    # We add the subject into it.
+                    self.database[self.filename][timestamp][subject] = status
+                else:  # pragma: no cover
+                    # The content of the timestamp is in an old format.
+
+                    # We let the merging logic do the job.
+                    self[timestamp] = {subject: status}
+
+                # We index the subject.
+                index[subject] = timestamp
+
+                # And we save the database if needed.
+                self.save_behind()
             elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
-                query = (
-                    "INSERT INTO {0} "
-                    "(file_path, subject, status) "
-                    "VALUES (:file, :subject, :status)"
-                ).format(self.table_name)
+                queries = self.sqlite_db.get_upsert_queries(
+                    self.table_name,
+                    {"file_path": "file", "subject": "subject", "status": "status"},
+                    ["file_path", "subject"],
+                    update=["status"],
+                )
 
-                try:
+                for query in queries:
                     # We execute the query.
-                    self.sqlite_db.cursor.execute(
+                    self.sqlite_db.execute(
                         query,
                         {"file": self.filename, "subject": subject, "status": status},
                     )
-                except self.sqlite_db.errors:
-                    query = (
-                        "UPDATE {0} "
-                        "SET subject = :subject, status = :status "
-                        "WHERE file_path = :file AND subject = :subject"
-                    ).format(self.table_name)
-
-                    # We execute the query.
-                    self.sqlite_db.cursor.execute(
-                        query,
-                        {"subject": subject, "file": self.filename, "status": status},
-                    )
-
-                # And we commit the changes.
-                self.sqlite_db.connection.commit()
             elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
                 digest = sha256(bytes(self.filename + subject, "utf-8")).hexdigest()
 
@@ -502,16 +572,11 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
             # We are authorized to operate.
 
             if PyFunceble.CONFIGURATION["db_type"] == "json":
-                for data in self.database[self.filename]:
-                    # We loop through the index of the file database.
-
-                    if subject in self[data]:
-                        # The currently tested element into the currently read index.
-
-                        self[data] = Dict(self[data]).remove_key(subject)
+                # We remove the subject.
+                self.__remove_json(subject)
 
-                # And we save the data into the database.
-                self.save()
+                # And we save the database if needed.
+                self.save_behind()
             elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
                 # We construct the query we are going to execute.
                 query = (
@@ -521,11 +586,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 ).format(self.table_name)
 
                 # We execute it.
-                self.sqlite_db.cursor.execute(
-                    query, {"file": self.filename, "subject": subject}
-                )
-                # We commit everything.
-                self.sqlite_db.connection.commit()
+                self.sqlite_db.execute(query, {"file": self.filename, "subject": subject})
             elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
                 # We construct the query we are going to execute.
                 query = (
@@ -537,6 +598,77 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
                 with self.mysql_db.get_connection() as cursor:
                     cursor.execute(query, {"file": self.filename, "subject": subject})
 
+    def __remove_json(self, subject):
+        """
+        Remove the given subject from the JSON database and its index.
+
+        :param str subject: The subject we are working with.
+        """
+
+        # We get the (up to date) index.
+        index = self.get_index()
+
+        if subject in index:
+            # The subject is indexed.
+
+            # We get and remove its timestamp from the index.
+            timestamp = index.pop(subject)
+
+            if (
+                self.filename in self.database
+                and timestamp in self.database[self.filename]
+            ):
+                # The timestamp is still into the database.
+
+                if isinstance(self.database[self.filename][timestamp], dict):
+                    # The content of the timestamp is in the expected format.
+
+                    # We remove the subject.
+                    self.database[self.filename][timestamp].pop(subject, None)
+                else:  # pragma: no cover
+                    # The content of the timestamp is in an old format.
+
+                    # We remove the subject.
+                    self[timestamp] = Dict(self[timestamp]).remove_key(subject)
+
+    def __get_subjects_by_time(self, retest):
+        """
+        Provide the subjects of the currently tested file, split by their
+        retest due date.
+
+        :param bool retest:
+            Tell us if we want the subjects to retest (:code:`True`) or
+            the subjects which do not have to be retested yet (:code:`False`).
+
+        :rtype: set
+        """
+
+        # We get the (up to date) index.
+        self.get_index()
+
+        # We get the position of the first timestamp which is not due.
+        position = bisect_right(
+            self.timestamps, int(PyFunceble.time()) - self.days_in_seconds
+        )
+
+        if retest:
+            # We want the subjects to retest.
+
+            # We get the due timestamps.
+            timestamps = self.timestamps[:position]
+        else:
+            # We want the subjects which do not have to be retested.
+
+            # We get the not due timestamps.
+            timestamps = self.timestamps[position:]
+
+        return {
+            subject
+            for timestamp in timestamps
+            if str(timestamp) in self.database[self.filename]
+            for subject in self.database[self.filename][str(timestamp)]
+        }
+
     def get_to_retest(self):  # pylint: pragma: no cover
         """
         Return a set of subject to restest.
@@ -544,16 +676,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
         if self.authorized:
             if PyFunceble.CONFIGURATION["db_type"] == "json":
-                try:
-                    return {
-                        z
-                        for x, y in self.database[self.filename].items()
-                        if x.isdigit()
-                        and int(PyFunceble.time()) > int(x) + self.days_in_seconds
-                        for z in y.keys()
-                    }
-                except KeyError:
-                    return set()
+                return self.__get_subjects_by_time(retest=True)
 
             if PyFunceble.CONFIGURATION["db_type"] == "sqlite":
                 query = (
@@ -599,16 +722,7 @@ class InactiveDB:  # pylint: disable=too-many-instance-attributes
 
         if self.authorized:
             if PyFunceble.CONFIGURATION["db_type"] == "json":
-                try:
-                    return {
-                        z
-                        for x, y in self.database[self.filename].items()
-                        if x.isdigit()
-                        and int(PyFunceble.time()) < int(x) + self.days_in_seconds
-                        for z in y.keys()
-                    }
-                except KeyError:
-                    return set()
+                return self.__get_subjects_by_time(retest=False)
 
             if PyFunceble.CONFIGURATION["db_type"] == "sqlite":
                 query = (
@@ -61,10 +61,9 @@ License:
 from hashlib import sha256
 
 # pylint: enable=line-too-long
-import urllib3.exceptions as urllib3_exceptions
-
 import PyFunceble
 from PyFunceble.helpers import Dict, File
+from PyFunceble.http_code import HTTPRedirects
 
 
 class Mining:  # pylint: disable=too-many-instance-attributes
@@ -174,23 +173,17 @@ class Mining:  # pylint: disable=too-many-instance-attributes
 
                     self.database[self.filename][index] = value
             elif PyFunceble.CONFIGURATION["db_type"] == "sqlite":
-                query = (
-                    "INSERT INTO {0} "
-                    "(file_path, subject, mined) "
-                    "VALUES (:file, :subject, :mined)"
-                ).format(self.table_name)
+                (query,) = self.sqlite_db.get_upsert_queries(
+                    self.table_name,
+                    {"file_path": "file", "subject": "subject", "mined": "mined"},
+                    ["file_path", "subject", "mined"],
+                )
 
                 for val in value:
-                    try:
-                        # We execute the query.
-                        self.sqlite_db.cursor.execute(
-                            query,
-                            {"file": self.filename, "subject": index, "mined": val},
-                        )
-                        # And we commit the changes.
-                        self.sqlite_db.connection.commit()
-                    except self.sqlite_db.errors:
-                        pass
+                    # We execute the query.
+                    self.sqlite_db.execute(
+                        query, {"file": self.filename, "subject": index, "mined": val}
+                    )
             elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
                 query = (
                     "INSERT INTO {0} "
@@ -199,11 +192,11 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                 ).format(self.table_name)
 
                 with self.mysql_db.get_connection() as cursor:
-                    digest = sha256(
-                        bytes(self.filename + index + val, "utf-8")
-                    ).hexdigest()
-
                     for val in value:
+                        digest = sha256(
+                            bytes(self.filename + index + val, "utf-8")
+                        ).hexdigest()
+
                         try:
                             cursor.execute(
                                 query,
@@ -232,11 +225,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                 ).format(self.table_name)
 
                 # We execute the query.
-                self.sqlite_db.cursor.execute(
-                    query, {"file": self.filename, "subject": index}
-                )
-                # And we commit the changes.
-                self.sqlite_db.connection.commit()
+                self.sqlite_db.execute(query, {"file": self.filename, "subject": index})
             elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
                 query = (
                     "DELETE FROM {0} "
@@ -256,7 +245,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
         return PyFunceble.CONFIGURATION["mining"]
 
     @classmethod
-    def get_history(cls, url):  # pragma: no cover
+    def get_history(cls, url):
         """
         Get the history of the given url.
 
@@ -264,23 +253,12 @@ class Mining:  # pylint: disable=too-many-instance-attributes
 
         :return: The list of links.
         :rtype: list
+
+        .. note::
+            See :func:`~PyFunceble.http_code.HTTPRedirects.walk`.
         """
 
-        try:
-            return PyFunceble.requests.get(
-                url,
-                timeout=PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
-                headers=cls.headers,
-            ).history
-        except (
-            PyFunceble.requests.ConnectionError,
-            PyFunceble.requests.exceptions.Timeout,
-            PyFunceble.requests.exceptions.InvalidURL,
-            PyFunceble.socket.timeout,
-            urllib3_exceptions.InvalidHeader,
-            UnicodeDecodeError,  # The probability that this happend in production is minimal.
-        ):
-            return []
+        return HTTPRedirects.walk(url, headers=cls.headers)
 
     def get_table_name(self):
         """
@@ -376,10 +354,9 @@ class Mining:  # pylint: disable=too-many-instance-attributes
             # We save the database into the file.
             Dict(self.database).to_json(self.database_file)
 
-    def mine(self, subject, subject_type):  # pragma: no cover
+    def get_mined(self, subject, subject_type):
         """
         Search for domain or URL related to the original URL or domain.
-        If some are found, we add them into the database.
 
         :param str subject: The subject we are working with.
 
@@ -391,8 +368,17 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                 - :code:`url`
 
                 - :code:`domain`
+
+        :return: The list of mined domains or URL.
+        :rtype: list
+
+        .. note::
+            Nothing is saved into the database, we only call the subject.
         """
 
+        # We initiate a variable which will save the result.
+        result = []
+
         if self.authorized and not self[subject]:
             # We are authorized to operate.
 
@@ -405,13 +391,9 @@ class Mining:  # pylint: disable=too-many-instance-attributes
 
             history = self.get_history(to_get)
 
-            for element in history:
+            for url in history:
                 # We loop through the list of requests history.
 
-                # We get the url from the currently read
-                # request.
-                url = element.url
-
                 # We create a variable which will save the
                 # local result.
                 local_result = None
@@ -451,12 +433,54 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                         # The local result is differnt from the
                         # subject we are working with.
 
-                        # We save into the database.
-                        self[subject] = [local_result]
+                        # We append it to the result.
+                        result.append(local_result)
+
+        # We return the result.
+        return result
+
+    def add(self, subject, mined):
+        """
+        Add the given list of mined domains or URL into the database.
+
+        :param str subject: The subject we are working with.
+        :param list mined: The list of mined domains or URL.
+        """
+
+        if self.authorized and mined:
+            # * We are authorized to operate.
+            # and
+            # * There is something to save.
+
+            for element in mined:
+                # We loop through the list of mined elements.
+
+                # We save into the database.
+                self[subject] = [element]
 
             # We save the database.
             self.save()
 
+    def mine(self, subject, subject_type):  # pragma: no cover
+        """
+        Search for domain or URL related to the original URL or domain.
+        If some are found, we add them into the database.
+
+        :param str subject: The subject we are working with.
+
+        :param str subject_typ:
+            The type of the subject.
+
+            Can me one of the following:
+
+                - :code:`url`
+
+                - :code:`domain`
+        """
+
+        # We get and save the mined domains or URL.
+        self.add(subject, self.get_mined(subject, subject_type))
+
     def remove(self, subject, history_member):
         """
         Remove the given subject from the database assigned to the
@@ -487,7 +511,7 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                         ).format(self.table_name)
 
                         # We execute the query.
-                        self.sqlite_db.cursor.execute(
+                        self.sqlite_db.execute(
                             query,
                             {
                                 "file": self.filename,
@@ -495,8 +519,6 @@ class Mining:  # pylint: disable=too-many-instance-attributes
                                 "mined": history_member,
                             },
                         )
-                        # And we commit the changes.
-                        self.sqlite_db.connection.commit()
                     elif PyFunceble.CONFIGURATION["db_type"] in ["mariadb", "mysql"]:
                         # We construct the query string.
                         query = (
@@ -60,6 +60,9 @@ License:
 """
 # pylint: enable=line-too-long
 from getpass import getpass
+from os import getpid
+from queue import Empty, LifoQueue
+from threading import Lock
 
 import pymysql
 
@@ -67,9 +70,55 @@ import PyFunceble
 from PyFunceble.helpers import File, Regex
 
 
+class PooledConnection:
+    """
+    Provide a connection borrowed from our pool of connections.
+
+    :param mysql_db: The MySQL instance which manage the pool.
+    :type mysql_db: :class:`~PyFunceble.mysql.MySQL`
+
+    .. note::
+        While used as a context manager, this class gives a cursor
+        and gives the connection back to the pool on exit.
+    """
+
+    def __init__(self, mysql_db):
+        self.mysql_db = mysql_db
+
+        self.connection = None
+        self.cursor = None
+
+    def __enter__(self):
+        # We borrow a connection.
+        self.connection = self.mysql_db.acquire()
+        # We get a cursor from it.
+        self.cursor = self.connection.cursor()
+
+        return self.cursor
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        # We close the cursor.
+        self.cursor.close()
+
+        # And we give the connection back.
+        # Note: A connection which raised a connection related error
+        # is not given back.
+        self.mysql_db.release(
+            self.connection, broken=isinstance(exc_value, self.mysql_db.broken_errors)
+        )
+
+        self.connection = None
+        self.cursor = None
+
+
 class MySQL:
     """
     Provide our way to work with our sqlite database.
+
+    .. note::
+        The connections are kept into a pool which is shared by all
+        subsystems. Use :func:`~PyFunceble.mysql.MySQL.get_connection`
+        as a context manager to get a cursor from it.
     """
 
     variables = {
@@ -83,12 +132,18 @@ class MySQL:
 
     tables = {
         "auto_continue": "pyfunceble_auto_continue",
+        "dns": "pyfunceble_dns",
         "inactive": "pyfunceble_inactive",
         "mining": "pyfunceble_mining",
         "whois": "pyfunceble_whois",
     }
 
     errors = pymysql.err.IntegrityError
+    broken_errors = (pymysql.err.OperationalError, pymysql.err.InterfaceError)
+
+    # Save the number of seconds a connection can stay idle before
+    # we check its health.
+    health_check_interval = 30
 
     def __init__(self):
         self.authorized = self.authorization()
@@ -96,9 +151,19 @@ class MySQL:
         pyfunceble_env_location = PyFunceble.CONFIG_DIRECTORY + PyFunceble.ENV_FILENAME
         self.env_content = self.parse_env_file(pyfunceble_env_location)
 
+        # We initiate the pool of idle connections and the process it belongs to.
+        self.pool = {"connections": LifoQueue(), "pid": getpid()}
+        # We initiate the lock which protect the pool initiation.
+        self.pool_lock = Lock()
+
+        # We initiate the single writer of the database.
+        # Note: It is only set while testing with multiple processes.
+        self.writer = None
+
         if self.authorized:
             self.initiated = False
-            self.connection = self.get_connection()
+            # We create the first connection of our pool.
+            self.release(self.connect())
 
             self.save_to_env_file(self.env_content, pyfunceble_env_location)
 
@@ -229,9 +294,163 @@ class MySQL:
 
         file_instance.write(content, overwrite=True)
 
+    @classmethod
+    def get_pool_size(cls):
+        """
+        Provide the maximal number of idle connections to keep.
+
+        .. note::
+            It is sized to the number of workers which may query the
+            database at the same time. More connections are created
+            if needed, but they are closed once given back.
+        """
+
+        if PyFunceble.CONFIGURATION["asynchronous"]:
+            # We are testing asynchronously.
+
+            # Each thread of the executor and the main thread may need one.
+            return PyFunceble.CONFIGURATION["concurrency"] + 1
+
+        # Only the current thread queries the database.
+        return 1
+
+    def acquire(self):
+        """
+        Borrow a connection from the pool.
+
+        :return: A healthy connection.
+        :rtype: pymysql.connections.Connection
+        """
+
+        with self.pool_lock:
+            if self.pool["pid"] != getpid():
+                # The pool was created by the parent process.
+
+                # We start a new one as the connections can't be
+                # shared between processes.
+                self.pool = {"connections": LifoQueue(), "pid": getpid()}
+
+        try:
+            # We get the most recently used connection.
+            connection, released_at = self.pool["connections"].get_nowait()
+        except Empty:
+            # There is no idle connection.
+
+            # We create a new one.
+            return self.connect()
+
+        if PyFunceble.time() - released_at >= self.health_check_interval:
+            # The connection was idle for a while.
+
+            # We check its health and reconnect if needed.
+            connection.ping(reconnect=True)
+
+        return connection
+
+    def release(self, connection, broken=False):
+        """
+        Give back the given connection to the pool.
+
+        :param connection: The connection to give back.
+        :type connection: pymysql.connections.Connection
+        :param bool broken: Tell us if the connection raised a connection related error.
+        """
+
+        if (
+            broken
+            or self.pool["pid"] != getpid()
+            or self.pool["connections"].qsize() >= self.get_pool_size()
+        ):
+            # * The connection is broken.
+            # or
+            # * The connection is not from the current process.
+            # or
+            # * We already have enough idle connections.
+
+            try:
+                # We close it.
+                connection.close()
+            except pymysql.err.Error:  # pragma: no cover
+                pass
+        else:
+            # We put it back into the pool.
+            self.pool["connections"].put((connection, PyFunceble.time()))
+
+    def close(self):
+        """
+        Close all idle connections of the pool.
+        """
+
+        while True:
+            try:
+                # We get the next idle connection.
+                connection, _ = self.pool["connections"].get_nowait()
+            except Empty:
+                # There is no idle connection anymore.
+
+                # We break the loop.
+                break
+
+            try:
+                # We close the connection.
+                connection.close()
+            except pymysql.err.Error:  # pragma: no cover
+                pass
+
+    def execute(self, query, data=None):
+        """
+        Execute the given write query.
+
+        :param str query: The query to execute.
+        :param dict data: The data to give to the query.
+
+        .. note::
+            The integrity errors (duplicate entries) are ignored.
+        """
+
+        if data is None:
+            data = {}
+
+        if self.writer is not None and self.writer.is_remote():
+            # Our writes are applied by the single writer.
+
+            # We send it the query.
+            self.writer.send(query, data)
+            return
+
+        with self.get_connection() as cursor:
+            try:
+                # We execute the query.
+                cursor.execute(query, data)
+            except self.errors:
+                pass
+
+    def commit(self):
+        """
+        Commit the current transaction.
+
+        .. note::
+            Our connections are in autocommit mode, there is nothing to do.
+        """
+
     def get_connection(self):
         """
-        Provide the connection to the database.
+        Provide a connection from our pool.
+
+        :rtype: :class:`~PyFunceble.mysql.PooledConnection`
+
+        .. note::
+            Use it as a context manager, it gives you a cursor.
+        """
+
+        if self.authorized:
+            return PooledConnection(self)
+
+        return None
+
+    def connect(self):
+        """
+        Provide a new connection to the database.
         """
 
         if self.authorized:
@@ -282,7 +501,7 @@ class MySQL:
 
         if self.authorized:
             for _, table_name in self.tables.items():
-                with self.connection.cursor() as cursor:
+                with self.get_connection() as cursor:
                     query = (
                         "SELECT COUNT(*) "
                         "FROM information_schema.tables "
@@ -310,6 +529,6 @@ class MySQL:
         """
 
         if self.authorized:
-            with self.connection.cursor() as cursor:
+            with self.get_connection() as cursor:
                 for statement in self.parse_mysql_sql_file():
                     cursor.execute(statement)
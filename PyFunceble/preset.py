@@ -226,6 +226,15 @@ class Preset:
         if PyFunceble.CONFIGURATION["maximal_processes"] < 1:
             PyFunceble.CONFIGURATION["maximal_processes"] = 1
 
+    @classmethod
+    def concurrency(cls):  # pragma: no cover
+        """
+        Ensure that the concurrency is alway >= 1.
+        """
+
+        if PyFunceble.CONFIGURATION["concurrency"] < 1:
+            PyFunceble.CONFIGURATION["concurrency"] = 1
+
     def simple_domain(self):  # pragma: no cover
         """
         Prepare the global configuration for a domain
@@ -290,3 +299,13 @@ class Preset:
             should_be_enabled = ["auto_continue", "whois_database"]
 
             self.enable(should_be_enabled)
+
+    def asynchronous(self):  # pragma: no cover
+        """
+        Prepare the global configuration for an asynchronous test.
+        """
+
+        if PyFunceble.CONFIGURATION["asynchronous"]:
+            should_be_enabled = ["auto_continue", "whois_database"]
+
+            self.enable(should_be_enabled)
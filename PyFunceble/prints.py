@@ -668,7 +668,9 @@ class Prints:
                         colorified_data = self._colorify(data)
 
                         # And we print the data.
-                        print(colorified_data)
+                        # Note: The new line is part of the printed data so that
+                        # lines printed from multiple threads are not mixed.
+                        print(colorified_data + "\n", end="")
                 if not PyFunceble.CONFIGURATION["no_files"] and self.output:
                     # * We are authorized to print on any file.
                     # and
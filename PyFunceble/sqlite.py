@@ -60,6 +60,8 @@ License:
 """
 # pylint: enable=line-too-long
 import sqlite3
+from os import getpid
+from threading import RLock, local
 
 import PyFunceble
 from PyFunceble.helpers import File
@@ -68,6 +70,11 @@ from PyFunceble.helpers import File
 class SQLite:
     """
     Provide our way to work with our sqlite database.
+
+    .. note::
+        The writes are grouped into transactions which are committed
+        every :code:`sqlite_batch_size` writes or every
+        :code:`sqlite_batch_interval` milliseconds.
     """
 
     errors = sqlite3.IntegrityError
@@ -75,22 +82,102 @@ class SQLite:
 
     tables = {
         "auto_continue": "auto_continue",
+        "dns": "dns",
         "inactive": "inactive",
         "mining": "mining",
         "whois": "whois",
     }
 
+    # Save the pragmas we apply to every new connection.
+    pragmas = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "cache_size": -16000,
+    }
+
+    # Save the number of seconds to wait for a lock before giving up.
+    timeout = 30
+
+    # Save the first version of SQLite which understands the
+    # INSERT ... ON CONFLICT ... DO UPDATE/NOTHING statements.
+    upsert_version = (3, 24, 0)
+
     def __init__(self):
         self.authorized = self.authorization()
 
-        if self.authorized:
-            self.connection = self.get_connection()
-            self.connection.row_factory = sqlite3.Row
-            self.cursor = self.connection.cursor()
+        # We initiate the storage of the cursor of each thread.
+        self.local = local()
+        # We initiate the lock which serialize the writes.
+        self.lock = RLock()
 
-            if self.is_empty():
+        # We initiate the shared connection.
+        self.__connection = None
+        # We initiate the process the shared connection belongs to.
+        self.__pid = None
+
+        # We initiate the state of the current batch of writes.
+        # Note: pending is the number of writes which are not committed yet
+        # and last_commit is the last time we committed.
+        self.batch = {"pending": 0, "last_commit": PyFunceble.time()}
+
+        # We initiate the single writer of the database.
+        # Note: It is only set while testing with multiple processes.
+        self.writer = None
+
+        if self.authorized:
+            if self.is_empty() or not self.are_tables_present():
                 self.create_database()
 
+    @property
+    def connection(self):
+        """
+        Provide the connection of the current process.
+
+        .. note::
+            The connection is shared between the threads of a process
+            so that all writes go through the same transaction.
+            A new connection is created after a fork.
+
+        .. note::
+            The connection of a process which sends its writes to
+            the single writer is read-only.
+        """
+
+        if self.__connection is None or self.__pid != getpid():
+            # The current process does not have a connection yet.
+
+            # We create it.
+            self.__connection = self.get_connection()
+            # We save the process it belongs to.
+            self.__pid = getpid()
+
+            # We reset the cursors as they belong to the old connection.
+            self.local = local()
+            # And we reset the number of pending writes.
+            self.batch["pending"] = 0
+
+        return self.__connection
+
+    @property
+    def cursor(self):
+        """
+        Provide the cursor of the current thread.
+        """
+
+        # We get the connection of the current process.
+        connection = self.connection
+
+        if getattr(self.local, "connection", None) is not connection:
+            # The current thread does not have a cursor yet.
+
+            # We create it.
+            self.local.cursor = connection.cursor()
+            # And we save the connection it belongs to.
+            self.local.connection = connection
+
+        return self.local.cursor
+
     @classmethod
     def authorization(cls):
         """
@@ -105,13 +192,209 @@ class SQLite:
         """
 
         if self.authorized:
-            return sqlite3.connect(
+            database_file = (
                 PyFunceble.CONFIG_DIRECTORY
                 + PyFunceble.OUTPUTS["default_files"]["sqlite"]
             )
 
+            if self.writer is not None and self.writer.is_remote():
+                # Our writes are applied by the single writer.
+
+                # We open a read-only connection.
+                connection = sqlite3.connect(
+                    "file:{0}?mode=ro".format(database_file),
+                    timeout=self.timeout,
+                    check_same_thread=False,
+                    uri=True,
+                )
+                connection.row_factory = sqlite3.Row
+
+                return connection
+
+            connection = sqlite3.connect(
+                database_file, timeout=self.timeout, check_same_thread=False
+            )
+            connection.row_factory = sqlite3.Row
+
+            for pragma, value in self.pragmas.items():
+                # We loop through the pragmas to apply.
+
+                # And we apply the currently read one.
+                connection.execute("PRAGMA {0} = {1}".format(pragma, value))
+
+            return connection
+
         return None
 
+    @classmethod
+    def get_upsert_queries(cls, table, columns, conflict, update=None):
+        """
+        Provide the queries which insert a new row or update the
+        given columns of the already existing row.
+
+        :param str table: The table to write into.
+        :param dict columns:
+            The columns to write.
+            Keys are the column names and values the name of their data.
+        :param list conflict: The columns which identify a row.
+        :param list update:
+            The columns to update if the row already exists.
+            If not given, we do not touch the already existing row.
+
+        :return: The queries to execute (in order) with the same data.
+        :rtype: list
+
+        .. note::
+            With SQLite older than 3.24.0, we insert the row if it does not
+            exist then we update it.
+        """
+
+        # We construct the insertion of the row.
+        insert = "INTO {0} ({1}) VALUES ({2})".format(
+            table,
+            ", ".join(columns),
+            ", ".join([":{0}".format(x) for x in columns.values()]),
+        )
+
+        if sqlite3.sqlite_version_info >= cls.upsert_version:
+            # SQLite understands the upserts.
+
+            if update:
+                # We have to update the already existing row.
+
+                action = "DO UPDATE SET {0}".format(
+                    ", ".join(["{0} = excluded.{0}".format(x) for x in update])
+                )
+            else:
+                # We do not touch the already existing row.
+
+                action = "DO NOTHING"
+
+            return [
+                "INSERT {0} ON CONFLICT({1}) {2}".format(
+                    insert, ", ".join(conflict), action
+                )
+            ]
+
+        # We insert the row if it does not exist.
+        queries = ["INSERT OR IGNORE {0}".format(insert)]
+
+        if update:
+            # We have to update the already existing row.
+
+            # We update it.
+            queries.append(
+                "UPDATE {0} SET {1} WHERE {2}".format(
+                    table,
+                    ", ".join(["{0} = :{1}".format(x, columns[x]) for x in update]),
+                    " AND ".join(
+                        ["{0} = :{1}".format(x, columns[x]) for x in conflict]
+                    ),
+                )
+            )
+
+        return queries
+
+    def execute(self, query, data=None):
+        """
+        Execute the given write query as part of the current transaction.
+
+        :param str query: The query to execute.
+        :param dict data: The data to give to the query.
+
+        .. note::
+            The transaction is committed every :code:`sqlite_batch_size`
+            writes or every :code:`sqlite_batch_interval` milliseconds.
+        """
+
+        if data is None:
+            data = {}
+
+        if self.writer is not None and self.writer.is_remote():
+            # Our writes are applied by the single writer.
+
+            # We send it the query.
+            self.writer.send(query, data)
+            return
+
+        with self.lock:
+            # We execute the query.
+            self.cursor.execute(query, data)
+
+            # We increase the number of pending writes.
+            self.batch["pending"] += 1
+
+            if (
+                self.batch["pending"] >= PyFunceble.CONFIGURATION["sqlite_batch_size"]
+                or (PyFunceble.time() - self.batch["last_commit"]) * 1000
+                >= PyFunceble.CONFIGURATION["sqlite_batch_interval"]
+            ):
+                # The batch is full or too old.
+
+                # We commit it.
+                self.commit()
+
+    def executemany(self, query, dataset):
+        """
+        Execute the given write query for each element of the given dataset
+        as part of the current transaction.
+
+        :param str query: The query to execute.
+        :param list dataset: A list of data to give to the query.
+        """
+
+        if self.writer is not None and self.writer.is_remote():
+            # Our writes are applied by the single writer.
+
+            for data in dataset:
+                # We loop through the dataset.
+
+                # And we send the query for the currently read data.
+                self.writer.send(query, data)
+            return
+
+        with self.lock:
+            # We execute the query.
+            self.cursor.executemany(query, dataset)
+
+            # And we commit the changes.
+            self.commit()
+
+    def commit(self):
+        """
+        Commit the current transaction.
+        """
+
+        with self.lock:
+            if self.authorized and self.connection.in_transaction:
+                # There is something to commit.
+
+                # We commit it.
+                self.connection.commit()
+
+            # We reset the number of pending writes.
+            self.batch["pending"] = 0
+            # And we save the time we committed.
+            self.batch["last_commit"] = PyFunceble.time()
+
+    def close(self):
+        """
+        Commit the current transaction and close the connection.
+        """
+
+        with self.lock:
+            if self.__connection is not None and self.__pid == getpid():
+                # The current process has a connection.
+
+                # We commit what is pending.
+                self.commit()
+
+                # We close the connection.
+                self.__connection.close()
+
+            # And we forget about the connection.
+            self.__connection = None
+
     def is_empty(self):
         """
         Check if our database is emtpy.
@@ -125,6 +408,20 @@ class SQLite:
                 return True
         return False
 
+    def are_tables_present(self):
+        """
+        Check if all our tables are present.
+        """
+
+        if self.authorized:
+            output = self.cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+            fetched = {x["name"] for x in output.fetchall()}
+
+            return set(self.tables.values()).issubset(fetched)
+        return True
+
     def create_database(self):
         """
         Create the tables of the database.
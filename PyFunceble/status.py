@@ -61,9 +61,9 @@ License:
 # pylint: enable=line-too-long
 import PyFunceble
 from PyFunceble.expiration_date import ExpirationDate
+from PyFunceble.extra_rules import ExtraRules
 from PyFunceble.generate import Generate
-from PyFunceble.helpers import Regex
-from PyFunceble.http_code import HTTPCode, urllib3_exceptions
+from PyFunceble.http_code import HTTPCode
 from PyFunceble.referer import Referer
 
 
@@ -89,8 +89,6 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
     :param str filename: The name of the file we are working with.
     """
 
-    output = {}
-
     def __init__(
         self,
         subject,
@@ -99,30 +97,50 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
         whois_db=None,
         inactive_db=None,
     ):  # pylint: disable=too-many-arguments
+        # We initiate the output of the current instance.
+        # Note: It is not shared between instances because
+        # several subjects may be tested at the same time.
+        self.output = {}
+
         self.subject = subject
         self.subject_type = subject_type.lower()
         self.filename = filename
 
         self.whois_db = whois_db
         self.inactive_db = inactive_db
-        self.checker = PyFunceble.Check(self.subject)
+
+        # We initiate what we already requested for the subject.
+        # Note: The DNS lookup interface is set once its request is done
+        # and the HTTP status code index tells us if we already asked for it.
+        self.requested = {"dns_lookup": None, "http_status_code": False}
 
     def get(self):
         """
         Get the status while testing for an IP or domain.
+
+        .. note::
+            The HTTP status code is only asked when the subject is registered
+            or when the extra rules need it.
+
+        .. note::
+            When :code:`dns_first` is activated, the WHOIS server is not
+            asked for the subjects which resolve.
         """
 
         if self.subject:
+            # We initiate the syntax checker of the subject.
+            checker = PyFunceble.Check(self.subject)
+
             self.output.update(
                 {
-                    "domain_syntax_validation": self.checker.is_domain(),
+                    "domain_syntax_validation": checker.is_domain(),
                     "expiration_date": None,
                     "http_status_code": "***",
-                    "ipv4_range_syntax_validation": self.checker.is_ipv4_range(),
-                    "ipv4_syntax_validation": self.checker.is_ipv4(),
-                    "subdomain_syntax_validation": self.checker.is_subdomain(),
+                    "ipv4_range_syntax_validation": checker.is_ipv4_range(),
+                    "ipv4_syntax_validation": checker.is_ipv4(),
+                    "subdomain_syntax_validation": checker.is_subdomain(),
                     "tested": self.subject,
-                    "url_syntax_validation": self.checker.is_url(),
+                    "url_syntax_validation": checker.is_url(),
                     "whois_server": Referer(self.subject).get(),
                 }
             )
@@ -131,11 +149,30 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
                 self.output["domain_syntax_validation"]
                 or self.output["ipv4_syntax_validation"]
             ):
-                self.output["http_status_code"] = HTTPCode(
-                    self.subject, self.subject_type
-                ).get()
+                if (
+                    not self.output["subdomain_syntax_validation"]
+                    and PyFunceble.CONFIGURATION["dns_first"]
+                    and self.resolves()
+                ):
+                    # * The subject is not a subdomain.
+                    # and
+                    # * We have to look the DNS up first.
+                    # and
+                    # * The subject resolves.
+
+                    if self.whois_db is not None:
+                        # We get the expiration date from the WHOIS database.
+                        # Note: The WHOIS server is not asked.
+                        self.output[
+                            "expiration_date"
+                        ] = self.whois_db.get_expiration_date(self.subject)
 
-                if not self.output["subdomain_syntax_validation"]:
+                    self.output["_status_source"] = "DNSLOOKUP"
+                    self.handle(
+                        status="inactive",
+                        ip_validation_status=self.output["ipv4_syntax_validation"],
+                    )
+                elif not self.output["subdomain_syntax_validation"]:
                     self.output["expiration_date"], self.output[
                         "whois_record"
                     ] = ExpirationDate(
@@ -145,6 +182,11 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
                     ).get()
 
                     if isinstance(self.output["expiration_date"], str):
+                        # The subject is registered.
+
+                        # We get the HTTP status code for the status file.
+                        self.get_http_status_code()
+
                         self.output["_status_source"] = self.output[
                             "status_source"
                         ] = "WHOIS"
@@ -188,495 +230,191 @@ class Status:  # pragma: no cover pylint: disable=too-few-public-methods
 
         raise ValueError("Subject should be given.")
 
-    def handle(self, status, ip_validation_status):
-        """
-        Handle the lack of WHOIS and expiration date. :smile_cat:
-
-        :param str matched_status: The status that we have to handle.
-
-        :param str ip_validation_status:
-            The IP syntax validation.
-
-        :return:
-            The status of the domain after generating the files desired
-            by the user.
-        :rtype: str
-        """
-
-        # We get the dns_lookup state.
-        self.output["dns_lookup"] = PyFunceble.DNSLookup(
-            self.subject, dns_server=PyFunceble.CONFIGURATION["dns_server"]
-        ).request()
-
-        if status.lower() not in PyFunceble.STATUS["list"]["invalid"]:
-            # The matched status is not in the list of invalid status.
-
-            if self.output["dns_lookup"]:
-                # We could execute the dns_lookup logic.
-
-                # We set the status we got.
-                self.output["_status"] = PyFunceble.STATUS["official"]["up"]
-            else:
-                # We could not get something.
-
-                # We set the status we got.
-                self.output["_status"] = PyFunceble.STATUS["official"]["down"]
-
-            # We get the status and source after extra rules check.
-            self.output["status"], self.output["status_source"] = ExtraRules(
-                self.subject, self.subject_type, self.output["http_status_code"]
-            ).handle(self.output["_status"], self.output["_status_source"])
-        else:
-            if self.output["dns_lookup"]:
-                # We could execute the dns_lookup logic.
-
-                # We set the status we got.
-                self.output["_status"] = PyFunceble.STATUS["official"]["up"]
-                # We set the status source.
-                self.output["_status_source"] = "DNSLOOKUP"
-
-            self.output["status"], self.output["status_source"] = (
-                self.output["_status"],
-                self.output["_status_source"],
-            )
-
-        # We generate the status file with the invalid status.
-        Generate(
-            self.subject,
-            self.subject_type,
-            self.output["status"],
-            source=self.output["status_source"],
-            expiration_date=self.output["expiration_date"],
-            http_status_code=self.output["http_status_code"],
-            whois_server=self.output["whois_server"],
-            filename=self.filename,
-            ip_validation=ip_validation_status,
-        ).status_file()
-
-
-class ExtraRules:  # pylint: disable=too-few-public-methods # pragma: no cover
-    """
-    Manage some extra rules.,
-
-    :param str subject: The subject we are working with.
-
-    :param str subject_type:
-        The type of the subject we are working with.
-        Should be one of the following.
-
-            - :code:`domain`
-            - :code:`url`
-
-    :param http_status_code: The extracted status code.
-    :type http_status_code: str|int
-    """
-
-    def __init__(self, subject, subject_type, http_status_code):
-        # We share the subject we are working with.
-        self.subject = subject
-        # We share the subject type.
-        self.subject_type = subject_type
-        # We share the status code.
-        self.status_code = http_status_code
-
-        # We set the header that we will send when communicating with webservers.
-        self.headers = {"User-Agent": PyFunceble.CONFIGURATION["user_agent"]}
-
-        # We set a list of regex and methods to call if matched.
-        self.regexes_active_to_inactive_potentially_down = {
-            r"\.blogspot\.": self.__blogspot,
-            r"\.canalblog\.com$": self.__special_down,
-            r"\.doubleclick\.net$": self.__special_down,
-            r"\.liveadvert\.com$": self.__special_down,
-            r"\.skyrock\.com$": self.__special_down,
-            r"\.tumblr\.com$": self.__special_down,
-        }
-
-        # We set a list of regex and methods to call if matched.
-        self.regexes_active_to_inactive_potentially_up = {
-            r"\.blogspot\.": self.__blogspot,
-            r"\.wordpress\.com$": self.__wordpress_dot_com,
-        }
-
-    @classmethod
-    def __special_down(cls):
+    def get_http_status_code(self):
         """
-        Set what we return for the SPECIAL status de-escalation.
+        Get the HTTP status code of the subject.
 
-        :return: :code:`(new status, new source)`
-        :rtype: tuple
-        """
+        :return: The HTTP status code.
+        :rtype: str|int
 
-        return PyFunceble.STATUS["official"]["down"], "SPECIAL"
-
-    @classmethod
-    def __special_up(cls):
+        .. note::
+            The HTTP status code is asked only once and only when
+            we need it.
         """
-        Set what we return for the SPECIAL status escalation.
 
-        :return: :code:`(new status, new source)`
-        :rtype: tuple
-        """
+        if not self.requested["http_status_code"]:
+            # We did not ask for the HTTP status code yet.
 
-        return PyFunceble.STATUS["official"]["up"], "SPECIAL"
+            # We get the HTTP status code.
+            self.output["http_status_code"] = HTTPCode(
+                self.subject, self.subject_type, addresses=self.get_addresses()
+            ).get()
 
-    @classmethod
-    def __http_status_code_up(cls):
-        """
-        Set what we return for the HTTP Code status escalation.
+            self.requested["http_status_code"] = True
 
-        :return: :code:`(new status, new source)`
-        :rtype: tuple
-        """
+        return self.output["http_status_code"]
 
-        return PyFunceble.STATUS["official"]["up"], "HTTP Code"
-
-    def __blogspot(self):
+    def get_addresses(self):
         """
-        Handle the blogspot SPECIAL case.
+        Get the addresses the HTTP status code is asked to.
 
         :return:
-            :code:`(new status, new source)` or :code:`None` if there is any
-            change to apply.
-        :rtype: tuple|None
+            The addresses of the subject or :code:`None` if the
+            HTTP status code request has to resolve the subject itself.
+        :rtype: list|None
         """
 
-        # We iniate a list of elements in the HTML which will tell us more about
-        # the status of the domain.
-        regex_blogger = ["create-blog.g?", "87065", "doesn&#8217;t&nbsp;exist"]
-
-        if self.subject_type in ["domain", "file_domain"]:
-            # The element we are testing is a domain.
+        if (
+            not PyFunceble.HTTP_CODE["active"]
+            or PyFunceble.CONFIGURATION["local"]
+            or not self.output["domain_syntax_validation"]
+        ):
+            # * The HTTP status code request is deactivated.
+            # or
+            # * We are testing local subjects which only the system may know.
+            # or
+            # * The subject is not a domain.
 
-            # We construct the url to get.
-            url_to_get = "http://%s" % self.subject
-        elif self.subject_type in ["url", "file_url"]:
-            # The element we are testing is a URL.
+            return None
 
-            # We construct the url to get.
-            url_to_get = self.subject
-        else:
-            raise ValueError("Given subject type not registered.")
+        if self.requested["dns_lookup"] is not None:
+            # We already looked the DNS up.
 
-        try:
-            # We get the HTML of the home page.
-            blogger_content_request = PyFunceble.requests.get(
-                url_to_get, headers=self.headers
+            # We get the addresses from its result.
+            return self.requested["dns_lookup"].get_addresses(
+                self.output["dns_lookup"]
             )
 
-            for regx in regex_blogger:
-                # We loop through the list of regex to match.
-
-                if (
-                    regx in blogger_content_request.text
-                    or Regex(
-                        blogger_content_request.text,
-                        regx,
-                        return_data=False,
-                        escape=False,
-                    ).match()
-                ):
-                    # * The currently read regex is present into the docuement.
-                    # or
-                    # * Something in the document match the currently read regex.
-
-                    # We update the status and source.
-                    return self.__special_down()
-        except (
-            PyFunceble.requests.exceptions.InvalidURL,
-            PyFunceble.socket.timeout,
-            PyFunceble.requests.exceptions.Timeout,
-            PyFunceble.requests.ConnectionError,
-            urllib3_exceptions.InvalidHeader,
-            UnicodeDecodeError,  # The probability that this happend in production is minimal.
-        ):
-            pass
-
-        # We return None, there is no changes.
-        return None
-
-    def __wordpress_dot_com(self):
-        """
-        Handle the wordpress.com SPECIAL case.
+        # We get the addresses from our DNS server(s).
+        return PyFunceble.DNSLookup(
+            self.subject, dns_server=PyFunceble.CONFIGURATION["dns_server"]
+        ).get_addresses()
 
-        :return:
-            :code:`(new status, new source)` or :code:`None` if there is any
-            change to apply.
-        :rtype: tuple|None
+    def get_dns_lookup(self):
         """
+        Get the DNS lookup interface of the subject.
 
-        # We initiate a variable which whill have to be into the HTML
-        # in order to be considered as inactive.
-        does_not_exist = "doesn&#8217;t&nbsp;exist"
+        :return: The DNS lookup interface, after its request.
+        :rtype: :class:`PyFunceble.dns_lookup.DNSLookup`
 
-        # We get the content of the page.
-        wordpress_com_content = PyFunceble.requests.get(
-            "http://{}:80".format(self.subject), headers=self.headers
-        )
-
-        if does_not_exist in wordpress_com_content.text:
-            # The marker is into the page content.
-
-            # We return the new status and source.
-            return self.__special_down()
-
-        # We return None, there is no changes.
-        return None
-
-    def __handle_potentially_inactive(self, previous_state):
+        .. note::
+            The DNS lookup is requested only once. Its result is
+            saved into the :code:`dns_lookup` index of the output.
         """
-        Handle the potentially inactive case.
 
-        :param str previous_state: The previously catched status.
-
-        :return:
-            :code:`(new status, new source)` or :code:`None` if there is any
-            change to apply.
-        :rtype: tuple|None
-        """
+        if self.requested["dns_lookup"] is None:
+            # We did not look the DNS up yet.
 
-        if (
-            PyFunceble.HTTP_CODE["active"]
-            and self.status_code in PyFunceble.HTTP_CODE["list"]["potentially_down"]
-        ):
-            # * The http status request is activated.
-            # and
-            # * The extracted http status code is in the list of
-            #   potentially down list.
-
-            # We generate the analytics files.
-            Generate(self.subject, self.subject_type, previous_state).analytic_file(
-                "potentially_down"
+            # We initiate the DNS lookup interface.
+            dns_lookup = PyFunceble.DNSLookup(
+                self.subject, dns_server=PyFunceble.CONFIGURATION["dns_server"]
             )
 
-            if not PyFunceble.CONFIGURATION["no_special"]:
-                # We are authorized to play with the SPEICIAL rules.
-
-                for regx in self.regexes_active_to_inactive_potentially_down:
-                    # We loop through the list of available regex.
-
-                    if Regex(
-                        data=self.subject, regex=regx, return_data=False, escape=False
-                    ).match():
-                        # The element we are currently testing match the
-                        # regex we are currently reading.
+            # We get the dns_lookup state.
+            self.output["dns_lookup"] = dns_lookup.request()
 
-                        # We get the output of the function associated
-                        # with the regex.
-                        output = self.regexes_active_to_inactive_potentially_down[
-                            regx
-                        ]()
+            self.requested["dns_lookup"] = dns_lookup
 
-                        if output is not None:
-                            # The output is not None.
+        return self.requested["dns_lookup"]
 
-                            # We return the new source and state.
-                            return output
-
-        # We return None, there is no changes.
-        return None
-
-    def __handle_potentially_up(self):
+    def resolves(self):
         """
-        Handle the potentially up  case.
+        Check if the subject resolves.
 
-        :return:
-            :code:`(new status, new source)` or :code:`None` if there is any
-            change to apply.
-        :rtype: tuple|None
+        :rtype: bool
         """
 
-        if (
-            PyFunceble.HTTP_CODE["active"]
-            and self.status_code in PyFunceble.HTTP_CODE["list"]["potentially_up"]
-        ):
-            # * The http status code request is activated.
-            # and
-            # * The extracted http status code is into the list of potentially up codes.
-
-            if not PyFunceble.CONFIGURATION["no_special"]:
-                # We are authorized to play with the SPEICIAL rules.
-
-                for regx in self.regexes_active_to_inactive_potentially_up:
-                    # We loop through the list of available regex.
-
-                    if Regex(
-                        data=self.subject, regex=regx, return_data=False, escape=False
-                    ).match():
-                        # The element we are currently testing match the
-                        # regex we are currently reading.
-
-                        # We get the output of the function associated
-                        # with the regex.
-                        output = self.regexes_active_to_inactive_potentially_up[regx]()
+        # We look the DNS up.
+        self.get_dns_lookup()
 
-                        if output is not None:
-                            # The output is not None.
+        return bool(self.output["dns_lookup"])
 
-                            # We return the new source and state.
-                            return output
-
-        # We return None, there is no changes.
-        return None
-
-    def __handle_http_code(self, previous_state):
-        """
-        Handle the HTTP Code status escalation.
-
-        :param str previous_state: The previously catched status.
-
-        :return:
-            :code:`(new status, new source)` or :code:`None` if there is any
-            change to apply.
-        :rtype: tuple|None
+    def handle(self, status, ip_validation_status):
         """
+        Handle the lack of WHOIS and expiration date. :smile_cat:
 
-        try:
-            if self.status_code in PyFunceble.HTTP_CODE["list"]["up"]:
-                # The extracted http code is in the list of up codes.
-
-                # We generate the analytics files.
-                Generate(self.subject, self.subject_type, previous_state).analytic_file(
-                    PyFunceble.STATUS["official"]["up"]
-                )
-
-                if previous_state.lower() not in PyFunceble.STATUS["list"]["up"]:
-                    # And we return the new status and source
-                    return self.__http_status_code_up()
-
-            if self.status_code in PyFunceble.HTTP_CODE["list"]["potentially_up"]:
-                # The extracted http status code is in the list of potentially up status.
-
-                # We generate the analytics files.
-                Generate(self.subject, self.subject_type, previous_state).analytic_file(
-                    "potentially_up"
-                )
-
-                if previous_state.lower() not in PyFunceble.STATUS["list"]["up"]:
-                    # And we return the new status and source
-                    return self.__http_status_code_up()
-
-            if (
-                previous_state.lower() not in PyFunceble.STATUS["list"]["down"]
-                or previous_state.lower() not in PyFunceble.STATUS["list"]["invalid"]
-            ) and self.status_code in PyFunceble.HTTP_CODE["list"]["potentially_down"]:
-                # The extracted http code is in the list of potentially down status code.
-
-                # We generate the analytics files.
-                Generate(self.subject, self.subject_type, previous_state).analytic_file(
-                    "potentially_down"
-                )
-        except KeyError:
-            pass
-
-        # We return None, there is no changes.
-        return None
+        :param str matched_status: The status that we have to handle.
 
-    def __handle_ipv4_range(self):
-        """
-        Handle the IP range status escalation.
+        :param str ip_validation_status:
+            The IP syntax validation.
 
         :return:
-            :code:`(new status, new source)` or :code:`None` if there is any
-            change to apply.
-        :rtype: tuple|None
-        """
-
-        if (
-            not PyFunceble.CONFIGURATION["no_special"]
-            and PyFunceble.Check(self.subject).is_ipv4_range()
-        ):
-            # * We can run/check the special rule.
-            # and
-            # * The element we are currently testing is an IPv4 with range.
-
-            # We return the new status and source.
-            return self.__special_up()
-
-        # We return None, there is no changes.
-        return None
-
-    def handle(
-        self, previous_state, previous_source
-    ):  # pylint:disable= too-many-return-statements
-        """
-        Globally handle the case of the currently tested domain.
+            The status of the domain after generating the files desired
+            by the user.
+        :rtype: str
         """
 
-        # We preset the new status and the source to None.
-        new_status = None
-        source = None
-
-        # We convert the given previous state to lower case.
-        previous_state_modified = previous_state.lower()
-
-        if previous_state_modified in PyFunceble.STATUS["list"]["up"]:
-            # The previous state is in the list of up status.
-
-            try:
-                # We try to get the new status and source from another handler.
-
-                new_status, source = self.__handle_potentially_inactive(previous_state)
-
-                return new_status, source
-            except TypeError:
-                pass
-
-            try:
-                # We try to get the new status and source from another handler.
-
-                new_status, source = self.__handle_potentially_up()
-                return new_status, source
-            except TypeError:
-                pass
+        # We get the DNS lookup interface and state.
+        dns_lookup = self.get_dns_lookup()
 
-        if previous_state_modified in PyFunceble.STATUS["list"]["valid"]:
-            # The previous state is in the list of valid status.
+        if dns_lookup.wildcard:
+            # The subject resolves through a wildcard record.
 
-            # We return the given state and source, nothing changes.
-            return previous_state, previous_source
+            # We flag the source.
+            self.output["_status_source"] = "WILDCARD"
 
-        if previous_state_modified in PyFunceble.STATUS["list"]["down"]:
-            # The previous state is in the list of down status.
-
-            try:
-                # We try to get the new status and source from another handler.
+        if status.lower() not in PyFunceble.STATUS["list"]["invalid"]:
+            # The matched status is not in the list of invalid status.
 
-                new_status, source = self.__handle_ipv4_range()
+            if self.output["dns_lookup"]:
+                # We could execute the dns_lookup logic.
 
-                return new_status, source
-            except TypeError:
-                pass
+                # We set the status we got.
+                self.output["_status"] = PyFunceble.STATUS["official"]["up"]
+            else:
+                # We could not get something.
 
-            if PyFunceble.HTTP_CODE["active"]:
-                # The http status code request is activated.
+                # We set the status we got.
+                self.output["_status"] = PyFunceble.STATUS["official"]["down"]
 
-                try:
-                    # We try to get the new status and source from another handler.
+            if self.output["dns_lookup"] or not dns_lookup.nonexistent:
+                # * The subject resolves.
+                # or
+                # * We do not know that the subject does not exist.
 
-                    new_status, source = self.__handle_http_code(previous_state)
+                # We let the extra rules ask for the HTTP status code
+                # when they need it.
+                http_status_code = self.get_http_status_code
+            else:
+                # The subject does not exist, no HTTP request can succeed.
 
-                    return new_status, source
-                except TypeError:
-                    pass
+                # We do not ask for the HTTP status code.
+                http_status_code = self.output["http_status_code"]
 
-        if previous_state_modified in PyFunceble.STATUS["list"]["invalid"]:
-            # The previous state is in the list of invalid status.
+            # We get the status and source after extra rules check.
+            self.output["status"], self.output["status_source"] = ExtraRules(
+                self.subject, self.subject_type, http_status_code
+            ).handle(self.output["_status"], self.output["_status_source"])
+        else:
+            if self.output["dns_lookup"]:
+                # We could execute the dns_lookup logic.
 
-            if PyFunceble.HTTP_CODE["active"]:
-                # The http status code request is activated.
+                # We set the status we got.
+                self.output["_status"] = PyFunceble.STATUS["official"]["up"]
 
-                try:
-                    # We try to get the new status and source from another handler.
+                if not dns_lookup.wildcard:
+                    # The subject does not resolve through a wildcard record.
 
-                    new_status, source = self.__handle_http_code(previous_state)
+                    # We set the status source.
+                    self.output["_status_source"] = "DNSLOOKUP"
 
-                    return new_status, source
-                except TypeError:
-                    pass
+            self.output["status"], self.output["status_source"] = (
+                self.output["_status"],
+                self.output["_status_source"],
+            )
 
-        # We return the given state and source, nothing changes.
-        return previous_state, previous_source
+        # We generate the status file with the invalid status.
+        Generate(
+            self.subject,
+            self.subject_type,
+            self.output["status"],
+            source=self.output["status_source"],
+            expiration_date=self.output["expiration_date"],
+            http_status_code=self.output["http_status_code"],
+            whois_server=self.output["whois_server"],
+            filename=self.filename,
+            ip_validation=ip_validation_status,
+        ).status_file()
 
 
 class URLStatus:  # pragma: no cover pylint: disable=too-few-public-methods
@@ -701,6 +439,9 @@ class URLStatus:  # pragma: no cover pylint: disable=too-few-public-methods
         self.checker = PyFunceble.Check(self.subject)
         self.inactive_db = inactive_db
 
+        # We initiate the HTTP status code extractor.
+        self.http_code = HTTPCode(self.subject, "url")
+
         # We initiate what we are going to return.
         self.output = {
             "domain_syntax_validation": None,
@@ -711,7 +452,7 @@ class URLStatus:  # pragma: no cover pylint: disable=too-few-public-methods
             "tested": self.subject,
             "url_syntax_validation": self.checker.is_url(),
             "whois_server": None,
-            "http_status_code": HTTPCode(self.subject, "url").get(),
+            "http_status_code": self.http_code.get(),
             "dns_lookup": None,
         }
 
@@ -746,6 +487,16 @@ class URLStatus:  # pragma: no cover pylint: disable=too-few-public-methods
                 self.output["_status"] = self.output["status"] = PyFunceble.STATUS[
                     "official"
                 ]["down"]
+
+                if self.http_code.unreachable:
+                    # The host of the URL was known as unreachable.
+
+                    # We set the status source.
+                    # Note: We did not ask anything, the status comes from
+                    # PyFunceble.http_code.HTTPHostCache.
+                    self.output["_status_source"] = self.output[
+                        "status_source"
+                    ] = "HOST CACHE"
         else:
             self.output["_status_source"] = self.output["status_source"] = "SYNTAX"
             self.output["_status"] = self.output["status"] = PyFunceble.STATUS[
@@ -61,6 +61,7 @@ License:
 # pylint: disable=line-too-long
 
 from hashlib import sha256
+from threading import Lock
 
 import PyFunceble
 from PyFunceble.helpers import Dict, File
@@ -76,6 +77,9 @@ class WhoisDB:
     database_file = None
     authorized = False
 
+    # Save the lock which protect the database against concurrent writes.
+    lock = Lock()
+
     def __init__(self, sqlite_db=None, mysql_db=None):
         # Get the authorization.
         self.authorized = self.authorization()
@@ -182,15 +186,22 @@ class WhoisDB:
             self.database[index] = value
 
     def __setitem_sqlite(self, index, value):
-        query = (
-            "INSERT INTO {0} "
-            "(subject, expiration_date, expiration_date_epoch, state, record) "
-            "VALUES (:subject, :expiration_date, :epoch, :state, :record)"
-        ).format(self.table_name)
+        queries = self.sqlite_db.get_upsert_queries(
+            self.table_name,
+            {
+                "subject": "subject",
+                "expiration_date": "expiration_date",
+                "expiration_date_epoch": "epoch",
+                "state": "state",
+                "record": "record",
+            },
+            ["subject"],
+            update=["expiration_date", "expiration_date_epoch", "state", "record"],
+        )
 
-        try:
+        for query in queries:
             # We execute the query.
-            self.sqlite_db.cursor.execute(
+            self.sqlite_db.execute(
                 query,
                 {
                     "subject": index,
@@ -200,10 +211,6 @@ class WhoisDB:
                     "record": value["record"],
                 },
             )
-            # And we commit the changes.
-            self.sqlite_db.connection.commit()
-        except self.sqlite_db.errors:
-            pass
 
     def __setitem_mysql(self, index, value):
         query = (
@@ -219,21 +226,18 @@ class WhoisDB:
             )
         ).hexdigest()
 
-        with self.mysql_db.get_connection() as cursor:
-            try:
-                cursor.execute(
-                    query,
-                    {
-                        "subject": index,
-                        "expiration_date": value["expiration_date"],
-                        "epoch": value["epoch"],
-                        "state": value["state"],
-                        "record": value["record"],
-                        "digest": digest,
-                    },
-                )
-            except self.mysql_db.errors:
-                pass
+        # We execute the query.
+        self.mysql_db.execute(
+            query,
+            {
+                "subject": index,
+                "expiration_date": value["expiration_date"],
+                "epoch": value["epoch"],
+                "state": value["state"],
+                "record": value["record"],
+                "digest": digest,
+            },
+        )
 
     def __setitem__(self, index, value):
         if self.authorized:
@@ -419,8 +423,9 @@ class WhoisDB:
                 # We set the state.
                 data["state"] = "future"
 
-            # We save everything into the database.
-            self[subject] = data
+            with self.lock:
+                # We save everything into the database.
+                self[subject] = data
 
-            # We save everything.
-            self.save()
+                # We save everything.
+                self.save()
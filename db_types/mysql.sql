@@ -147,3 +147,28 @@ BEGIN
 END ///
 DELIMITER ;
 
+CREATE TABLE IF NOT EXISTS pyfunceble_dns (
+    id BIGINT(20) PRIMARY KEY AUTO_INCREMENT,
+    server LONGTEXT NOT NULL,
+    subject LONGTEXT NOT NULL,
+    record_type VARCHAR(12) NOT NULL,
+    answer LONGTEXT NOT NULL,
+    expiration_epoch INTEGER(11) NOT NULL,
+    last_access_epoch INTEGER(11) NOT NULL,
+    digest VARCHAR(64) NOT NULL,
+    created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(digest),
+    INDEX(last_access_epoch)
+);
+
+DROP TRIGGER IF EXISTS updatePyFuncebleDnsDates;
+DELIMITER ///
+CREATE TRIGGER updatePyFuncebleDnsDates
+    BEFORE UPDATE ON pyfunceble_dns FOR EACH ROW
+BEGIN
+    IF NEW.modified <= OLD.modified THEN
+        SET NEW.modified = CURRENT_TIMESTAMP;
+    END IF;
+END ///
+DELIMITER ;
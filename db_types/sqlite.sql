@@ -133,4 +133,28 @@ CREATE TRIGGER IF NOT EXISTS updateWhoisDates
     WHEN NEW.modified <= old.modified
 BEGIN
     UPDATE whois SET modified=CURRENT_TIMESTAMP WHERE id=OLD.id;
+END;
+
+CREATE TABLE IF NOT EXISTS dns (
+    id INTEGER PRIMARY KEY,
+    server TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    record_type TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    expiration_epoch INTEGER NOT NULL,
+    last_access_epoch INTEGER NOT NULL,
+    created TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    modified TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    UNIQUE(server, subject, record_type)
+);
+
+CREATE INDEX IF NOT EXISTS dnsLastAccess ON dns(last_access_epoch);
+
+CREATE TRIGGER IF NOT EXISTS updateDnsDates
+    AFTER UPDATE
+    ON dns
+    FOR EACH ROW
+    WHEN NEW.modified <= old.modified
+BEGIN
+    UPDATE dns SET modified=CURRENT_TIMESTAMP WHERE id=OLD.id;
 END;
\ No newline at end of file
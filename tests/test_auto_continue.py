@@ -60,6 +60,7 @@ License:
 """
 # pylint: enable=line-too-long
 # pylint: disable=import-error
+from json import loads
 from unittest import TestCase
 from unittest import main as launch_tests
 
@@ -276,6 +277,113 @@ class TestsAutoContinue(TestCase):
 
         self.test_delete_file()
 
+    def test_add_already_tested(self):
+        """
+        Test the addition of an element which was already tested.
+        """
+
+        self.test_delete_file()
+        self.auto_continue.authorized = True
+
+        self.auto_continue.database = {}
+
+        self.auto_continue.add("hello.world", "INACTIVE")
+        self.auto_continue.add("hello.world", "ACTIVE")
+
+        expected = {self.file_to_test: {"ACTIVE": ["hello.world"], "INACTIVE": []}}
+
+        self.assertEqual(expected, self.auto_continue.database)
+
+        self.auto_continue.clean()
+        self.test_delete_file()
+
+    def test_load_journal(self):
+        """
+        Test the replay of the journal while loading the database.
+        """
+
+        self.test_delete_file()
+        self.auto_continue.authorized = True
+
+        self.auto_continue.database = {}
+
+        self.auto_continue.add("hello.world", "ACTIVE")
+        self.auto_continue.add("world.hello", "INACTIVE")
+
+        # We simulate a crash.
+        self.auto_continue.database = {}
+        self.auto_continue.load()
+
+        expected = {
+            self.file_to_test: {"ACTIVE": ["hello.world"], "INACTIVE": ["world.hello"]}
+        }
+
+        self.assertEqual(expected, self.auto_continue.database)
+
+        expected = {"hello.world", "world.hello"}
+
+        self.assertEqual(expected, self.auto_continue.get_already_tested())
+
+        expected = False
+        actual = PyFunceble.path.isfile(self.auto_continue.journal_file)
+
+        self.assertEqual(expected, actual)
+
+        self.auto_continue.clean()
+        self.test_delete_file()
+
+    def test_journal_kept_open(self):
+        """
+        Test that the journal is kept open until the database is saved.
+        """
+
+        self.test_delete_file()
+        self.auto_continue.authorized = True
+
+        self.auto_continue.database = {}
+
+        self.auto_continue.add("hello.world", "ACTIVE")
+
+        journal = self.auto_continue.journal
+
+        self.auto_continue.add("world.hello", "INACTIVE")
+
+        self.assertIs(journal, self.auto_continue.journal)
+
+        expected = [
+            [self.file_to_test, "ACTIVE", "hello.world"],
+            [self.file_to_test, "INACTIVE", "world.hello"],
+        ]
+        actual = [
+            loads(x)
+            for x in File(self.auto_continue.journal_file).read().splitlines()
+        ]
+
+        self.assertEqual(expected, actual)
+
+        self.auto_continue.save()
+
+        self.assertIsNone(self.auto_continue.journal)
+        self.assertTrue(journal.closed)
+
+        expected = False
+        actual = PyFunceble.path.isfile(self.auto_continue.journal_file)
+
+        self.assertEqual(expected, actual)
+
+        self.auto_continue.add("hello.world.hello", "ACTIVE")
+
+        expected = [[self.file_to_test, "ACTIVE", "hello.world.hello"]]
+        actual = [
+            loads(x)
+            for x in File(self.auto_continue.journal_file).read().splitlines()
+        ]
+
+        self.assertEqual(expected, actual)
+
+        self.auto_continue.clean()
+        self.test_delete_file()
+
 
 if __name__ == "__main__":
     launch_tests()
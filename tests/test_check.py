@@ -378,6 +378,38 @@ class TestCheck(TestCase):
 
             self.assertEqual(expected, actual, msg="%s is a subdomain." % domain)
 
+    def test_get_registrable_domain(self):
+        """
+        Test Check().get_registrable_domain().
+        """
+
+        expected = {
+            "hello.world.abuse.co.za": "abuse.co.za",
+            "_hello.abuse.co.za.": "abuse.co.za",
+            "abuse.co.za": "abuse.co.za",
+            "hello.world.google.com": "google.com",
+            "Hello.Google.com": "google.com",
+            "google.com": "google.com",
+        }
+
+        for domain, registrable_domain in expected.items():
+            actual = Check(domain).get_registrable_domain()
+
+            self.assertEqual(registrable_domain, actual, msg=domain)
+
+    def test_get_registrable_domain_not_found(self):
+        """
+        Test Check().get_registrable_domain() for the case that
+        there is no registrable domain.
+        """
+
+        expected = None
+
+        for domain in ["co.za", "com", "hello-world"]:
+            actual = Check(domain).get_registrable_domain()
+
+            self.assertEqual(expected, actual, msg=domain)
+
     def test_is_ipv4(self):
         """
         Test Check().is_ipv4() for the case that the IP is valid.
@@ -0,0 +1,207 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.db_writer.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+from multiprocessing import Process, Queue
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.db_writer import DBWriter
+from PyFunceble.helpers import File
+from PyFunceble.sqlite import SQLite
+
+
+class TestDBWriter(TestCase):
+    """
+    Test PyFunceble.db_writer.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom={"db_type": "sqlite"}
+        )
+
+        self.database_file = (
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS["default_files"]["sqlite"]
+        )
+
+        self.sqlite_db = SQLite()
+
+        self.query = (
+            "INSERT INTO {0} (file_path, subject, status, is_complement) "
+            "VALUES (:file, :subject, :status, :is_complement)"
+        ).format(self.sqlite_db.tables["auto_continue"])
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        self.sqlite_db.close()
+
+        File(self.database_file).delete()
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom={"db_type": "json"}
+        )
+
+    def __write(self, subject, errors):
+        """
+        Write the given subject from a process.
+        """
+
+        self.sqlite_db.execute(
+            self.query,
+            {
+                "file": "hello",
+                "subject": subject,
+                "status": "ACTIVE",
+                "is_complement": int(False),
+            },
+        )
+
+        try:
+            self.sqlite_db.cursor.execute(
+                self.query,
+                {
+                    "file": "hello",
+                    "subject": "direct." + subject,
+                    "status": "ACTIVE",
+                    "is_complement": int(False),
+                },
+            )
+        except self.sqlite_db.locked_errors:
+            errors.put(subject)
+
+    def test_writes_from_processes(self):
+        """
+        Test that the writes of our processes are applied by the writer.
+        """
+
+        self.sqlite_db.writer = DBWriter(self.sqlite_db)
+        self.sqlite_db.writer.start()
+
+        errors = Queue()
+
+        processes = [
+            Process(target=self.__write, args=("{0}.example".format(x), errors))
+            for x in range(4)
+        ]
+
+        for process in processes:
+            process.start()
+
+        for process in processes:
+            process.join()
+
+        self.sqlite_db.writer.stop()
+        self.sqlite_db.writer = None
+
+        expected = ["{0}.example".format(x) for x in range(4)]
+        actual = [
+            x["subject"]
+            for x in self.sqlite_db.cursor.execute(
+                "SELECT subject FROM {0} ORDER BY subject".format(
+                    self.sqlite_db.tables["auto_continue"]
+                )
+            ).fetchall()
+        ]
+
+        self.assertEqual(expected, actual)
+
+        expected = sorted(["{0}.example".format(x) for x in range(4)])
+        actual = sorted([errors.get() for _ in range(4)])
+
+        self.assertEqual(expected, actual)
+
+    def test_writes_from_owner(self):
+        """
+        Test that the writes of the owner of the writer are applied directly.
+        """
+
+        self.sqlite_db.writer = DBWriter(self.sqlite_db)
+
+        self.sqlite_db.execute(
+            self.query,
+            {
+                "file": "hello",
+                "subject": "hello.world",
+                "status": "ACTIVE",
+                "is_complement": int(False),
+            },
+        )
+
+        self.sqlite_db.writer = None
+
+        expected = 1
+        actual = self.sqlite_db.cursor.execute(
+            "SELECT COUNT(*) FROM {0}".format(self.sqlite_db.tables["auto_continue"])
+        ).fetchone()[0]
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
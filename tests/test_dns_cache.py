@@ -0,0 +1,349 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.dns_cache.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import unittest.mock as mock  # pylint: disable=useless-import-alias
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import dns.message
+import dns.resolver
+
+import PyFunceble
+from PyFunceble.dns_cache import DNSCache
+
+
+class TestDNSCache(TestCase):
+    """
+    Test PyFunceble.dns_cache.DNSCache
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.cache = DNSCache()
+
+    def test_get_not_cached(self):
+        """
+        Test DNSCache.get() for the case that the key is not cached.
+        """
+
+        expected = (False, None)
+        actual = self.cache.get(("hello.world", "A"))
+
+        self.assertEqual(expected, actual)
+
+        expected = {"hits": 0, "misses": 1, "saved": 0, "size": 0, "plans": {}}
+        actual = self.cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_cached(self):
+        """
+        Test DNSCache.get() for the case that the key is cached.
+        """
+
+        self.cache.set(("hello.world", "A"), ["127.0.0.1"], 60)
+        self.cache.set(("world.hello", "A"), None, 60)
+
+        expected = (True, ["127.0.0.1"])
+        actual = self.cache.get(("hello.world", "A"))
+
+        self.assertEqual(expected, actual)
+
+        expected = (True, None)
+        actual = self.cache.get(("world.hello", "A"))
+
+        self.assertEqual(expected, actual)
+
+        expected = {"hits": 2, "misses": 0, "saved": 0, "size": 2, "plans": {}}
+        actual = self.cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_expired(self):
+        """
+        Test DNSCache.get() for the case that the cached answer expired.
+        """
+
+        self.cache.set(("hello.world", "A"), ["127.0.0.1"], 60)
+
+        with mock.patch("PyFunceble.time", return_value=PyFunceble.time() + 61):
+            expected = (False, None)
+            actual = self.cache.get(("hello.world", "A"))
+
+        self.assertEqual(expected, actual)
+
+        expected = {"hits": 0, "misses": 1, "saved": 0, "size": 0, "plans": {}}
+        actual = self.cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+    def test_set_no_ttl(self):
+        """
+        Test DNSCache.set() for the case that the TTL is 0.
+        """
+
+        self.cache.set(("hello.world", "A"), ["127.0.0.1"], 0)
+
+        expected = (False, None)
+        actual = self.cache.get(("hello.world", "A"))
+
+        self.assertEqual(expected, actual)
+
+    def test_set_lru(self):
+        """
+        Test that the least recently used answer is deleted when
+        the cache is full.
+        """
+
+        cache_size = PyFunceble.CONFIGURATION["dns_cache_size"]
+        PyFunceble.CONFIGURATION["dns_cache_size"] = 2
+
+        self.cache.set(("hello.world", "A"), ["127.0.0.1"], 60)
+        self.cache.set(("world.hello", "A"), ["127.0.0.2"], 60)
+
+        self.cache.get(("hello.world", "A"))
+
+        self.cache.set(("hello-world.com", "A"), ["127.0.0.3"], 60)
+
+        expected = [("hello.world", "A"), ("hello-world.com", "A")]
+        actual = list(self.cache.cache.keys())
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["dns_cache_size"] = cache_size
+
+    def test_get_negative_ttl(self):
+        """
+        Test DNSCache.get_negative_ttl().
+        """
+
+        response = dns.message.from_text(
+            "id 1234\n"
+            "opcode QUERY\n"
+            "rcode NXDOMAIN\n"
+            "flags QR RD RA\n"
+            ";QUESTION\n"
+            "hello.world. IN A\n"
+            ";AUTHORITY\n"
+            "world. 3600 IN SOA ns.world. hostmaster.world. 1 7200 900 1209600 900\n"
+        )
+
+        expected = 900
+        actual = DNSCache.get_negative_ttl(dns.resolver.NoAnswer(response=response))
+
+        self.assertEqual(expected, actual)
+
+        expected = DNSCache.negative_ttl
+        actual = DNSCache.get_negative_ttl(dns.resolver.NoAnswer())
+
+        self.assertEqual(expected, actual)
+
+    def test_get_not_counted(self):
+        """
+        Test DNSCache.get() for the case that we do not have to count.
+        """
+
+        self.cache.set(("hello.world", "A"), ["192.168.1.1"], 3600)
+
+        expected = (True, ["192.168.1.1"])
+        actual = self.cache.get(("hello.world", "A"), count=False)
+
+        self.assertEqual(expected, actual)
+
+        expected = (False, None)
+        actual = self.cache.get(("world.hello", "A"), count=False)
+
+        self.assertEqual(expected, actual)
+
+        expected = {"hits": 0, "misses": 0, "saved": 0, "size": 1, "plans": {}}
+        actual = self.cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+    def test_pop_statistics(self):
+        """
+        Test DNSCache.pop_statistics().
+        """
+
+        self.cache.set(("hello.world", "A"), ["192.168.1.1"], 3600)
+        self.cache.get(("hello.world", "A"))
+        self.cache.add_plan_step("subdomain", "A", True)
+
+        expected = {
+            "hits": 1,
+            "misses": 0,
+            "saved": 0,
+            "size": 1,
+            "plans": {"subdomain": {"A": {"asked": 1, "found": 1}}},
+        }
+        actual = self.cache.pop_statistics()
+
+        self.assertEqual(expected, actual)
+
+        expected = {"hits": 0, "misses": 0, "saved": 0, "size": 1, "plans": {}}
+        actual = self.cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+    def test_merge_plan_statistics(self):
+        """
+        Test DNSCache.merge_statistics() for the case that we have to merge
+        the statistics of the query plans.
+        """
+
+        self.cache.add_plan_step("subdomain", "A", False)
+
+        self.cache.merge_statistics(
+            {
+                "hits": 0,
+                "misses": 0,
+                "saved": 0,
+                "plans": {
+                    "subdomain": {
+                        "A": {"asked": 2, "found": 1},
+                        "AAAA": {"asked": 1, "found": 1},
+                    }
+                },
+            }
+        )
+
+        expected = {
+            "subdomain": {
+                "A": {"asked": 3, "found": 1},
+                "AAAA": {"asked": 1, "found": 1},
+            }
+        }
+        actual = self.cache.get_statistics()["plans"]
+
+        self.assertEqual(expected, actual)
+
+    def test_pop_and_merge_answers(self):
+        """
+        Test DNSCache.pop_answers() and DNSCache.merge_answers().
+        """
+
+        self.cache.database = mock.Mock()
+
+        self.cache.set(("hello.world", "A"), ["127.0.0.1"], 60)
+
+        self.assertEqual(1, self.cache.database.add.call_count)
+
+        expected = []
+        actual = self.cache.pop_answers()
+
+        self.assertEqual(expected, actual)
+
+        self.cache.set(("world.hello", "A"), None, 60)
+
+        # The answer is kept for another process.
+        self.assertEqual(1, self.cache.database.add.call_count)
+
+        answers = self.cache.pop_answers()
+
+        expected = [(("world.hello", "A"), None)]
+        actual = [x[:2] for x in answers]
+
+        self.assertEqual(expected, actual)
+        self.assertEqual([], self.cache.pop_answers())
+
+        cache = DNSCache()
+        cache.database = mock.Mock()
+
+        cache.merge_answers(
+            answers + [(("hello.world", "AAAA"), None, PyFunceble.time() - 1)]
+        )
+
+        expected = (True, None)
+        actual = cache.get(("world.hello", "A"))
+
+        self.assertEqual(expected, actual)
+
+        # The expired answer is not saved.
+        cache.database.add.assert_called_once_with(*answers[0])
+
+    def test_saved_and_merge_statistics(self):
+        """
+        Test DNSCache.add_saved() and DNSCache.merge_statistics().
+        """
+
+        self.cache.add_saved()
+        self.cache.merge_statistics({"hits": 3, "misses": 2, "saved": 1, "plans": {}})
+
+        expected = {"hits": 3, "misses": 2, "saved": 2, "size": 0, "plans": {}}
+        actual = self.cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+        self.cache.clear()
+
+        expected = {"hits": 0, "misses": 0, "saved": 0, "size": 0, "plans": {}}
+        actual = self.cache.get_statistics()
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
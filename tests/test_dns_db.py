@@ -0,0 +1,405 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.dns_db.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest.mock import patch
+
+import PyFunceble
+from PyFunceble.dns_db import DNSDB
+from PyFunceble.dns_cache import DNSCache
+from PyFunceble.helpers import Dict, File
+from PyFunceble.sqlite import SQLite
+
+
+class TestDNSDB(TestCase):
+    """
+    Test PyFunceble.dns_db.DNSDB with the JSON database type.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={"db_type": "json", "dns_database": True},
+        )
+
+        self.file = (
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS["default_files"]["dns_db"]
+        )
+        File(self.file).delete()
+
+        DNSDB.database.clear()
+        self.dns_db = DNSDB()
+
+        self.key = (("1.1.1.1",), "example.org", "A")
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        DNSDB.database.clear()
+        File(self.file).delete()
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={"dns_database": False, "dns_database_size": 1000000},
+        )
+
+    def test_authorization(self):
+        """
+        Test the authorization method.
+        """
+
+        PyFunceble.CONFIGURATION["dns_database"] = False
+        self.assertEqual(False, self.dns_db.authorization())
+
+        PyFunceble.CONFIGURATION["dns_database"] = True
+        self.assertEqual(True, self.dns_db.authorization())
+
+    def test_add_get(self):
+        """
+        Test the addition and the reading of an answer.
+        """
+
+        expected = (False, None, None)
+        actual = self.dns_db.get(self.key)
+
+        self.assertEqual(expected, actual)
+
+        with patch("PyFunceble.time", return_value=1000):
+            self.dns_db.add(self.key, ["93.184.216.34"], 10000)
+            self.dns_db.add((("1.1.1.1",), "example.net", "A"), None, 10000)
+
+            expected = {
+                "1.1.1.1": {
+                    "example.org": {
+                        "A": {
+                            "answer": ["93.184.216.34"],
+                            "expiration": 10000,
+                            "last_access": 1000,
+                        }
+                    },
+                    "example.net": {
+                        "A": {"answer": None, "expiration": 10000, "last_access": 1000}
+                    },
+                }
+            }
+
+            self.assertEqual(expected, self.dns_db.database)
+
+            expected = (True, ["93.184.216.34"], 10000)
+            actual = self.dns_db.get(self.key)
+
+            self.assertEqual(expected, actual)
+
+            expected = (True, None, 10000)
+            actual = self.dns_db.get((("1.1.1.1",), "example.net", "A"))
+
+            self.assertEqual(expected, actual)
+
+        with patch("PyFunceble.time", return_value=1000 + DNSDB.access_interval):
+            self.dns_db.get(self.key)
+
+            expected = 1000 + DNSDB.access_interval
+            actual = self.dns_db.database["1.1.1.1"]["example.org"]["A"]["last_access"]
+
+            self.assertEqual(expected, actual)
+
+    def test_lazy_expiration(self):
+        """
+        Test that an expired answer is deleted when we read it.
+        """
+
+        with patch("PyFunceble.time", return_value=1000):
+            self.dns_db.add(self.key, ["93.184.216.34"], 1300)
+
+        with patch("PyFunceble.time", return_value=1300):
+            expected = (False, None, None)
+            actual = self.dns_db.get(self.key)
+
+            self.assertEqual(expected, actual)
+
+        expected = {"1.1.1.1": {}}
+
+        self.assertEqual(expected, self.dns_db.database)
+
+    def test_save_evict(self):
+        """
+        Test that the expired and the least recently used answers are
+        deleted when we save the database.
+        """
+
+        PyFunceble.CONFIGURATION["dns_database_size"] = 2
+
+        for index, subject in enumerate(["a.org", "b.org", "c.org", "d.org"]):
+            with patch("PyFunceble.time", return_value=1000 + index):
+                self.dns_db.add((("1.1.1.1",), subject, "A"), [subject], 2000 + index)
+
+        with patch("PyFunceble.time", return_value=2000):
+            # a.org expired.
+            self.dns_db.save()
+
+        expected = {
+            "1.1.1.1": {
+                "c.org": {
+                    "A": {"answer": ["c.org"], "expiration": 2002, "last_access": 1002}
+                },
+                "d.org": {
+                    "A": {"answer": ["d.org"], "expiration": 2003, "last_access": 1003}
+                },
+            }
+        }
+
+        self.assertEqual(expected, self.dns_db.database)
+        self.assertEqual(expected, Dict().from_json(File(self.file).read()))
+
+        DNSDB.database.clear()
+        DNSDB()
+
+        self.assertEqual(expected, DNSDB.database)
+
+    def test_cache_consult(self):
+        """
+        Test that the DNS cache consults the database before the network.
+        """
+
+        cache = DNSCache()
+        cache.database = self.dns_db
+
+        with patch("PyFunceble.time", return_value=1000):
+            cache.set(self.key, ["93.184.216.34"], 300)
+
+            expected = (True, ["93.184.216.34"], 1300)
+            actual = self.dns_db.get(self.key)
+
+            self.assertEqual(expected, actual)
+
+        # A new run starts with an empty cache.
+        cache = DNSCache()
+        cache.database = self.dns_db
+
+        with patch("PyFunceble.time", return_value=1100):
+            expected = (True, ["93.184.216.34"])
+            actual = cache.get(self.key)
+
+            self.assertEqual(expected, actual)
+
+            expected = {"hits": 1, "misses": 0, "saved": 0, "size": 1, "plans": {}}
+            actual = cache.get_statistics()
+
+            self.assertEqual(expected, actual)
+
+        with patch("PyFunceble.time", return_value=1300):
+            expected = (False, None)
+            actual = cache.get(self.key)
+
+            self.assertEqual(expected, actual)
+
+
+class TestDNSDBSQLite(TestCase):
+    """
+    Test PyFunceble.dns_db.DNSDB with the SQLite database type.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={"db_type": "sqlite", "dns_database": True},
+        )
+
+        self.database_file = (
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS["default_files"]["sqlite"]
+        )
+
+        self.sqlite_db = SQLite()
+        self.dns_db = DNSDB(sqlite_db=self.sqlite_db)
+
+        self.key = (("1.1.1.1", "1.0.0.1"), "example.org", "A")
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        self.sqlite_db.close()
+
+        File(self.database_file).delete()
+
+        PyFunceble.load_config(
+            generate_directory_structure=False,
+            custom={
+                "db_type": "json",
+                "dns_database": False,
+                "dns_database_size": 1000000,
+            },
+        )
+
+    def __count(self):
+        """
+        Provide the number of saved answers.
+        """
+
+        return self.sqlite_db.cursor.execute(
+            "SELECT COUNT(*) FROM {0}".format(self.sqlite_db.tables["dns"])
+        ).fetchone()[0]
+
+    def test_add_get(self):
+        """
+        Test the addition, the update and the reading of an answer.
+        """
+
+        with patch("PyFunceble.time", return_value=1000):
+            self.dns_db.add(self.key, ["93.184.216.34"], 4600)
+            self.dns_db.add(self.key, ["93.184.216.35"], 4700)
+            self.dns_db.add(self.key[:2] + ("NXDOMAIN",), True, 4600)
+
+            expected = (True, ["93.184.216.35"], 4700)
+            actual = self.dns_db.get(self.key)
+
+            self.assertEqual(expected, actual)
+
+            expected = (True, True, 4600)
+            actual = self.dns_db.get(self.key[:2] + ("NXDOMAIN",))
+
+            self.assertEqual(expected, actual)
+
+        self.assertEqual(2, self.__count())
+
+        with patch("PyFunceble.time", return_value=4600):
+            expected = (False, None, None)
+            actual = self.dns_db.get(self.key[:2] + ("NXDOMAIN",))
+
+            self.assertEqual(expected, actual)
+
+        self.assertEqual(1, self.__count())
+
+    def test_update_old_sqlite(self):
+        """
+        Test the update of an answer with a SQLite which does not
+        understand the upserts.
+        """
+
+        with patch("sqlite3.sqlite_version_info", (3, 22, 0)), patch(
+            "PyFunceble.time", return_value=1000
+        ):
+            self.dns_db.add(self.key, ["93.184.216.34"], 4600)
+            self.dns_db.add(self.key, ["93.184.216.35"], 4700)
+
+            expected = (True, ["93.184.216.35"], 4700)
+            actual = self.dns_db.get(self.key)
+
+            self.assertEqual(expected, actual)
+
+        self.assertEqual(1, self.__count())
+
+    def test_save_evict(self):
+        """
+        Test that the expired and the least recently used answers are
+        deleted when we save the database.
+        """
+
+        PyFunceble.CONFIGURATION["dns_database_size"] = 2
+
+        for index, subject in enumerate(["a.org", "b.org", "c.org", "d.org"]):
+            with patch("PyFunceble.time", return_value=1000 + index):
+                self.dns_db.add((("1.1.1.1",), subject, "A"), [subject], 2000 + index)
+
+        with patch("PyFunceble.time", return_value=2000):
+            self.dns_db.save()
+
+        expected = ["c.org", "d.org"]
+        actual = [
+            x["subject"]
+            for x in self.sqlite_db.cursor.execute(
+                "SELECT subject FROM {0} ORDER BY subject".format(
+                    self.sqlite_db.tables["dns"]
+                )
+            )
+        ]
+
+        self.assertEqual(expected, actual)
+
+    def test_missing_table(self):
+        """
+        Test that the missing tables of an existing database are created.
+        """
+
+        self.sqlite_db.execute("DROP TABLE {0}".format(self.sqlite_db.tables["dns"]))
+        self.sqlite_db.commit()
+
+        self.assertEqual(False, self.sqlite_db.are_tables_present())
+
+        SQLite()
+
+        self.assertEqual(True, self.sqlite_db.are_tables_present())
+
+
+if __name__ == "__main__":
+    launch_tests()
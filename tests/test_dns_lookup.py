@@ -59,9 +59,16 @@ License:
     SOFTWARE.
 """
 # pylint: enable=line-too-long
+import unittest.mock as mock  # pylint: disable=useless-import-alias
 from unittest import TestCase
 from unittest import main as launch_tests
 
+import dns.exception
+import dns.message
+import dns.name
+import dns.resolver
+
+import PyFunceble
 from PyFunceble.dns_lookup import DNSLookup
 
 
@@ -72,6 +79,13 @@ class TestDNSLookup(TestCase):
     but we try to keep it simple.
     """
 
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
     def test_dns_lookup_domain_down(self):
         """
         Test of NSLookup() for the case a domain is down or non
@@ -112,6 +126,458 @@ class TestDNSLookup(TestCase):
         if "PTR" not in actual:
             raise AssertionError(actual)
 
+    def test_dns_lookup_complete(self):
+        """
+        Test of DNSLookup().request() for the case we want all records.
+        """
+
+        records = {
+            "ns_record": ["ns1.example.org"],
+            "a_record": ["192.168.1.1", "192.168.1.2"],
+            "aaaa_record": None,
+            "cname_record": None,
+            "mx_record": ["mx.example.org"],
+            "txt_record": ["hello world"],
+        }
+
+        with mock.patch.object(
+            DNSLookup, "has_nonexistent_parent", return_value=False
+        ), mock.patch.multiple(
+            DNSLookup,
+            ptr_record=mock.MagicMock(side_effect=lambda x: ["ptr." + x]),
+            **{
+                method: mock.MagicMock(return_value=value)
+                for method, value in records.items()
+            }
+        ):
+            expected = {
+                "NS": ["ns1.example.org"],
+                "A": ["192.168.1.1", "192.168.1.2"],
+                "MX": ["mx.example.org"],
+                "TXT": ["hello world"],
+                "PTR": ["ptr.192.168.1.1", "ptr.192.168.1.2"],
+            }
+            actual = DNSLookup("example.org", complete=True).request()
+
+            self.assertEqual(expected, actual)
+
+    def test_dns_lookup_query_plan(self):
+        """
+        Test of DNSLookup().request() for the case we follow the query plans.
+        """
+
+        DNSLookup.cache.clear()
+        subdomain_plan = PyFunceble.CONFIGURATION["dns_query_plan"]["subdomain"]
+
+        with mock.patch.multiple(
+            DNSLookup,
+            has_nonexistent_parent=mock.MagicMock(return_value=False),
+            get_wildcard=mock.MagicMock(return_value=None),
+            ns_record=mock.MagicMock(return_value=["ns1.example.org"]),
+            a_record=mock.MagicMock(return_value=None),
+            aaaa_record=mock.MagicMock(return_value=["::1"]),
+            cname_record=mock.MagicMock(return_value=None),
+            get_addr_info=mock.MagicMock(return_value=None),
+        ):
+            expected = {"NS": ["ns1.example.org"]}
+            actual = DNSLookup("example.org").request()
+
+            self.assertEqual(expected, actual)
+
+            expected = {"AAAA": ["::1"]}
+            actual = DNSLookup("hello.example.org").request()
+
+            self.assertEqual(expected, actual)
+
+            # The CNAME step is not asked, the AAAA one gave us something.
+            expected = {
+                "domain": {"NS": {"asked": 1, "found": 1}},
+                "subdomain": {
+                    "A": {"asked": 1, "found": 0},
+                    "AAAA": {"asked": 1, "found": 1},
+                },
+            }
+            actual = DNSLookup.cache.get_statistics()["plans"]
+
+            self.assertEqual(expected, actual)
+
+            PyFunceble.CONFIGURATION["dns_query_plan"]["subdomain"] = ["A", "CNAME"]
+
+            expected = {}
+            actual = DNSLookup("world.example.org").request()
+
+            self.assertEqual(expected, actual)
+
+            PyFunceble.CONFIGURATION["dns_query_plan"]["subdomain"] = ["HELLO"]
+
+            self.assertRaises(ValueError, DNSLookup("world.example.org").request)
+
+        PyFunceble.CONFIGURATION["dns_query_plan"]["subdomain"] = subdomain_plan
+        DNSLookup.cache.clear()
+
+    def test_dns_lookup_nonexistent(self):
+        """
+        Test of DNSLookup().request() for the case the subject does not exist.
+        """
+
+        DNSLookup.cache.clear()
+
+        with mock.patch.multiple(
+            DNSLookup,
+            has_nonexistent_parent=mock.MagicMock(return_value=False),
+            get_addr_info=mock.MagicMock(return_value=None),
+            _DNSLookup__resolve=mock.MagicMock(side_effect=dns.resolver.NXDOMAIN()),
+        ):
+            lookup = DNSLookup("example.org")
+
+            expected = {}
+            actual = lookup.request()
+
+            self.assertEqual(expected, actual)
+            self.assertTrue(lookup.nonexistent)
+
+            # The negative answer comes from the cache.
+            lookup = DNSLookup("example.org")
+
+            actual = lookup.request()
+
+            self.assertEqual(expected, actual)
+            self.assertTrue(lookup.nonexistent)
+
+        with mock.patch.multiple(
+            DNSLookup,
+            has_nonexistent_parent=mock.MagicMock(return_value=False),
+            get_addr_info=mock.MagicMock(return_value=None),
+            _DNSLookup__resolve=mock.MagicMock(side_effect=dns.resolver.NoAnswer()),
+        ):
+            lookup = DNSLookup("example.net")
+
+            actual = lookup.request()
+
+            self.assertEqual(expected, actual)
+            self.assertFalse(lookup.nonexistent)
+
+        DNSLookup.cache.clear()
+
+    def test_get_addresses(self):
+        """
+        Test of DNSLookup().get_addresses().
+        """
+
+        with mock.patch.multiple(
+            DNSLookup,
+            a_record=mock.MagicMock(return_value=None),
+            aaaa_record=mock.MagicMock(return_value=["::1"]),
+        ):
+            lookup = DNSLookup("example.org")
+
+            expected = ["192.168.1.1", "::1"]
+            actual = lookup.get_addresses(
+                {"A": ["192.168.1.1"], "AAAA": ["::1"], "addr_info": ["::1"]}
+            )
+
+            self.assertEqual(expected, actual)
+
+            # The result does not have any address, we ask for them.
+            expected = ["::1"]
+            actual = lookup.get_addresses({"NS": ["ns1.example.org"]})
+
+            self.assertEqual(expected, actual)
+
+    def test_get_addresses_negative(self):
+        """
+        Test of DNSLookup().get_addresses() for the case that the subject
+        does not have any address.
+        """
+
+        DNSLookup.cache.clear()
+
+        with mock.patch.object(
+            DNSLookup,
+            "_DNSLookup__resolve",
+            side_effect=[dns.resolver.NoAnswer(), dns.resolver.NXDOMAIN()],
+        ):
+            lookup = DNSLookup("example.org")
+
+            expected = []
+            actual = lookup.get_addresses()
+
+            self.assertEqual(expected, actual)
+            self.assertFalse(lookup.failed)
+
+        DNSLookup.cache.clear()
+
+    def test_get_addresses_failed(self):
+        """
+        Test of DNSLookup().get_addresses() for the case that we could not
+        get an answer from our DNS server(s).
+        """
+
+        DNSLookup.cache.clear()
+
+        with mock.patch.object(
+            DNSLookup,
+            "_DNSLookup__resolve",
+            side_effect=[dns.exception.Timeout(), dns.resolver.NoAnswer()],
+        ):
+            lookup = DNSLookup("example.org")
+
+            expected = None
+            actual = lookup.get_addresses()
+
+            self.assertEqual(expected, actual)
+            self.assertTrue(lookup.failed)
+
+        response = mock.MagicMock(expiration=PyFunceble.time() + 60)
+        response.__iter__.return_value = iter(["::1"])
+
+        with mock.patch.object(
+            DNSLookup,
+            "_DNSLookup__resolve",
+            side_effect=[dns.resolver.NoNameservers(), response],
+        ):
+            # We got an answer for the AAAA record.
+            lookup = DNSLookup("example.net")
+
+            expected = ["::1"]
+            actual = lookup.get_addresses()
+
+            self.assertEqual(expected, actual)
+
+        DNSLookup.cache.clear()
+
+    def test_dns_lookup_wildcard(self):
+        """
+        Test of DNSLookup().request() for the case the registrable domain
+        has a wildcard record.
+        """
+
+        PyFunceble.CONFIGURATION["dns_wildcard_detection"] = True
+        DNSLookup.wildcards.clear()
+
+        with mock.patch.object(
+            DNSLookup, "has_nonexistent_parent", return_value=False
+        ), mock.patch.object(
+            DNSLookup, "a_record", return_value=["192.168.1.1"]
+        ) as a_record:
+            lookup = DNSLookup("hello.world.example.org")
+
+            expected = {"A": ["192.168.1.1"]}
+            actual = lookup.request()
+
+            self.assertEqual(expected, actual)
+            self.assertTrue(lookup.wildcard)
+
+            lookup = DNSLookup("world.hello.example.org")
+
+            actual = lookup.request()
+
+            self.assertEqual(expected, actual)
+            self.assertTrue(lookup.wildcard)
+
+            # The subjects are still looked up but the registrable domain
+            # is only probed once.
+            self.assertEqual(3, a_record.call_count)
+
+            # The registrable domain itself is not concerned.
+            expected = None
+            actual = DNSLookup("example.org").get_wildcard()
+
+            self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["dns_wildcard_detection"] = False
+        DNSLookup.wildcards.clear()
+
+    def test_dns_lookup_wildcard_not_covered(self):
+        """
+        Test of DNSLookup().request() for the case the registrable domain
+        has a wildcard record which does not cover the subject.
+        """
+
+        PyFunceble.CONFIGURATION["dns_wildcard_detection"] = True
+        DNSLookup.wildcards.clear()
+
+        with mock.patch.object(
+            DNSLookup, "has_nonexistent_parent", return_value=False
+        ), mock.patch.object(
+            DNSLookup,
+            "a_record",
+            side_effect=lambda subject=None, lifetime=3.0: ["192.168.1.1"]
+            if subject
+            else ["192.168.1.2"],
+        ):
+            # The subject has its own A record.
+            lookup = DNSLookup("hello.example.org")
+
+            expected = {"A": ["192.168.1.2"]}
+            actual = lookup.request()
+
+            self.assertEqual(expected, actual)
+            self.assertFalse(lookup.wildcard)
+
+        with mock.patch.object(
+            DNSLookup, "has_nonexistent_parent", return_value=False
+        ), mock.patch.object(
+            DNSLookup,
+            "a_record",
+            side_effect=lambda subject=None, lifetime=3.0: ["192.168.1.1"]
+            if subject
+            else None,
+        ), mock.patch.object(
+            DNSLookup, "aaaa_record", return_value=None
+        ), mock.patch.object(
+            DNSLookup, "cname_record", return_value=["hello.example.org"]
+        ):
+            # The subject does not have any A record.
+            lookup = DNSLookup("www.example.org")
+
+            expected = {"CNAME": ["hello.example.org"]}
+            actual = lookup.request()
+
+            self.assertEqual(expected, actual)
+            self.assertFalse(lookup.wildcard)
+
+        PyFunceble.CONFIGURATION["dns_wildcard_detection"] = False
+        DNSLookup.wildcards.clear()
+
+    def test_dns_lookup_no_wildcard(self):
+        """
+        Test of DNSLookup().get_wildcard() for the case the registrable domain
+        has no wildcard record.
+        """
+
+        PyFunceble.CONFIGURATION["dns_wildcard_detection"] = True
+        DNSLookup.wildcards.clear()
+
+        with mock.patch.object(DNSLookup, "a_record", return_value=None):
+            expected = None
+            actual = DNSLookup("hello.example.org").get_wildcard()
+
+            self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["dns_wildcard_detection"] = False
+
+        with mock.patch.object(DNSLookup, "a_record", return_value=["192.168.1.1"]):
+            expected = None
+            actual = DNSLookup("hello.example.net").get_wildcard()
+
+            self.assertEqual(expected, actual)
+
+        DNSLookup.wildcards.clear()
+
+
+class TestDNSLookupFailover(TestCase):
+    """
+    Test the failover between the DNS servers of PyFunceble.dns_lookup.DNSLookup
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        DNSLookup.cache.clear()
+        DNSLookup.pools.clear()
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        DNSLookup.cache.clear()
+        DNSLookup.pools.clear()
+
+    def test_get_server_resolver(self):
+        """
+        Test DNSLookup.get_server_resolver().
+        """
+
+        resolver = dns.resolver.Resolver(configure=False)
+        resolver.nameservers = ["192.168.1.1", "192.168.1.2"]
+        resolver.search = [dns.name.from_text("example.org")]
+        resolver.ndots = 2
+        resolver.timeout = 7.0
+
+        server_resolver = DNSLookup.get_server_resolver(resolver, "192.168.1.2")
+
+        expected = ["192.168.1.2"]
+        actual = server_resolver.nameservers
+
+        self.assertEqual(expected, actual)
+
+        # The settings of the given resolver are kept.
+        self.assertEqual(resolver.search, server_resolver.search)
+        self.assertEqual(2, server_resolver.ndots)
+        self.assertEqual(7.0, server_resolver.timeout)
+
+        expected = ["192.168.1.1", "192.168.1.2"]
+        actual = resolver.nameservers
+
+        self.assertEqual(expected, actual)
+
+        self.assertIs(
+            server_resolver, DNSLookup.get_server_resolver(resolver, "192.168.1.2")
+        )
+
+        DNSLookup.server_resolvers.clear()
+
+    def test_failover(self):
+        """
+        Test DNSLookup().a_record() for the case that the chosen server
+        does not answer.
+        """
+
+        lookup = DNSLookup(
+            "hello.example.org", dns_server=["192.168.1.1", "192.168.1.2"]
+        )
+
+        resolvers = {
+            "192.168.1.1": mock.MagicMock(),
+            "192.168.1.2": mock.MagicMock(),
+        }
+        resolvers["192.168.1.1"].query.side_effect = dns.exception.Timeout()
+        resolvers["192.168.1.2"].query.side_effect = dns.resolver.NoNameservers()
+
+        with mock.patch.object(
+            DNSLookup,
+            "get_server_resolver",
+            side_effect=lambda resolver, server: resolvers[server],
+        ), mock.patch.object(
+            lookup.dns_pool, "choose", side_effect=["192.168.1.1", "192.168.1.2"]
+        ):
+            expected = None
+            actual = lookup.a_record()
+
+            self.assertEqual(expected, actual)
+
+        expected = {
+            "192.168.1.1": {
+                "queries": 1,
+                "timeouts": 1,
+                "servfails": 0,
+                "ejections": 0,
+            },
+            "192.168.1.2": {
+                "queries": 1,
+                "timeouts": 0,
+                "servfails": 1,
+                "ejections": 0,
+            },
+        }
+        actual = DNSLookup.get_server_statistics(reset=True)
+
+        for counts in actual.values():
+            del counts["latency"]
+
+        self.assertEqual(expected, actual)
+
+        expected = 0
+        actual = DNSLookup.get_server_statistics()["192.168.1.1"]["queries"]
+
+        self.assertEqual(expected, actual)
+
 
 if __name__ == "__main__":
     launch_tests()
@@ -0,0 +1,401 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.dns_prober.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import asyncio
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import dns.flags
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+from dns.exception import DNSException
+
+import PyFunceble
+from PyFunceble.dns_lookup import DNSLookup
+from PyFunceble.dns_prober import DNSProber, resolve_many
+
+
+class StandInDNSServer(asyncio.DatagramProtocol):
+    """
+    Provide a local stand-in of a DNS server.
+
+    - :code:`nx*` subjects do not exist.
+    - :code:`tc*` subjects are truncated over UDP.
+    - :code:`drop*` subjects are answered at the second try.
+    - Everything else resolves to :code:`192.0.2.1`.
+    """
+
+    def __init__(self):
+        super(StandInDNSServer, self).__init__()
+
+        self.transport = None
+        self.dropped = set()
+        self.received = 0
+
+    @classmethod
+    def answer(cls, query, truncate=False):
+        """
+        Provide the answer of the given query.
+        """
+
+        response = dns.message.make_response(query)
+        name = query.question[0].name
+
+        if str(name).startswith("nx"):
+            response.set_rcode(dns.rcode.NXDOMAIN)
+            response.authority.append(
+                dns.rrset.from_text(
+                    "example.org.",
+                    60,
+                    "IN",
+                    "SOA",
+                    "ns.example.org. hostmaster.example.org. 1 7200 900 1209600 30",
+                )
+            )
+        elif truncate:
+            response.flags |= dns.flags.TC
+        else:
+            response.answer.append(
+                dns.rrset.from_text(name, 300, "IN", "A", "192.0.2.1")
+            )
+
+        return response
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.received += 1
+
+        query = dns.message.from_wire(data)
+        name = str(query.question[0].name)
+
+        if name.startswith("drop") and name not in self.dropped:
+            self.dropped.add(name)
+            return
+
+        self.transport.sendto(
+            self.answer(query, truncate=name.startswith("tc")).to_wire(), addr
+        )
+
+    async def handle_tcp(self, reader, writer):
+        """
+        Answer a query over TCP.
+        """
+
+        length = int.from_bytes(await reader.readexactly(2), "big")
+        query = dns.message.from_wire(await reader.readexactly(length))
+
+        wire = self.answer(query).to_wire()
+        writer.write(len(wire).to_bytes(2, "big") + wire)
+
+        await writer.drain()
+        writer.close()
+
+
+class TestDNSProber(TestCase):
+    """
+    Test PyFunceble.dns_prober.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+        DNSLookup.cache.clear()
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.tcp_server = self.loop.run_until_complete(
+            asyncio.start_server(self.handle_tcp, "127.0.0.1", 0)
+        )
+        self.port = self.tcp_server.sockets[0].getsockname()[1]
+
+        self.udp_server, self.server = self.loop.run_until_complete(
+            self.loop.create_datagram_endpoint(
+                StandInDNSServer, local_addr=("127.0.0.1", self.port)
+            )
+        )
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        self.udp_server.close()
+        self.tcp_server.close()
+        self.loop.run_until_complete(self.tcp_server.wait_closed())
+        self.loop.close()
+
+        asyncio.set_event_loop(None)
+        DNSLookup.cache.clear()
+
+    async def handle_tcp(self, reader, writer):
+        """
+        Give the TCP connections to the stand-in server.
+        """
+
+        await self.server.handle_tcp(reader, writer)
+
+    def resolve_many(self, subjects, **kwargs):
+        """
+        Resolve the given subjects through the stand-in server.
+        """
+
+        async def collect():
+            return {
+                subject: records
+                async for subject, records in resolve_many(
+                    subjects, dns_server="127.0.0.1", port=self.port, **kwargs
+                )
+            }
+
+        return self.loop.run_until_complete(collect())
+
+    def test_resolve_many(self):
+        """
+        Test resolve_many() for the case that everything resolves.
+        """
+
+        subjects = ["hello{0}.example.org".format(x) for x in range(500)]
+
+        expected = {x: ["192.0.2.1"] for x in subjects}
+        actual = self.resolve_many(subjects, max_outstanding=64)
+
+        self.assertEqual(expected, actual)
+
+    def test_resolve_many_nxdomain(self):
+        """
+        Test resolve_many() for the case that the subject does not exist.
+        """
+
+        expected = {"nx.example.org": None}
+        actual = self.resolve_many(["nx.example.org"])
+
+        self.assertEqual(expected, actual)
+
+        key = (("127.0.0.1",), "nx.example.org", "NXDOMAIN")
+
+        expected = (True, True)
+        actual = DNSLookup.cache.get(key)
+
+        self.assertEqual(expected, actual)
+
+    def test_resolve_many_cached(self):
+        """
+        Test resolve_many() for the case that the answer is cached.
+        """
+
+        self.resolve_many(["hello.example.org"])
+        received = self.server.received
+
+        expected = {"hello.example.org": ["192.0.2.1"]}
+        actual = self.resolve_many(["hello.example.org"])
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(received, self.server.received)
+
+    def test_resolve_many_truncated(self):
+        """
+        Test resolve_many() for the case that the UDP response is truncated.
+        """
+
+        expected = {"tc.example.org": ["192.0.2.1"]}
+        actual = self.resolve_many(["tc.example.org"])
+
+        self.assertEqual(expected, actual)
+
+    def test_resolve_many_retry(self):
+        """
+        Test resolve_many() for the case that the first query times out.
+        """
+
+        expected = {"drop.example.org": ["192.0.2.1"]}
+        actual = self.resolve_many(["drop.example.org"], timeout=0.2)
+
+        self.assertEqual(expected, actual)
+
+        DNSLookup.cache.clear()
+
+        expected = {"drop2.example.org": None}
+        actual = self.resolve_many(["drop2.example.org"], timeout=0.2, retries=0)
+
+        self.assertEqual(expected, actual)
+
+    def test_resolve_many_invalid_record_type(self):
+        """
+        Test resolve_many() for the case that the record type is invalid.
+        """
+
+        self.assertRaises(
+            dns.rdatatype.UnknownRdatatype,
+            self.resolve_many,
+            ["hello.example.org"],
+            record_type="HELLO",
+        )
+
+    def test_get_question(self):
+        """
+        Test DNSProber.get_question().
+        """
+
+        expected = b"\x05hello\x07example\x03org\x00\x00\x01\x00\x01"
+        actual = DNSProber.get_question("hello.example.org", dns.rdatatype.A)
+
+        self.assertEqual(expected, actual)
+
+        for name in ["hello..example.org", "{0}.example.org".format("a" * 64)]:
+            expected = None
+            actual = DNSProber.get_question(name, dns.rdatatype.A)
+
+            self.assertEqual(expected, actual)
+
+    def test_parse_response(self):
+        """
+        Test DNSProber.parse_response().
+        """
+
+        query = dns.message.make_query("www.example.org", "MX")
+        question = DNSProber.get_question("www.example.org", dns.rdatatype.MX)
+
+        response = dns.message.make_response(query)
+        response.answer.append(
+            dns.rrset.from_text(
+                "www.example.org.", 300, "IN", "CNAME", "mail.example.org."
+            )
+        )
+        response.answer.append(
+            dns.rrset.from_text(
+                "mail.example.org.", 60, "IN", "MX", "10 mx.example.org."
+            )
+        )
+
+        expected = {
+            "rcode": 0,
+            "truncated": False,
+            "records": ["10 mx.example.org."],
+            "ttl": 60,
+            "negative_ttl": None,
+        }
+        actual = DNSProber.parse_response(response.to_wire(), question)
+
+        self.assertEqual(expected, actual)
+
+        response = StandInDNSServer.answer(
+            dns.message.make_query("nx.example.org", "MX")
+        )
+
+        expected = {
+            "rcode": 3,
+            "truncated": False,
+            "records": [],
+            "ttl": None,
+            "negative_ttl": 30,
+        }
+        actual = DNSProber.parse_response(
+            response.to_wire(),
+            DNSProber.get_question("nx.example.org", dns.rdatatype.MX),
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_parse_response_malformed(self):
+        """
+        Test DNSProber.parse_response() for the case that the response
+        is malformed.
+        """
+
+        query = dns.message.make_query("hello.example.org", "A")
+        question = DNSProber.get_question("hello.example.org", dns.rdatatype.A)
+
+        data = StandInDNSServer.answer(query).to_wire()
+
+        self.assertRaises(DNSException, DNSProber.parse_response, data[:-2], question)
+
+    def test_close(self):
+        """
+        Test DNSProber.close().
+        """
+
+        prober = DNSProber(dns_server="127.0.0.1", port=self.port, sockets=2)
+
+        self.loop.run_until_complete(prober.open())
+
+        expected = 2
+        actual = len(prober.channels[list(prober.channels)[0]])
+
+        self.assertEqual(expected, actual)
+
+        prober.close()
+
+        expected = {}
+        actual = prober.channels
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,166 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.dns_server_pool.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import unittest.mock as mock  # pylint: disable=useless-import-alias
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.dns_server_pool import DNSServerPool
+
+
+class TestDNSServerPool(TestCase):
+    """
+    Test PyFunceble.dns_server_pool.DNSServerPool
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.pool = DNSServerPool(["192.168.1.1", "192.168.1.2"])
+
+    def test_report(self):
+        """
+        Test DNSServerPool.report().
+        """
+
+        self.pool.report("192.168.1.1", 0.01, "ok")
+        self.pool.report("192.168.1.1", 0.03, "timeout")
+        self.pool.report("192.168.1.1", 0.02, "servfail")
+
+        expected = {
+            "queries": 3,
+            "latency": 0.06,
+            "timeouts": 1,
+            "servfails": 1,
+            "ejections": 0,
+        }
+        actual = self.pool.statistics["192.168.1.1"]
+        actual["latency"] = round(actual["latency"], 2)
+
+        self.assertEqual(expected, actual)
+
+        expected = 2
+        actual = self.pool.servers["192.168.1.1"]["failures"]
+
+        self.assertEqual(expected, actual)
+
+        self.pool.report("192.168.1.1", 0.01, "ok")
+
+        expected = 0
+        actual = self.pool.servers["192.168.1.1"]["failures"]
+
+        self.assertEqual(expected, actual)
+
+    def test_ejection(self):
+        """
+        Test DNSServerPool.choose() for the case that a server is ejected.
+        """
+
+        for _ in range(DNSServerPool.max_failures):
+            self.pool.report("192.168.1.1", 3.0, "timeout")
+
+        expected = 1
+        actual = self.pool.statistics["192.168.1.1"]["ejections"]
+
+        self.assertEqual(expected, actual)
+
+        for _ in range(20):
+            expected = "192.168.1.2"
+            actual = self.pool.choose()
+
+            self.assertEqual(expected, actual)
+
+        # Every other server is excluded, we get the ejected one.
+        expected = "192.168.1.1"
+        actual = self.pool.choose(exclude=["192.168.1.2"])
+
+        self.assertEqual(expected, actual)
+
+        expected = None
+        actual = self.pool.choose(exclude=["192.168.1.1", "192.168.1.2"])
+
+        self.assertEqual(expected, actual)
+
+    def test_choose_weights(self):
+        """
+        Test DNSServerPool.choose() for the case that a server is slower.
+        """
+
+        self.pool.report("192.168.1.1", 0.01, "ok")
+        self.pool.report("192.168.1.2", 0.1, "ok")
+
+        with mock.patch(
+            "PyFunceble.dns_server_pool.choices", side_effect=lambda x, weights: [x[0]]
+        ) as choices:
+            self.pool.choose()
+
+            weights = choices.call_args[1]["weights"]
+
+            self.assertAlmostEqual(10, weights[0] / weights[1])
+
+
+if __name__ == "__main__":
+    launch_tests()
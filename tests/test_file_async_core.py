@@ -0,0 +1,254 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.file_async_core.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=protected-access
+from threading import Lock, current_thread
+from time import sleep
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest import mock
+
+import PyFunceble
+from PyFunceble.file_async_core import FileAsyncCore
+from PyFunceble.helpers import File
+
+
+class TestFileAsyncCore(TestCase):
+    """
+    Test PyFunceble.file_async_core.FileAsyncCore.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.config = PyFunceble.CONFIGURATION.copy()
+        PyFunceble.CONFIGURATION.update({"concurrency": 2, "quiet": True})
+
+        PyFunceble.INTERN["start"] = int(PyFunceble.time())
+
+        self.file_to_test = "this_file_is_a_ghost"
+        File(self.file_to_test).write(
+            "\n".join(
+                [
+                    "# This is a comment.",
+                    "hello.world",
+                    "world.hello",
+                    "0.0.0.0 localhost",
+                    "hello.world.com",
+                    "world.hello.com",
+                    "hello.world.org",
+                ]
+            ),
+            overwrite=True,
+        )
+
+        self.file_core = FileAsyncCore(self.file_to_test)
+
+        # We initiate the number of tests in flight.
+        self.in_flight = 0
+        # We initiate the maximal number of tests in flight we saw.
+        self.maximal_in_flight = 0
+        # We initiate the lock of both counters.
+        self.lock = Lock()
+        # We initiate the list of threads which printed something.
+        self.printed_from = []
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        PyFunceble.CONFIGURATION.clear()
+        PyFunceble.CONFIGURATION.update(self.config)
+        del PyFunceble.INTERN["start"]
+
+        File(self.file_to_test).delete()
+        File(
+            PyFunceble.CONFIG_DIRECTORY
+            + PyFunceble.OUTPUTS["default_files"]["inactive_db"]
+        ).delete()
+
+    def stand_in_test_subject(self, subject):
+        """
+        Stand in for :func:`~PyFunceble.file_core.FileCore._test_subject`.
+        """
+
+        with self.lock:
+            self.in_flight += 1
+            self.maximal_in_flight = max(self.maximal_in_flight, self.in_flight)
+
+        sleep(0.02)
+
+        with self.lock:
+            self.in_flight -= 1
+
+        # We print the subject as with the simple mode.
+        self.file_core.print_simple(subject, "ACTIVE")
+
+        return {"subject": subject, "status": "ACTIVE", "mined": []}
+
+    def stand_in_print(self, *args):
+        """
+        Stand in for :code:`print`.
+        """
+
+        subject = args[0].split()[-2].split(PyFunceble.Style.BRIGHT)[-1]
+
+        self.printed_from.append((current_thread().name, subject))
+
+    def run_test(self):
+        """
+        Test the file with a stand in of the test of a subject.
+
+        :return: The list of saved subjects.
+        :rtype: list
+        """
+
+        with mock.patch.object(
+            FileAsyncCore, "_test_subject", side_effect=self.stand_in_test_subject
+        ), mock.patch.object(
+            FileAsyncCore, "_save_result"
+        ) as save_result, mock.patch(
+            "PyFunceble.CLICore.print_header"
+        ), mock.patch(
+            "builtins.print", side_effect=self.stand_in_print
+        ):
+            self.file_core.read_and_test_file_content()
+
+        return [x[0][0]["subject"] for x in save_result.call_args_list]
+
+    def test_bounded_in_flight(self):
+        """
+        Test that the number of tests in flight is bounded by the concurrency.
+        """
+
+        expected = [
+            "hello.world",
+            "hello.world.com",
+            "hello.world.org",
+            "world.hello",
+            "world.hello.com",
+        ]
+        actual = self.run_test()
+
+        self.assertEqual(expected, sorted(actual))
+
+        self.assertEqual(2, self.maximal_in_flight)
+        self.assertEqual(len(expected), self.file_core.tested)
+
+    def test_outputs_from_event_loop(self):
+        """
+        Test that what the tests generate is written by the event loop.
+        """
+
+        expected = self.run_test()
+        actual = [x for _, x in self.printed_from]
+
+        self.assertEqual(sorted(expected), sorted(actual))
+
+        for thread, _ in self.printed_from:
+            self.assertEqual(current_thread().name, thread)
+
+    def test_maximal_threads(self):
+        """
+        Test that the number of threads is bounded whatever the concurrency.
+        """
+
+        expected = 2
+        actual = self.file_core.get_maximal_threads()
+
+        self.assertEqual(expected, actual)
+
+        PyFunceble.CONFIGURATION["concurrency"] = 2000
+
+        self.assertLessEqual(self.file_core.get_maximal_threads(), 32)
+
+    def test_mining_and_complements(self):
+        """
+        Test that the mined subjects and the complements are tested.
+        """
+
+        with mock.patch.object(
+            self.file_core.mining,
+            "list_of_mined",
+            return_value=[("hello.world", "mined.hello.world")],
+        ), mock.patch.object(
+            self.file_core.mining, "remove"
+        ) as remove, mock.patch.object(
+            FileAsyncCore, "get_complements", return_value=["www.hello.world"]
+        ):
+            actual = self.run_test()
+
+        self.assertEqual(["www.hello.world"], actual[-1:])
+        self.assertEqual(["mined.hello.world"], actual[-2:-1])
+
+        remove.assert_called_once_with("hello.world", "mined.hello.world")
+
+        self.assertEqual(7, self.file_core.tested)
+        self.assertFalse(self.file_core.complements_test_started)
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -59,12 +59,15 @@ License:
     SOFTWARE.
 """
 # pylint: enable=line-too-long
-
+# pylint: disable=protected-access
+from io import StringIO
 from unittest import TestCase
 from unittest import main as launch_tests
+from unittest import mock
 
 import PyFunceble
 from PyFunceble.file_core import FileCore
+from PyFunceble.helpers import File
 
 
 class TestsFormatLine(TestCase):
@@ -282,5 +285,380 @@ class TestSimpleColoration(TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestSubjectTest(TestCase):
+    """
+    Test the split of the test of a line into
+    PyFunceble.file_core.FileCore._get_subject(),
+    PyFunceble.file_core.FileCore._test_subject() and
+    PyFunceble.file_core.FileCore._save_result().
+    """
+
+    def setUp(self):
+        """
+        Setup everything that is needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.config = PyFunceble.CONFIGURATION.copy()
+        PyFunceble.CONFIGURATION["quiet"] = False
+
+        PyFunceble.INTERN["start"] = int(PyFunceble.time())
+
+        self.file_to_test = "this_file_is_a_ghost"
+        File(self.file_to_test).write("", overwrite=True)
+
+        self.file_core = FileCore(self.file_to_test)
+
+    def tearDown(self):
+        """
+        Setup everything that is needed after the tests.
+        """
+
+        PyFunceble.CONFIGURATION.clear()
+        PyFunceble.CONFIGURATION.update(self.config)
+        del PyFunceble.INTERN["start"]
+
+        File(self.file_to_test).delete()
+        File(
+            PyFunceble.CONFIG_DIRECTORY
+            + PyFunceble.OUTPUTS["default_files"]["inactive_db"]
+        ).delete()
+
+    def test_get_subject(self):
+        """
+        Test the case that we get the subject to test from a line.
+        """
+
+        given = {
+            "# hello.world": None,
+            "": None,
+            "0.0.0.0 localhost": None,
+            "192.168.1.1": None,
+            "0.0.0.0 hello.world # world": "hello.world",
+        }
+
+        for line, expected in given.items():
+            actual = self.file_core._get_subject(line)
+
+            self.assertEqual(expected, actual)
+
+    def test_get_subject_filter(self):
+        """
+        Test the case that we get the subject to test from a line
+        while filtering.
+        """
+
+        PyFunceble.CONFIGURATION["filter"] = r"\.world$"
+
+        expected = "hello.world"
+        actual = self.file_core._get_subject("hello.world")
+
+        self.assertEqual(expected, actual)
+
+        actual = self.file_core._get_subject("world.hello")
+
+        self.assertIsNone(actual)
+
+    def test_test_subject_up(self):
+        """
+        Test the case that the tested subject is up.
+        """
+
+        with mock.patch.object(
+            self.file_core, "_process_test", return_value="ACTIVE"
+        ), mock.patch.object(
+            self.file_core.mining, "get_mined", return_value=["www.hello.world"]
+        ):
+            expected = {
+                "subject": "hello.world",
+                "status": "ACTIVE",
+                "mined": ["www.hello.world"],
+            }
+            actual = self.file_core._test_subject("hello.world")
+
+        self.assertEqual(expected, actual)
+
+    def test_test_subject_down(self):
+        """
+        Test the case that the tested subject is down.
+        """
+
+        with mock.patch.object(
+            self.file_core, "_process_test", return_value="INACTIVE"
+        ), mock.patch.object(self.file_core.mining, "get_mined") as get_mined:
+            expected = {"subject": "hello.world", "status": "INACTIVE", "mined": []}
+            actual = self.file_core._test_subject("hello.world")
+
+        self.assertEqual(expected, actual)
+
+        get_mined.assert_not_called()
+
+    def test_save_result(self):
+        """
+        Test the case that we save a down then up subject.
+        """
+
+        with mock.patch.object(
+            self.file_core.autocontinue, "add"
+        ) as autocontinue_add, mock.patch.object(
+            self.file_core.mining, "add"
+        ) as mining_add, mock.patch(
+            "PyFunceble.file_core.Generate"
+        ) as generate:
+            self.file_core._save_result(
+                {"subject": "hello.world", "status": "INACTIVE", "mined": []}
+            )
+
+            self.assertIn("hello.world", self.file_core.inactive_db)
+            mining_add.assert_not_called()
+
+            self.file_core._save_result(
+                {
+                    "subject": "hello.world",
+                    "status": "ACTIVE",
+                    "mined": ["www.hello.world"],
+                }
+            )
+
+        self.assertNotIn("hello.world", self.file_core.inactive_db)
+
+        autocontinue_add.assert_has_calls(
+            [mock.call("hello.world", "INACTIVE"), mock.call("hello.world", "ACTIVE")]
+        )
+        mining_add.assert_called_once_with("hello.world", ["www.hello.world"])
+        generate.assert_called_once()
+
+    def test_flush_databases(self):
+        """
+        Test that our databases are saved when we flush them.
+        """
+
+        with mock.patch.object(
+            self.file_core.inactive_db, "save"
+        ) as inactive_db_save, mock.patch.object(
+            self.file_core.dns_db, "save"
+        ) as dns_db_save, mock.patch.object(
+            self.file_core.autocontinue, "save"
+        ) as autocontinue_save:
+            self.file_core._flush_databases()
+
+        inactive_db_save.assert_called_once_with()
+        dns_db_save.assert_called_once_with()
+        autocontinue_save.assert_called_once_with()
+
+    def test_print_throughput(self):
+        """
+        Test the print of the number of subjects tested per second.
+        """
+
+        self.file_core.tested = 10
+        self.file_core.testing_time = 4
+
+        with mock.patch("sys.stdout", new_callable=StringIO) as stdout:
+            self.file_core.print_throughput("with 2 processes")
+
+        expected = "10 subjects tested with 2 processes (2.50 subjects/sec)."
+        actual = stdout.getvalue()
+
+        self.assertIn(expected, actual)
+
+    def test_print_throughput_nothing_tested(self):
+        """
+        Test the print of the number of subjects tested per second
+        when nothing was tested.
+        """
+
+        with mock.patch("sys.stdout", new_callable=StringIO) as stdout:
+            self.file_core.print_throughput("with 2 processes")
+
+        self.assertEqual("", stdout.getvalue())
+
+
+class TestSubjectsToTest(TestCase):
+    """
+    Test PyFunceble.file_core.FileCore._get_list_to_of_subjects_to_test_from_file().
+    """
+
+    def setUp(self):
+        """
+        Setup everything that is needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.config = {
+            x: PyFunceble.CONFIGURATION[x]
+            for x in [
+                "input_buffer_size",
+                "sort_input",
+                "hierarchical_sorting",
+                "multiprocess",
+                "asynchronous",
+            ]
+        }
+        PyFunceble.CONFIGURATION.update(
+            {
+                "sort_input": False,
+                "hierarchical_sorting": False,
+                "multiprocess": False,
+                "asynchronous": False,
+            }
+        )
+
+        PyFunceble.INTERN["start"] = int(PyFunceble.time())
+
+        self.file_to_test = "this_file_is_a_ghost"
+        File(self.file_to_test).write("", overwrite=True)
+
+        self.file_core = FileCore(self.file_to_test)
+
+    def tearDown(self):
+        """
+        Setup everything that is needed after the tests.
+        """
+
+        PyFunceble.CONFIGURATION.update(self.config)
+        del PyFunceble.INTERN["start"]
+
+        File(self.file_to_test).delete()
+
+    def get_subjects_to_test(
+        self, lines, already_tested=None, inactive=None, to_retest=None
+    ):
+        """
+        Get the list of subjects to test from the given lines.
+
+        :param list lines: The lines of the file.
+        :param set already_tested: The subjects already tested.
+        :param set inactive: The inactive subjects already tested.
+        :param set to_retest: The inactive subjects to retest.
+
+        :rtype: list
+        """
+
+        with mock.patch.object(
+            self.file_core.autocontinue,
+            "get_already_tested",
+            return_value=already_tested or set(),
+        ), mock.patch.object(
+            self.file_core.inactive_db,
+            "get_already_tested",
+            return_value=inactive or set(),
+        ), mock.patch.object(
+            self.file_core.inactive_db, "get_to_retest", return_value=to_retest or set()
+        ):
+            return list(
+                self.file_core._get_list_to_of_subjects_to_test_from_file(
+                    StringIO("\n".join(lines))
+                )
+            )
+
+    def test_deduplication(self):
+        """
+        Test the case that the file contains duplicates.
+        """
+
+        given = ["a.com", "b.com", "a.com", "c.com", "d.com", "a.com"]
+
+        PyFunceble.CONFIGURATION["input_buffer_size"] = 100
+
+        expected = ["a.com", "b.com", "c.com", "d.com"]
+        actual = self.get_subjects_to_test(given)
+
+        self.assertEqual(expected, actual)
+
+    def test_deduplication_window(self):
+        """
+        Test the case that the file contains duplicates which are
+        farther than the number of subjects we keep in memory.
+        """
+
+        given = ["a.com", "b.com", "a.com", "c.com", "d.com", "a.com"]
+
+        PyFunceble.CONFIGURATION["input_buffer_size"] = 2
+
+        expected = ["a.com", "b.com", "c.com", "d.com", "a.com"]
+        actual = self.get_subjects_to_test(given)
+
+        self.assertEqual(expected, actual)
+
+    def test_skip_tested(self):
+        """
+        Test the case that some subjects were already tested.
+        """
+
+        given = ["a.com", "b.com", "c.com", "d.com", "e.com"]
+
+        expected = ["a.com", "e.com", "d.com"]
+        actual = self.get_subjects_to_test(
+            given,
+            already_tested={"b.com"},
+            inactive={"c.com"},
+            to_retest={"d.com"},
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_everything_tested(self):
+        """
+        Test the case that every subject was already tested.
+        """
+
+        given = ["a.com", "b.com", "c.com"]
+
+        expected = ["a.com", "b.com", "c.com"]
+        actual = self.get_subjects_to_test(
+            given, already_tested={"a.com", "b.com"}, inactive={"c.com"}
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_everything_tested_but_retest(self):
+        """
+        Test the case that every subject was already tested but
+        some of them have to be retested.
+        """
+
+        given = ["a.com", "b.com"]
+
+        expected = ["a.com", "b.com"]
+        actual = self.get_subjects_to_test(
+            given, already_tested={"a.com"}, to_retest={"b.com"}
+        )
+
+        self.assertEqual(expected, actual)
+
+    def test_sort_by_block(self):
+        """
+        Test the case that we sort the subjects by block.
+        """
+
+        given = ["f.com", "e.com", "d.com", "c.com", "b.com", "a.com", "g.com"]
+
+        PyFunceble.CONFIGURATION.update({"input_buffer_size": 3, "sort_input": True})
+
+        expected = ["d.com", "e.com", "f.com", "a.com", "b.com", "c.com", "g.com"]
+        actual = self.get_subjects_to_test(given)
+
+        self.assertEqual(expected, actual)
+
+    def test_no_sort_multiprocess(self):
+        """
+        Test the case that we do not sort while testing with multiple processes.
+        """
+
+        given = ["f.com", "e.com", "d.com", "c.com"]
+
+        PyFunceble.CONFIGURATION.update(
+            {"input_buffer_size": 3, "sort_input": True, "multiprocess": True}
+        )
+
+        expected = ["f.com", "e.com", "d.com", "c.com"]
+        actual = self.get_subjects_to_test(given)
+
+        self.assertEqual(expected, actual)
+
+
 if __name__ == "__main__":
     launch_tests()
@@ -0,0 +1,372 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.file_multiprocess_core.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+# pylint: disable=protected-access
+from multiprocessing import Queue
+from os import _exit, getpid
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest import mock
+
+import PyFunceble
+from PyFunceble.auto_continue import AutoContinue
+from PyFunceble.dns_db import DNSDB
+from PyFunceble.file_multiprocess_core import FileMultiprocessCore, OurProcessWrapper
+from PyFunceble.helpers import File
+from PyFunceble.inactive_db import InactiveDB
+from PyFunceble.mining import Mining
+from PyFunceble.whois_db import WhoisDB
+
+
+def interrupt(subject):
+    """
+    Return the given subject or interrupt the process.
+    """
+
+    if subject == "crash":
+        raise KeyboardInterrupt()
+
+    return subject
+
+
+def die(subject):
+    """
+    Return the given subject or kill the process without any notice.
+    """
+
+    if subject == "crash":
+        _exit(9)
+
+    return subject
+
+
+class TestOurProcessWrapper(TestCase):
+    """
+    Test PyFunceble.file_multiprocess_core.OurProcessWrapper.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        self.tasks = Queue()
+        self.results = Queue()
+
+    def test_chunk(self):
+        """
+        Test the case that every subject of a chunk is tested.
+        """
+
+        process = OurProcessWrapper(self.tasks, self.results, target=interrupt)
+        process.start()
+
+        self.tasks.put(["hello", "world"])
+        self.tasks.put(None)
+
+        expected = (["hello", "world"], None)
+        actual = FileMultiprocessCore.get_results([process], self.results)
+
+        self.assertEqual(expected, actual)
+
+        process.join()
+
+        self.assertEqual(0, process.exitcode)
+
+    def test_interrupted_mid_chunk(self):
+        """
+        Test the case that a process is interrupted in the middle of a chunk.
+        """
+
+        process = OurProcessWrapper(self.tasks, self.results, target=interrupt)
+        process.start()
+
+        self.tasks.put(["hello", "crash", "world"])
+
+        records, traceback = FileMultiprocessCore.get_results(
+            [process], self.results
+        )
+
+        self.assertEqual(["hello"], records)
+        self.assertIn("KeyboardInterrupt", traceback)
+
+        process.join()
+
+    def test_died_mid_chunk(self):
+        """
+        Test the case that a process dies in the middle of a chunk.
+        """
+
+        process = OurProcessWrapper(self.tasks, self.results, target=die)
+        process.start()
+
+        self.tasks.put(["hello", "crash", "world"])
+
+        expected = (
+            [],
+            "{0} died unexpectedly (exit code: 9).".format(process.name),
+        )
+        actual = FileMultiprocessCore.get_results(
+            [process], self.results, timeout=0.1
+        )
+
+        self.assertEqual(expected, actual)
+
+
+class TestFileMultiprocessCore(TestCase):
+    """
+    Test PyFunceble.file_multiprocess_core.FileMultiprocessCore.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.config = PyFunceble.CONFIGURATION.copy()
+        PyFunceble.CONFIGURATION.update({"maximal_processes": 2, "quiet": True})
+
+        PyFunceble.INTERN["start"] = int(PyFunceble.time())
+
+        self.file_to_test = "this_file_is_a_ghost"
+        File(self.file_to_test).write(
+            "\n".join(
+                [
+                    "hello.world",
+                    "world.hello",
+                    "hello.world.com",
+                    "world.hello.com",
+                    "hello.world.org",
+                    "world.hello.org",
+                    "hello.world.net",
+                ]
+            ),
+            overwrite=True,
+        )
+
+        self.file_core = FileMultiprocessCore(self.file_to_test)
+
+        # We initiate the list of processes which loaded one of our databases.
+        self.loads = []
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        PyFunceble.CONFIGURATION.clear()
+        PyFunceble.CONFIGURATION.update(self.config)
+        del PyFunceble.INTERN["start"]
+
+        File(self.file_to_test).delete()
+        File(
+            PyFunceble.CONFIG_DIRECTORY
+            + PyFunceble.OUTPUTS["default_files"]["inactive_db"]
+        ).delete()
+        File(
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS["default_files"]["dns_db"]
+        ).delete()
+
+        DNSDB.database.clear()
+        PyFunceble.DNSLookup.cache.clear()
+
+    def load(self):
+        """
+        Stand in for the loading of our databases.
+        """
+
+        self.loads.append(getpid())
+
+    def stand_in_test_subject(self, subject):
+        """
+        Stand in for :func:`~PyFunceble.file_core.FileCore._test_subject`.
+        """
+
+        if subject.startswith("world"):
+            status, mined = "INACTIVE", []
+            PyFunceble.DNSLookup.cache.set((("8.8.8.8",), subject, "A"), None, 60)
+        else:
+            status, mined = "ACTIVE", ["www.{0}".format(subject)]
+            PyFunceble.DNSLookup.cache.set(
+                (("8.8.8.8",), subject, "A"), ["127.0.0.1"], 60
+            )
+
+        return {
+            "subject": subject,
+            "status": status,
+            "mined": mined,
+            "pid": getpid(),
+            "loads": [x for x in self.loads if x == getpid()],
+        }
+
+    def test_save_results(self):
+        """
+        Test that the results of our processes are saved
+        by the parent process only.
+        """
+
+        with mock.patch.object(
+            FileMultiprocessCore,
+            "_test_subject",
+            side_effect=self.stand_in_test_subject,
+        ), mock.patch.object(
+            self.file_core, "_save_result", wraps=self.file_core._save_result
+        ) as save_result, mock.patch.object(
+            self.file_core.autocontinue, "add", wraps=self.file_core.autocontinue.add
+        ) as autocontinue_add, mock.patch.object(
+            self.file_core.mining, "add"
+        ) as mining_add, mock.patch.object(
+            AutoContinue, "load", side_effect=self.load
+        ), mock.patch.object(
+            InactiveDB, "load", side_effect=self.load
+        ), mock.patch.object(
+            Mining, "load", side_effect=self.load
+        ), mock.patch.object(
+            WhoisDB, "load", side_effect=self.load
+        ), mock.patch(
+            "PyFunceble.CLICore.print_header"
+        ):
+            self.file_core.read_and_test_file_content()
+
+        records = [x[0][0] for x in save_result.call_args_list]
+
+        expected = [
+            "hello.world",
+            "hello.world.com",
+            "hello.world.net",
+            "hello.world.org",
+            "world.hello",
+            "world.hello.com",
+            "world.hello.org",
+        ]
+        actual = sorted([x["subject"] for x in records])
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(len(expected), self.file_core.tested)
+
+        for record in records:
+            # The records were sent by our processes which never
+            # loaded any of our databases.
+            self.assertNotEqual(getpid(), record["pid"])
+            self.assertEqual([], record["loads"])
+
+        # The single in-memory state of the parent process is up to date.
+        self.assertEqual(
+            sorted(expected),
+            sorted([x[0][0] for x in autocontinue_add.call_args_list]),
+        )
+
+        mining_add.assert_has_calls(
+            [
+                mock.call(x, ["www.{0}".format(x)])
+                for x in expected
+                if x.startswith("hello")
+            ],
+            any_order=True,
+        )
+
+        for subject in expected:
+            if subject.startswith("world"):
+                self.assertIn(subject, self.file_core.inactive_db)
+            else:
+                self.assertNotIn(subject, self.file_core.inactive_db)
+
+    def test_save_dns_answers(self):
+        """
+        Test that the DNS answers of our processes are saved
+        by the parent process.
+        """
+
+        PyFunceble.CONFIGURATION.update({"dns_database": True, "db_type": "json"})
+        DNSDB.database.clear()
+
+        self.file_core = FileMultiprocessCore(self.file_to_test)
+
+        with mock.patch.object(
+            FileMultiprocessCore,
+            "_test_subject",
+            side_effect=self.stand_in_test_subject,
+        ), mock.patch.object(self.file_core.mining, "add"), mock.patch(
+            "PyFunceble.CLICore.print_header"
+        ):
+            self.file_core.read_and_test_file_content()
+
+        expected = {
+            "hello.world": ["127.0.0.1"],
+            "hello.world.com": ["127.0.0.1"],
+            "hello.world.net": ["127.0.0.1"],
+            "hello.world.org": ["127.0.0.1"],
+            "world.hello": None,
+            "world.hello.com": None,
+            "world.hello.org": None,
+        }
+        actual = {
+            subject: data["A"]["answer"]
+            for subject, data in DNSDB.database["8.8.8.8"].items()
+        }
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
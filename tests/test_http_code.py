@@ -60,11 +60,18 @@ License:
 """
 # pylint: enable=line-too-long
 import unittest.mock as mock  # pylint: disable=useless-import-alias
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from unittest import main as launch_tests
 
 import PyFunceble
-from PyFunceble.http_code import HTTPCode
+from PyFunceble.http_code import (
+    HTTPBody,
+    HTTPCode,
+    HTTPHostCache,
+    HTTPRedirects,
+    HTTPSession,
+)
 
 
 class TestHTTPCode(TestCase):
@@ -139,6 +146,579 @@ class TestHTTPCode(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_access_addresses(self):
+        """
+        Test of HTTPCode()._access() for the case that the
+        addresses of the domain are given.
+        """
+
+        # pylint: disable=protected-access
+
+        response = mock.MagicMock(status_code=200)
+
+        with mock.patch.object(
+            PyFunceble.requests.Session,
+            "head",
+            side_effect=[PyFunceble.requests.ConnectionError(), response],
+        ) as head:
+            expected = 200
+            actual = HTTPCode(
+                self.subject, self.subject_type, addresses=["192.168.1.1", "::1"]
+            )._access()
+
+            self.assertEqual(expected, actual)
+
+            expected = ["http://192.168.1.1:80", "http://[::1]:80"]
+            actual = [x[0][0] for x in head.call_args_list]
+
+            self.assertEqual(expected, actual)
+
+            expected = self.subject
+            actual = head.call_args[1]["headers"]["Host"]
+
+            self.assertEqual(expected, actual)
+
+    def test_access_no_address(self):
+        """
+        Test of HTTPCode()._access() for the case that the
+        domain has no address.
+        """
+
+        # pylint: disable=protected-access
+
+        with mock.patch.object(PyFunceble.requests.Session, "head") as head:
+            expected = None
+            actual = HTTPCode(self.subject, self.subject_type, addresses=[])._access()
+
+            self.assertEqual(expected, actual)
+            head.assert_not_called()
+
+
+class TestHTTPSession(TestCase):
+    """
+    Test PyFunceble.http_code.HTTPSession.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        HTTPSession.close()
+
+    def test_get_session(self):
+        """
+        Test of HTTPSession.get_session().
+        """
+
+        session = HTTPSession.get_session()
+
+        self.assertIs(session, HTTPSession.get_session())
+
+        adapter = session.get_adapter("http://example.org")
+
+        expected = PyFunceble.CONFIGURATION["http_pool_size"]
+        actual = adapter.poolmanager.connection_pool_kw["maxsize"]
+
+        self.assertEqual(expected, actual)
+
+        # Each thread gets its own session.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(HTTPSession.get_session).result()
+
+        self.assertIsNot(session, other)
+
+        expected = [session, other]
+        actual = HTTPSession.sessions
+
+        self.assertEqual(expected, actual)
+
+    def test_close(self):
+        """
+        Test of HTTPSession.close().
+        """
+
+        session = HTTPSession.get_session()
+
+        HTTPSession.close()
+
+        expected = []
+        actual = HTTPSession.sessions
+
+        self.assertEqual(expected, actual)
+
+        # A new session is created after the closing.
+        self.assertIsNot(session, HTTPSession.get_session())
+
+
+class TestHTTPHostCache(TestCase):
+    """
+    Test PyFunceble.http_code.HTTPHostCache.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+        HTTPHostCache.clear()
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        HTTPHostCache.clear()
+        HTTPSession.close()
+
+    def test_get_host(self):
+        """
+        Test of HTTPHostCache.get_host().
+        """
+
+        expected = ("https", "example.org", 443)
+        actual = HTTPHostCache.get_host("HTTPS://Example.org/hello?world")
+
+        self.assertEqual(expected, actual)
+
+        expected = ("http", "example.org", 8080)
+        actual = HTTPHostCache.get_host("http://user@example.org:8080/")
+
+        self.assertEqual(expected, actual)
+
+        for url in ["hello", "http://example.org:hello/"]:
+            self.assertIsNone(HTTPHostCache.get_host(url))
+
+    def test_add_failure(self):
+        """
+        Test of HTTPHostCache.add_failure() for the case that the host
+        fails too many times.
+        """
+
+        with mock.patch("PyFunceble.time", return_value=1000):
+            HTTPHostCache.add_failure("http://example.org/a")
+            HTTPHostCache.add_failure("http://example.org/b")
+
+            self.assertFalse(HTTPHostCache.is_unreachable("http://example.org/c"))
+
+            HTTPHostCache.add_failure("http://example.org/c")
+
+            self.assertTrue(HTTPHostCache.is_unreachable("http://example.org/d"))
+
+            # The other hosts are not affected.
+            self.assertFalse(HTTPHostCache.is_unreachable("https://example.org/d"))
+            self.assertFalse(HTTPHostCache.is_unreachable("http://example.net/d"))
+
+        with mock.patch("PyFunceble.time", return_value=1061):
+            self.assertFalse(HTTPHostCache.is_unreachable("http://example.org/d"))
+
+        expected = {}
+        actual = HTTPHostCache.unreachable
+
+        self.assertEqual(expected, actual)
+
+    def test_add_failure_window(self):
+        """
+        Test of HTTPHostCache.add_failure() for the case that the failures
+        are not within the window.
+        """
+
+        for current_time in [1000, 1040, 1080]:
+            with mock.patch("PyFunceble.time", return_value=current_time):
+                HTTPHostCache.add_failure("http://example.org/")
+
+        self.assertFalse(HTTPHostCache.is_unreachable("http://example.org/"))
+
+        expected = {("http", "example.org", 80): [1040, 1080]}
+        actual = HTTPHostCache.failures
+
+        self.assertEqual(expected, actual)
+
+    def test_add_success(self):
+        """
+        Test of HTTPHostCache.add_success().
+        """
+
+        HTTPHostCache.add_failure("http://example.org/")
+        HTTPHostCache.add_failure("http://example.org/")
+        HTTPHostCache.add_success("http://example.org/")
+        HTTPHostCache.add_failure("http://example.org/")
+
+        self.assertFalse(HTTPHostCache.is_unreachable("http://example.org/"))
+
+    def test_not_authorized(self):
+        """
+        Test of HTTPHostCache for the case that we are not allowed to use it.
+        """
+
+        threshold = PyFunceble.CONFIGURATION["http_unreachable_threshold"]
+        PyFunceble.CONFIGURATION["http_unreachable_threshold"] = 0
+
+        try:
+            for _ in range(5):
+                HTTPHostCache.add_failure("http://example.org/")
+
+            self.assertFalse(HTTPHostCache.is_unreachable("http://example.org/"))
+        finally:
+            PyFunceble.CONFIGURATION["http_unreachable_threshold"] = threshold
+
+    def test_access(self):
+        """
+        Test of HTTPCode._access() for the case that the host does not answer.
+        """
+
+        # pylint: disable=protected-access
+
+        with mock.patch(
+            "PyFunceble.requests.Session.head",
+            side_effect=PyFunceble.requests.exceptions.ConnectTimeout(),
+        ) as head:
+            for index in range(5):
+                http_code = HTTPCode("http://example.org/%d" % index, "url")
+
+                self.assertIsNone(http_code._access())
+
+        expected = 3
+        actual = head.call_count
+
+        self.assertEqual(expected, actual)
+        self.assertTrue(http_code.unreachable)
+
+
+class TestHTTPRedirects(TestCase):
+    """
+    Test PyFunceble.http_code.HTTPRedirects.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+        HTTPRedirects.clear()
+
+        # We set the location of each URL.
+        self.locations = {
+            "http://a.example.org/": "https://a.example.org/",
+            "https://a.example.org/": "/hello",
+            "https://a.example.org/hello": "https://example.org/",
+            "http://b.example.org/": "https://a.example.org/",
+            "http://loop.example.org/": "http://loop.example.org/1",
+            "http://loop.example.org/1": "http://loop.example.org/",
+        }
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        HTTPRedirects.clear()
+        HTTPSession.close()
+
+    def respond(self, url, **kwargs):  # pylint: disable=unused-argument
+        """
+        Provide the response of the given URL.
+        """
+
+        response = PyFunceble.requests.models.Response()
+        response.url = url
+        response.raw = mock.Mock()
+
+        if url in self.locations:
+            response.status_code = 301
+            response.headers["Location"] = self.locations[url]
+        else:
+            response.status_code = 200
+
+        return response
+
+    def test_walk(self):
+        """
+        Test of HTTPRedirects.walk().
+        """
+
+        with mock.patch(
+            "PyFunceble.requests.Session.head", side_effect=self.respond
+        ) as head:
+            expected = [
+                "http://a.example.org/",
+                "https://a.example.org/",
+                "https://a.example.org/hello",
+            ]
+            actual = HTTPRedirects.walk("http://a.example.org/")
+
+            self.assertEqual(expected, actual)
+
+            expected = 4
+            actual = head.call_count
+
+            self.assertEqual(expected, actual)
+            self.assertEqual(False, head.call_args[1]["allow_redirects"])
+
+            # The shared part of the chain is not walked again.
+            expected = [
+                "http://b.example.org/",
+                "https://a.example.org/",
+                "https://a.example.org/hello",
+            ]
+            actual = HTTPRedirects.walk("http://b.example.org/")
+
+            self.assertEqual(expected, actual)
+
+            expected = 5
+            actual = head.call_count
+
+            self.assertEqual(expected, actual)
+
+    def test_walk_loop(self):
+        """
+        Test of HTTPRedirects.walk() for the case that we are in a
+        redirecting loop.
+        """
+
+        with mock.patch("PyFunceble.requests.Session.head", side_effect=self.respond):
+            expected = ["http://loop.example.org/", "http://loop.example.org/1"]
+            actual = HTTPRedirects.walk("http://loop.example.org/")
+
+        self.assertEqual(expected, actual)
+
+    def test_walk_maximal_redirects(self):
+        """
+        Test of HTTPRedirects.walk() for the case that there are too many
+        redirections.
+        """
+
+        redirects = PyFunceble.CONFIGURATION["maximal_redirects"]
+        PyFunceble.CONFIGURATION["maximal_redirects"] = 2
+
+        try:
+            with mock.patch(
+                "PyFunceble.requests.Session.head", side_effect=self.respond
+            ):
+                expected = ["http://a.example.org/", "https://a.example.org/"]
+                actual = HTTPRedirects.walk("http://a.example.org/")
+        finally:
+            PyFunceble.CONFIGURATION["maximal_redirects"] = redirects
+
+        self.assertEqual(expected, actual)
+
+    def test_get_location_head_refused(self):
+        """
+        Test of HTTPRedirects.get_location() for the case that the webserver
+        does not accept HEAD requests.
+        """
+
+        refused = PyFunceble.requests.models.Response()
+        refused.status_code = 405
+        refused.raw = mock.Mock()
+
+        with mock.patch(
+            "PyFunceble.requests.Session.head", return_value=refused
+        ), mock.patch(
+            "PyFunceble.requests.Session.get", side_effect=self.respond
+        ) as get:
+            expected = "https://a.example.org/"
+            actual = HTTPRedirects.get_location("http://a.example.org/")
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(True, get.call_args[1]["stream"])
+
+    def test_get_location_connection_error(self):
+        """
+        Test of HTTPRedirects.get_location() for the case that the webserver
+        is not reachable.
+        """
+
+        with mock.patch(
+            "PyFunceble.requests.Session.head",
+            side_effect=PyFunceble.requests.ConnectionError(),
+        ):
+            actual = HTTPRedirects.get_location("http://a.example.org/")
+
+        self.assertIsNone(actual)
+
+        # The failure is not cached, we ask again next time.
+        expected = {}
+        actual = HTTPRedirects.cache
+
+        self.assertEqual(expected, actual)
+
+    def test_get_location_no_redirect(self):
+        """
+        Test of HTTPRedirects.get_location() for the case that the URL
+        does not redirect.
+        """
+
+        with mock.patch(
+            "PyFunceble.requests.Session.head", side_effect=self.respond
+        ) as head:
+            actual = HTTPRedirects.get_location("http://example.org/")
+
+            self.assertIsNone(actual)
+
+            actual = HTTPRedirects.get_location("http://example.org/")
+
+            self.assertIsNone(actual)
+
+        expected = 1
+        actual = head.call_count
+
+        self.assertEqual(expected, actual)
+
+        expected = {"http://example.org/": None}
+        actual = HTTPRedirects.cache
+
+        self.assertEqual(expected, actual)
+
+
+class TestHTTPBody(TestCase):
+    """
+    Test PyFunceble.http_code.HTTPBody.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.chunks = []
+        self.read = 0
+
+        self.response = mock.Mock(encoding="utf-8")
+        self.response.iter_content.side_effect = self.iter_content
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        HTTPSession.close()
+
+    def iter_content(self, **_):
+        """
+        Provide the chunks of the body while counting them.
+        """
+
+        for chunk in self.chunks:
+            self.read += 1
+
+            yield chunk
+
+    def test_match(self):
+        """
+        Test of HTTPBody.match() for the case that the marker is found.
+        """
+
+        self.chunks = [b"a" * 4096, b"<p>doesn&#8217;t", b"&nbsp;exist</p>", b"z"]
+
+        with mock.patch(
+            "PyFunceble.requests.Session.get", return_value=self.response
+        ) as get:
+            actual = HTTPBody(
+                "http://example.org", ["create-blog.g?", "doesn&#8217;t&nbsp;exist"]
+            ).match()
+
+        self.assertEqual(True, actual)
+
+        # We stopped reading at the first match.
+        expected = 3
+        actual = self.read
+
+        self.assertEqual(expected, actual)
+
+        expected = {
+            "headers": None,
+            "timeout": PyFunceble.CONFIGURATION["seconds_before_http_timeout"],
+            "stream": True,
+        }
+        actual = get.call_args[1]
+
+        self.assertEqual(expected, actual)
+        self.response.close.assert_called_once_with()
+
+    def test_match_regex(self):
+        """
+        Test of HTTPBody.match() for the case that the marker is a regex.
+        """
+
+        self.chunks = [b"<a href='https://www.blogger.com/create-blog.g'>"]
+
+        with mock.patch("PyFunceble.requests.Session.get", return_value=self.response):
+            actual = HTTPBody("http://example.org", ["create-blog.g?"]).match()
+
+        self.assertEqual(True, actual)
+
+    def test_match_size_exceeded(self):
+        """
+        Test of HTTPBody.match() for the case that the marker is after
+        the number of bytes we are allowed to read.
+        """
+
+        size = PyFunceble.CONFIGURATION["http_body_size"]
+        PyFunceble.CONFIGURATION["http_body_size"] = 8192
+
+        self.chunks = [b"a" * 4096] * 10 + [b"87065"]
+
+        try:
+            with mock.patch(
+                "PyFunceble.requests.Session.get", return_value=self.response
+            ):
+                actual = HTTPBody("http://example.org", ["87065"]).match()
+        finally:
+            PyFunceble.CONFIGURATION["http_body_size"] = size
+
+        self.assertEqual(False, actual)
+
+        expected = 2
+        actual = self.read
+
+        self.assertEqual(expected, actual)
+        self.response.close.assert_called_once_with()
+
+    def test_match_time_exceeded(self):
+        """
+        Test of HTTPBody.match() for the case that the body comes too slowly.
+        """
+
+        self.chunks = [b"a" * 4096] * 10 + [b"87065"]
+
+        with mock.patch(
+            "PyFunceble.requests.Session.get", return_value=self.response
+        ), mock.patch("PyFunceble.time", side_effect=[0, 1, 2, 3, 4]):
+            actual = HTTPBody("http://example.org", ["87065"]).match()
+
+        self.assertEqual(False, actual)
+
+        expected = 3
+        actual = self.read
+
+        self.assertEqual(expected, actual)
+
+    def test_match_connection_error(self):
+        """
+        Test of HTTPBody.match() for the case that the webserver is not
+        reachable.
+        """
+
+        with mock.patch(
+            "PyFunceble.requests.Session.get",
+            side_effect=PyFunceble.requests.ConnectionError(),
+        ):
+            actual = HTTPBody("http://example.org", ["87065"]).match()
+
+        self.assertEqual(False, actual)
+
 
 if __name__ == "__main__":
     launch_tests()
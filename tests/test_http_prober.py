@@ -0,0 +1,376 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.http_prober.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import asyncio
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.http_code import HTTPCode, HTTPHostCache
+from PyFunceble.http_prober import HTTPProber, probe_many
+
+
+class StandInHTTPServer:  # pylint: disable=too-few-public-methods
+    """
+    Provide a local stand-in of a webserver which answers after the
+    given latency.
+
+    - :code:`/status/<code>` is answered with the given status code.
+    - :code:`/garbage` is not answered with HTTP.
+    - Everything else is answered with :code:`200`.
+
+    :param float latency: The number of seconds to wait before answering.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+
+        self.requests = []
+        self.in_flight = {}
+        self.max_in_flight = 0
+        self.max_in_flight_per_host = {}
+
+    async def handle(self, reader, writer):
+        """
+        Answer a request.
+        """
+
+        head = await reader.readuntil(b"\r\n\r\n")
+        self.requests.append(head)
+
+        target = head.split(b" ", 2)[1].decode()
+        host = [
+            x.split(b":", 1)[1].strip().decode()
+            for x in head.split(b"\r\n")
+            if x.lower().startswith(b"host:")
+        ][0]
+
+        self.in_flight[host] = self.in_flight.get(host, 0) + 1
+        self.max_in_flight = max(self.max_in_flight, sum(self.in_flight.values()))
+        self.max_in_flight_per_host[host] = max(
+            self.max_in_flight_per_host.get(host, 0), self.in_flight[host]
+        )
+
+        try:
+            await asyncio.sleep(self.latency)
+
+            if target == "/garbage":
+                writer.write(b"Hello, World!\r\n")
+            elif target.startswith("/status/"):
+                writer.write(
+                    "HTTP/1.1 {0} Hello\r\n\r\n".format(target[8:]).encode()
+                )
+            else:
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+
+            await writer.drain()
+        finally:
+            self.in_flight[host] -= 1
+            writer.close()
+
+
+class TestHTTPProber(TestCase):
+    """
+    Test PyFunceble.http_prober.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+        self.server = StandInHTTPServer(latency=0.05)
+        self.tcp_server = self.loop.run_until_complete(
+            asyncio.start_server(self.handle, "127.0.0.1", 0)
+        )
+        self.port = self.tcp_server.sockets[0].getsockname()[1]
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        self.tcp_server.close()
+        self.loop.run_until_complete(self.tcp_server.wait_closed())
+        self.loop.close()
+
+        asyncio.set_event_loop(None)
+
+    async def handle(self, reader, writer):
+        """
+        Give the connections to the stand-in server.
+        """
+
+        await self.server.handle(reader, writer)
+
+    def get_url(self, target, host="127.0.0.1"):
+        """
+        Provide the URL of the given target of the stand-in server.
+        """
+
+        return "http://{0}:{1}{2}".format(host, self.port, target)
+
+    def probe_many(self, urls, **kwargs):
+        """
+        Get the HTTP status code of the given URL from the stand-in server.
+        """
+
+        async def collect():
+            return {url: code async for url, code in probe_many(urls, **kwargs)}
+
+        return self.loop.run_until_complete(collect())
+
+    def test_probe_many(self):
+        """
+        Test probe_many() for the case that everything is reachable.
+        """
+
+        urls = [self.get_url("/hello/{0}".format(x)) for x in range(50)]
+
+        expected = {x: 200 for x in urls}
+        actual = self.probe_many(urls, concurrency=25)
+
+        self.assertEqual(expected, actual)
+
+    def test_probe_many_status_code(self):
+        """
+        Test probe_many() for the case that the status codes have to be
+        formatted.
+        """
+
+        urls = {
+            self.get_url("/status/404"): 404,
+            self.get_url("/status/301"): 301,
+            self.get_url("/status/418"): "***",
+            self.get_url("/garbage"): "***",
+            "ftp://127.0.0.1/hello": "***",
+            "http://127.0.0.1:1/hello": "***",
+        }
+
+        expected = urls
+        actual = self.probe_many(list(urls))
+
+        self.assertEqual(expected, actual)
+
+    def test_probe_many_limits(self):
+        """
+        Test probe_many() for the case that the global and per host limits
+        are reached.
+        """
+
+        urls = [self.get_url("/hello/{0}".format(x)) for x in range(20)]
+        urls += [self.get_url("/hello/{0}".format(x), "localhost") for x in range(20)]
+
+        self.probe_many(urls, concurrency=5, host_concurrency=3)
+
+        expected = 5
+        actual = self.server.max_in_flight
+
+        self.assertEqual(expected, actual)
+
+        expected = {
+            "127.0.0.1:{0}".format(self.port): 3,
+            "localhost:{0}".format(self.port): 3,
+        }
+        actual = self.server.max_in_flight_per_host
+
+        self.assertEqual(expected, actual)
+
+    def test_probe_timeout(self):
+        """
+        Test HTTPProber.probe() for the case that the response does not
+        come in time.
+        """
+
+        self.server.latency = 0.3
+        prober = HTTPProber(timeout=0.1)
+
+        expected = None
+        actual = self.loop.run_until_complete(prober.probe(self.get_url("/")))
+
+        self.assertEqual(expected, actual)
+
+        expected = {}
+        actual = prober.hosts
+
+        self.assertEqual(expected, actual)
+
+        # We let the stand-in server finish.
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+
+    def test_probe_request(self):
+        """
+        Test HTTPProber.probe() for the case that we check what is sent.
+        """
+
+        prober = HTTPProber()
+        prober.user_agent = "Hello"
+
+        self.loop.run_until_complete(prober.probe(self.get_url("/hello?world=1")))
+
+        expected = (
+            "HEAD /hello?world=1 HTTP/1.1\r\n"
+            "Host: 127.0.0.1:{0}\r\n"
+            "Accept: */*\r\n"
+            "Connection: close\r\n"
+            "User-Agent: Hello\r\n\r\n"
+        ).format(self.port)
+        actual = self.server.requests[0].decode()
+
+        self.assertEqual(expected, actual)
+
+    def test_probe_unreachable(self):
+        """
+        Test HTTPProber.probe() for the case that the host does not answer.
+        """
+
+        self.server.latency = 0.3
+        prober = HTTPProber(concurrency=1, timeout=0.1)
+
+        async def probe():
+            return await asyncio.gather(
+                *[prober.probe(self.get_url("/{0}".format(x))) for x in range(10)]
+            )
+
+        try:
+            expected = [None] * 10
+            actual = self.loop.run_until_complete(probe())
+
+            self.assertEqual(expected, actual)
+
+            # We gave up once the host failed 3 times.
+            expected = 3
+            actual = len(self.server.requests)
+
+            self.assertEqual(expected, actual)
+            self.assertTrue(HTTPHostCache.is_unreachable(self.get_url("/")))
+        finally:
+            HTTPHostCache.clear()
+
+        # We let the stand-in server finish.
+        self.loop.run_until_complete(asyncio.sleep(0.3))
+
+    def test_parse_url(self):
+        """
+        Test HTTPProber.parse_url().
+        """
+
+        expected = {
+            "scheme": "https",
+            "host": "xn--bcher-kva.example",
+            "port": 443,
+            "target": "/",
+            "host_header": "xn--bcher-kva.example",
+        }
+        actual = HTTPProber.parse_url("HTTPS://user@xn--bcher-kva.example")
+
+        self.assertEqual(expected, actual)
+
+        expected = "xn--bcher-kva.example:8080"
+        actual = HTTPProber.parse_url("http://bücher.example:8080/a b")
+
+        self.assertEqual(expected, actual["host_header"])
+        self.assertEqual("/a%20b", actual["target"])
+
+        for url in ["ftp://example.org", "http://", "example.org"]:
+            self.assertRaises(ValueError, HTTPProber.parse_url, url)
+
+    def test_parse_status_line(self):
+        """
+        Test HTTPProber.parse_status_line().
+        """
+
+        expected = 404
+        actual = HTTPProber.parse_status_line(b"HTTP/1.0 404 Not Found\r\n")
+
+        self.assertEqual(expected, actual)
+
+        for line in [b"", b"Hello, World!\r\n", b"HTTP/1.1 20 OK\r\n"]:
+            self.assertRaises(ValueError, HTTPProber.parse_status_line, line)
+
+    def test_probed(self):
+        """
+        Test HTTPCode.get() for the case that the status code was already
+        probed.
+        """
+
+        url = self.get_url("/status/404")
+
+        HTTPCode.probed[url] = self.loop.run_until_complete(HTTPProber().probe(url))
+
+        expected = 404
+        actual = HTTPCode(url, "url").get()
+
+        self.assertEqual(expected, actual)
+
+        expected = {}
+        actual = HTTPCode.probed
+
+        self.assertEqual(expected, actual)
+
+
+if __name__ == "__main__":
+    launch_tests()
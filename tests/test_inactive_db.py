@@ -420,6 +420,46 @@ class TestInactiveDB(TestCase):
 
         self.test_file_not_exist()
 
+    def test_add_subject_present(self):  # pylint: disable=invalid-name
+        """
+        Test Inactive.add() for the case that the subject is already
+        present into the Inactive.
+        """
+
+        self.test_file_not_exist()
+
+        timestamp = str(self.inactive_db._timestamp())
+
+        self.inactive_db.database = {
+            self.file_to_test: {
+                self.time_past: {
+                    "hello.world": PyFunceble.STATUS["official"]["down"],
+                    "world.hello": PyFunceble.STATUS["official"]["down"],
+                }
+            }
+        }
+
+        expected = {
+            self.file_to_test: {
+                self.time_past: {"world.hello": PyFunceble.STATUS["official"]["down"]},
+                timestamp: {"hello.world": PyFunceble.STATUS["official"]["invalid"]},
+            }
+        }
+
+        self.inactive_db.add("hello.world", PyFunceble.STATUS["official"]["invalid"])
+
+        self.assertEqual(expected, self.inactive_db.database)
+
+        expected = {"world.hello"}
+
+        self.assertEqual(expected, self.inactive_db.get_to_retest())
+
+        expected = {"hello.world"}
+
+        self.assertEqual(expected, self.inactive_db.get_already_tested())
+
+        self.test_file_not_exist()
+
     def test_is_present(self):
         """
         Test the presence of element in the databse.
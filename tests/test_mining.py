@@ -63,9 +63,11 @@ License:
 
 from unittest import TestCase
 from unittest import main as launch_tests
+from unittest import mock
 
 import PyFunceble
 from PyFunceble.helpers import Dict, File
+from PyFunceble.http_code import HTTPRedirects
 from PyFunceble.mining import Mining
 
 
@@ -188,6 +190,107 @@ class TestMining(TestCase):
 
         self.assertEqual(expected, actual)
 
+    def test_get_history(self):
+        """
+        Test Mining.get_history().
+        """
+
+        with mock.patch.object(
+            HTTPRedirects, "walk", return_value=["http://example.org:80"]
+        ) as walk:
+            expected = ["http://example.org:80"]
+            actual = Mining.get_history("http://example.org:80")
+
+            self.assertEqual(expected, actual)
+
+        walk.assert_called_once_with("http://example.org:80", headers=Mining.headers)
+
+    def test_get_mined_domain(self):
+        """
+        Test Mining.get_mined() for the case that we are testing domains.
+        """
+
+        history = [
+            "http://example.org:80",
+            "https://www.example.org:443/hello",
+            "http://www.example.net/",
+        ]
+
+        with mock.patch.object(HTTPRedirects, "walk", return_value=history) as walk:
+            expected = ["www.example.org", "www.example.net"]
+            actual = self.mining.get_mined("example.org", "domain")
+
+            self.assertEqual(expected, actual)
+
+        self.assertEqual("http://example.org:80", walk.call_args[0][0])
+
+    def test_get_mined_url(self):
+        """
+        Test Mining.get_mined() for the case that we are testing URLs.
+        """
+
+        history = ["http://example.org/", "https://example.org/hello"]
+
+        with mock.patch.object(HTTPRedirects, "walk", return_value=history):
+            expected = ["https://example.org/hello"]
+            actual = self.mining.get_mined("http://example.org/", "url")
+
+            self.assertEqual(expected, actual)
+
+        with self.assertRaises(ValueError):
+            self.mining.get_mined("http://example.org/", "hello")
+
+    def test_get_mined_not_authorized(self):
+        """
+        Test Mining.get_mined() for the case that we are not authorized
+        to operate.
+        """
+
+        self.mining.authorized = False
+
+        with mock.patch.object(
+            HTTPRedirects, "walk", return_value=["http://www.example.org/"]
+        ) as walk:
+            expected = []
+            actual = self.mining.get_mined("example.org", "domain")
+
+            self.assertEqual(expected, actual)
+
+        walk.assert_not_called()
+
+    def test_add_mined(self):
+        """
+        Test Mining.add().
+        """
+
+        File(self.file).delete()
+
+        self.mining.add("example.org", [])
+
+        expected = {self.file_to_test: {}}
+
+        self.assertEqual(expected, self.mining.database)
+
+        expected = False
+        actual = PyFunceble.path.isfile(self.file)
+
+        self.assertEqual(expected, actual)
+
+        self.mining.add("example.org", ["www.example.org", "www.example.net"])
+
+        expected = {
+            self.file_to_test: {"example.org": ["www.example.org", "www.example.net"]}
+        }
+
+        self.assertEqual(expected, self.mining.database)
+
+        expected = True
+        actual = PyFunceble.path.isfile(self.file)
+
+        self.assertEqual(expected, actual)
+
+        File(self.file).delete()
+
     def test_remove(self):
         """
         Test the deletion subsystem.
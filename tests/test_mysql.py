@@ -0,0 +1,266 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.mysql.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import unittest.mock as mock  # pylint: disable=useless-import-alias
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.mysql import MySQL
+
+
+class StandInCursor:
+    """
+    Provide a stand-in for a MariaDB cursor.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query, data=None):  # pylint: disable=unused-argument
+        """
+        Execute the given query.
+        """
+
+        if self.connection.closed:
+            raise PyFunceble.mysql.pymysql.err.InterfaceError("Closed")
+
+        self.connection.queries.append(query)
+
+    @classmethod
+    def fetchone(cls):
+        """
+        Fetch the result of the last query.
+        """
+
+        return {"COUNT(*)": 1}
+
+    def close(self):
+        """
+        Close the cursor.
+        """
+
+
+class StandInConnection:
+    """
+    Provide a stand-in for a MariaDB connection.
+    """
+
+    def __init__(self, *args, **kwargs):  # pylint: disable=unused-argument
+        self.closed = False
+        self.pinged = 0
+        self.queries = []
+
+    def cursor(self):
+        """
+        Provide a cursor.
+        """
+
+        return StandInCursor(self)
+
+    def ping(self, reconnect=False):
+        """
+        Check the connection.
+        """
+
+        self.pinged += 1
+
+        if reconnect:
+            self.closed = False
+
+    def close(self):
+        """
+        Close the connection.
+        """
+
+        self.closed = True
+
+
+class TestMySQL(TestCase):
+    """
+    Test PyFunceble.mysql.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom={"db_type": "mariadb"}
+        )
+
+        environ = {
+            data["env"]: str(data["default"]) for data in MySQL.variables.values()
+        }
+
+        patches = [
+            mock.patch.dict(PyFunceble.environ, environ),
+            mock.patch("PyFunceble.mysql.pymysql.connect", StandInConnection),
+            mock.patch("PyFunceble.mysql.MySQL.save_to_env_file"),
+        ]
+
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.mysql_db = MySQL()
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom={"db_type": "json"}
+        )
+
+    def test_connection_reused(self):
+        """
+        Test that the connections are reused.
+        """
+
+        with self.mysql_db.get_connection() as cursor:
+            cursor.execute("SELECT 1")
+
+            expected = cursor.connection
+
+        with self.mysql_db.get_connection() as cursor:
+            cursor.execute("SELECT 2")
+
+            actual = cursor.connection
+
+        self.assertIs(expected, actual)
+        self.assertEqual(1, self.mysql_db.pool["connections"].qsize())
+
+    def test_pool_overflow(self):
+        """
+        Test that the connections created beyond the size of the
+        pool are closed once given back.
+        """
+
+        with self.mysql_db.get_connection() as first:
+            with self.mysql_db.get_connection() as second:
+                self.assertIsNot(first.connection, second.connection)
+
+        self.assertEqual(1, self.mysql_db.pool["connections"].qsize())
+        self.assertNotEqual(first.connection.closed, second.connection.closed)
+
+    def test_broken_connection_dropped(self):
+        """
+        Test that a connection which raised a connection related error
+        is not given back to the pool.
+        """
+
+        with self.mysql_db.get_connection() as cursor:
+            expected = cursor.connection
+
+        expected.close()
+
+        try:
+            with self.mysql_db.get_connection() as cursor:
+                cursor.execute("SELECT 1")
+        except PyFunceble.mysql.pymysql.err.InterfaceError:
+            pass
+
+        with self.mysql_db.get_connection() as cursor:
+            actual = cursor.connection
+
+        self.assertIsNot(expected, actual)
+
+    def test_health_check(self):
+        """
+        Test that an idle connection is checked before being reused.
+        """
+
+        with self.mysql_db.get_connection() as cursor:
+            connection = cursor.connection
+
+        with self.mysql_db.get_connection() as cursor:
+            pass
+
+        self.assertEqual(0, connection.pinged)
+
+        with mock.patch(
+            "PyFunceble.time",
+            return_value=PyFunceble.time() + self.mysql_db.health_check_interval,
+        ):
+            with self.mysql_db.get_connection() as cursor:
+                self.assertIs(connection, cursor.connection)
+
+        self.assertEqual(1, connection.pinged)
+
+    def test_close(self):
+        """
+        Test MySQL.close().
+        """
+
+        with self.mysql_db.get_connection() as cursor:
+            connection = cursor.connection
+
+        self.mysql_db.close()
+
+        self.assertTrue(connection.closed)
+        self.assertEqual(0, self.mysql_db.pool["connections"].qsize())
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,339 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.sqlite.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import sqlite3
+from unittest import TestCase
+from unittest import main as launch_tests
+from unittest import mock
+
+import PyFunceble
+from PyFunceble.helpers import File
+from PyFunceble.sqlite import SQLite
+
+
+class TestSQLite(TestCase):
+    """
+    Test PyFunceble.sqlite.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom={"db_type": "sqlite"}
+        )
+
+        self.config = {
+            "sqlite_batch_size": PyFunceble.CONFIGURATION["sqlite_batch_size"],
+            "sqlite_batch_interval": PyFunceble.CONFIGURATION["sqlite_batch_interval"],
+        }
+
+        self.database_file = (
+            PyFunceble.CONFIG_DIRECTORY + PyFunceble.OUTPUTS["default_files"]["sqlite"]
+        )
+
+        self.sqlite_db = SQLite()
+        self.table = self.sqlite_db.tables["auto_continue"]
+
+        self.query = (
+            "INSERT INTO {0} (file_path, subject, status, is_complement) "
+            "VALUES (:file, :subject, :status, :is_complement)"
+        ).format(self.table)
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        PyFunceble.CONFIGURATION.update(self.config)
+
+        self.sqlite_db.close()
+
+        File(self.database_file).delete()
+
+        PyFunceble.load_config(
+            generate_directory_structure=False, custom={"db_type": "json"}
+        )
+
+    def write(self, subject, status="ACTIVE"):
+        """
+        Write the given subject.
+        """
+
+        self.sqlite_db.execute(
+            self.query,
+            {
+                "file": "hello",
+                "subject": subject,
+                "status": status,
+                "is_complement": int(False),
+            },
+        )
+
+    def read(self):
+        """
+        Read what was committed into the database.
+
+        :rtype: dict
+        """
+
+        connection = sqlite3.connect(self.database_file)
+
+        try:
+            return dict(
+                connection.execute(
+                    "SELECT subject, status FROM {0}".format(self.table)
+                ).fetchall()
+            )
+        finally:
+            connection.close()
+
+    def test_batch_size(self):
+        """
+        Test that the writes are committed once the batch is full.
+        """
+
+        PyFunceble.CONFIGURATION.update(
+            {"sqlite_batch_size": 2, "sqlite_batch_interval": 3600000}
+        )
+
+        self.write("hello.world")
+
+        self.assertEqual(1, self.sqlite_db.batch["pending"])
+        self.assertEqual({}, self.read())
+
+        self.write("world.hello")
+
+        self.assertEqual(0, self.sqlite_db.batch["pending"])
+        self.assertEqual(
+            {"hello.world": "ACTIVE", "world.hello": "ACTIVE"}, self.read()
+        )
+
+    def test_batch_interval(self):
+        """
+        Test that the writes are committed once the batch is too old.
+        """
+
+        PyFunceble.CONFIGURATION.update(
+            {"sqlite_batch_size": 500, "sqlite_batch_interval": 1000}
+        )
+
+        with mock.patch(
+            "PyFunceble.time", return_value=self.sqlite_db.batch["last_commit"] + 0.5
+        ):
+            self.write("hello.world")
+
+        self.assertEqual(1, self.sqlite_db.batch["pending"])
+        self.assertEqual({}, self.read())
+
+        with mock.patch(
+            "PyFunceble.time", return_value=self.sqlite_db.batch["last_commit"] + 1
+        ):
+            self.write("world.hello")
+
+        self.assertEqual(0, self.sqlite_db.batch["pending"])
+        self.assertEqual(
+            {"hello.world": "ACTIVE", "world.hello": "ACTIVE"}, self.read()
+        )
+
+    def test_commit_on_close(self):
+        """
+        Test that the pending writes are committed when we close the connection.
+        """
+
+        PyFunceble.CONFIGURATION.update(
+            {"sqlite_batch_size": 500, "sqlite_batch_interval": 3600000}
+        )
+
+        self.write("hello.world")
+
+        self.assertEqual({}, self.read())
+
+        self.sqlite_db.close()
+
+        self.assertEqual({"hello.world": "ACTIVE"}, self.read())
+
+    def test_reopen_after_fork(self):
+        """
+        Test that a new connection is created after a fork.
+        """
+
+        PyFunceble.CONFIGURATION.update(
+            {"sqlite_batch_size": 500, "sqlite_batch_interval": 3600000}
+        )
+
+        self.write("hello.world")
+
+        connection = self.sqlite_db.connection
+        cursor = self.sqlite_db.cursor
+
+        with mock.patch("PyFunceble.sqlite.getpid", return_value=-1):
+            self.assertIsNot(connection, self.sqlite_db.connection)
+            self.assertIsNot(cursor, self.sqlite_db.cursor)
+            self.assertEqual(0, self.sqlite_db.batch["pending"])
+
+            # The connection of the new process is closed.
+            self.sqlite_db.close()
+
+        # The connection of the old process was not committed.
+        self.assertTrue(connection.in_transaction)
+        connection.close()
+
+    def upsert(self, update=None):
+        """
+        Insert, then insert or update the same subject.
+
+        :param list update: The columns to update.
+        """
+
+        queries = self.sqlite_db.get_upsert_queries(
+            self.table,
+            {
+                "file_path": "file",
+                "subject": "subject",
+                "status": "status",
+                "is_complement": "is_complement",
+            },
+            ["file_path", "subject"],
+            update=update,
+        )
+
+        for status in ["ACTIVE", "INACTIVE"]:
+            for query in queries:
+                self.sqlite_db.execute(
+                    query,
+                    {
+                        "file": "hello",
+                        "subject": "hello.world",
+                        "status": status,
+                        "is_complement": int(False),
+                    },
+                )
+
+        self.sqlite_db.commit()
+
+        return queries
+
+    def test_upsert(self):
+        """
+        Test the upsert of a row.
+        """
+
+        with mock.patch("sqlite3.sqlite_version_info", (3, 24, 0)):
+            queries = self.upsert(update=["status"])
+
+        self.assertEqual(1, len(queries))
+        self.assertIn("ON CONFLICT(file_path, subject) DO UPDATE", queries[0])
+        self.assertEqual({"hello.world": "INACTIVE"}, self.read())
+
+    def test_upsert_nothing(self):
+        """
+        Test the upsert of a row which we do not update.
+        """
+
+        with mock.patch("sqlite3.sqlite_version_info", (3, 24, 0)):
+            queries = self.upsert()
+
+        self.assertEqual(1, len(queries))
+        self.assertIn("ON CONFLICT(file_path, subject) DO NOTHING", queries[0])
+        self.assertEqual({"hello.world": "ACTIVE"}, self.read())
+
+    def test_upsert_old_sqlite(self):
+        """
+        Test the upsert of a row with a SQLite which does not understand
+        the upserts.
+        """
+
+        with mock.patch("sqlite3.sqlite_version_info", (3, 22, 0)):
+            queries = self.upsert(update=["status"])
+
+        expected = [
+            "INSERT OR IGNORE INTO {0} (file_path, subject, status, is_complement) "
+            "VALUES (:file, :subject, :status, :is_complement)".format(self.table),
+            "UPDATE {0} SET status = :status "
+            "WHERE file_path = :file AND subject = :subject".format(self.table),
+        ]
+
+        self.assertEqual(expected, queries)
+        self.assertEqual({"hello.world": "INACTIVE"}, self.read())
+
+    def test_upsert_nothing_old_sqlite(self):
+        """
+        Test the upsert of a row which we do not update with a SQLite which
+        does not understand the upserts.
+        """
+
+        with mock.patch("sqlite3.sqlite_version_info", (3, 22, 0)):
+            queries = self.upsert()
+
+        expected = [
+            "INSERT OR IGNORE INTO {0} (file_path, subject, status, is_complement) "
+            "VALUES (:file, :subject, :status, :is_complement)".format(self.table)
+        ]
+
+        self.assertEqual(expected, queries)
+        self.assertEqual({"hello.world": "ACTIVE"}, self.read())
+
+
+if __name__ == "__main__":
+    launch_tests()
@@ -0,0 +1,269 @@
+# pylint:disable=line-too-long
+"""
+The tool to check the availability or syntax of domains, IPv4 or URL.
+
+::
+
+
+    ██████╗ ██╗   ██╗███████╗██╗   ██╗███╗   ██╗ ██████╗███████╗██████╗ ██╗     ███████╗
+    ██╔══██╗╚██╗ ██╔╝██╔════╝██║   ██║████╗  ██║██╔════╝██╔════╝██╔══██╗██║     ██╔════╝
+    ██████╔╝ ╚████╔╝ █████╗  ██║   ██║██╔██╗ ██║██║     █████╗  ██████╔╝██║     █████╗
+    ██╔═══╝   ╚██╔╝  ██╔══╝  ██║   ██║██║╚██╗██║██║     ██╔══╝  ██╔══██╗██║     ██╔══╝
+    ██║        ██║   ██║     ╚██████╔╝██║ ╚████║╚██████╗███████╗██████╔╝███████╗███████╗
+    ╚═╝        ╚═╝   ╚═╝      ╚═════╝ ╚═╝  ╚═══╝ ╚═════╝╚══════╝╚═════╝ ╚══════╝╚══════╝
+
+This submodule will test PyFunceble.status.
+
+Author:
+    Nissar Chababy, @funilrys, contactTATAfunilrysTODTODcom
+
+Special thanks:
+    https://pyfunceble.github.io/special-thanks.html
+
+Contributors:
+    https://pyfunceble.github.io/contributors.html
+
+Project link:
+    https://github.com/funilrys/PyFunceble
+
+Project documentation:
+    https://pyfunceble.readthedocs.io/en/master/
+
+Project homepage:
+    https://pyfunceble.github.io/
+
+License:
+::
+
+
+    MIT License
+
+    Copyright (c) 2017, 2018, 2019 Nissar Chababy
+
+    Permission is hereby granted, free of charge, to any person obtaining a copy
+    of this software and associated documentation files (the "Software"), to deal
+    in the Software without restriction, including without limitation the rights
+    to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+    copies of the Software, and to permit persons to whom the Software is
+    furnished to do so, subject to the following conditions:
+
+    The above copyright notice and this permission notice shall be included in all
+    copies or substantial portions of the Software.
+
+    THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+    IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+    FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+    AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+    LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+    OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+    SOFTWARE.
+"""
+# pylint: enable=line-too-long
+import unittest.mock as mock  # pylint: disable=useless-import-alias
+from unittest import TestCase
+from unittest import main as launch_tests
+
+import PyFunceble
+from PyFunceble.status import Status
+
+
+class TestStatusDNSFirst(TestCase):
+    """
+    Test PyFunceble.status.Status.get() while the DNS is looked up first.
+    """
+
+    def setUp(self):
+        """
+        Setup everything needed for the tests.
+        """
+
+        PyFunceble.load_config(generate_directory_structure=False)
+
+        self.config = PyFunceble.CONFIGURATION.copy()
+        PyFunceble.CONFIGURATION.update({"dns_first": True, "local": False})
+
+        self.subject = "example.org"
+        self.expiration_date = "01-jan-2030"
+
+        # We register every interaction with the DNS and WHOIS lookups
+        # into a single mock so that we can check their order.
+        self.manager = mock.Mock()
+        self.manager.dns_lookup.wildcard = False
+        self.manager.dns_lookup.nonexistent = False
+
+        self.whois_db = mock.Mock()
+        self.whois_db.get_expiration_date.return_value = self.expiration_date
+
+        self.patches = [
+            mock.patch("PyFunceble.DNSLookup", self.manager.dns_lookup_interface),
+            mock.patch(
+                "PyFunceble.status.ExpirationDate", self.manager.expiration_date
+            ),
+            mock.patch(
+                "PyFunceble.status.ExtraRules",
+                **{
+                    "return_value.handle.side_effect": lambda status, source: (
+                        status,
+                        source,
+                    )
+                }
+            ),
+            mock.patch("PyFunceble.status.Generate"),
+            mock.patch("PyFunceble.status.HTTPCode"),
+            mock.patch(
+                "PyFunceble.status.Referer",
+                **{"return_value.get.return_value": "whois.example.org"}
+            ),
+        ]
+
+        for patch in self.patches:
+            patch.start()
+
+        self.manager.dns_lookup_interface.return_value = self.manager.dns_lookup
+
+    def tearDown(self):
+        """
+        Setup everything needed after the tests.
+        """
+
+        for patch in self.patches:
+            patch.stop()
+
+        PyFunceble.CONFIGURATION.update(self.config)
+
+    def get_lookups(self):
+        """
+        Provide the lookups we did, in their order.
+        """
+
+        return [
+            name
+            for name, _, _ in self.manager.mock_calls
+            if name in ["dns_lookup.request", "expiration_date"]
+        ]
+
+    def test_resolves(self):
+        """
+        Test the case that the subject resolves.
+        """
+
+        self.manager.dns_lookup.request.return_value = {"A": ["192.0.2.1"]}
+
+        actual = Status(self.subject, whois_db=self.whois_db).get()
+
+        expected = ["dns_lookup.request"]
+
+        self.assertEqual(expected, self.get_lookups())
+
+        self.manager.expiration_date.assert_not_called()
+        self.whois_db.get_expiration_date.assert_called_once_with(self.subject)
+
+        expected = self.expiration_date
+
+        self.assertEqual(expected, actual["expiration_date"])
+
+        expected = "DNSLOOKUP"
+
+        self.assertEqual(expected, actual["_status_source"])
+        self.assertEqual(expected, actual["status_source"])
+
+        expected = PyFunceble.STATUS["official"]["up"]
+
+        self.assertEqual(expected, actual["status"])
+
+    def test_resolves_without_whois_db(self):
+        """
+        Test the case that the subject resolves but that we do not have
+        any WHOIS database.
+        """
+
+        self.manager.dns_lookup.request.return_value = {"A": ["192.0.2.1"]}
+
+        actual = Status(self.subject).get()
+
+        self.manager.expiration_date.assert_not_called()
+
+        expected = None
+
+        self.assertEqual(expected, actual["expiration_date"])
+
+        expected = "DNSLOOKUP"
+
+        self.assertEqual(expected, actual["status_source"])
+
+    def test_does_not_resolve(self):
+        """
+        Test the case that the subject does not resolve.
+        """
+
+        self.manager.dns_lookup.request.return_value = None
+        self.manager.dns_lookup.nonexistent = True
+        self.manager.expiration_date.return_value.get.return_value = (None, None)
+
+        actual = Status(self.subject, whois_db=self.whois_db).get()
+
+        expected = ["dns_lookup.request", "expiration_date"]
+
+        self.assertEqual(expected, self.get_lookups())
+
+        self.manager.expiration_date.assert_called_once_with(
+            self.subject, "whois.example.org", whois_db=self.whois_db
+        )
+        self.whois_db.get_expiration_date.assert_not_called()
+
+        expected = "DNSLOOKUP"
+
+        self.assertEqual(expected, actual["status_source"])
+
+        expected = PyFunceble.STATUS["official"]["down"]
+
+        self.assertEqual(expected, actual["status"])
+
+    def test_registered(self):
+        """
+        Test the case that the subject does not resolve but that
+        the WHOIS server gives us its expiration date.
+        """
+
+        self.manager.dns_lookup.request.return_value = None
+        self.manager.expiration_date.return_value.get.return_value = (
+            self.expiration_date,
+            "Hello, World!",
+        )
+
+        actual = Status(self.subject, whois_db=self.whois_db).get()
+
+        expected = ["dns_lookup.request", "expiration_date"]
+
+        self.assertEqual(expected, self.get_lookups())
+
+        expected = "WHOIS"
+
+        self.assertEqual(expected, actual["status_source"])
+
+        expected = PyFunceble.STATUS["official"]["up"]
+
+        self.assertEqual(expected, actual["status"])
+
+    def test_subdomain(self):
+        """
+        Test the case that the subject is a subdomain.
+        """
+
+        self.manager.dns_lookup.request.return_value = None
+
+        actual = Status("www." + self.subject, whois_db=self.whois_db).get()
+
+        expected = ["dns_lookup.request"]
+
+        self.assertEqual(expected, self.get_lookups())
+
+        self.whois_db.get_expiration_date.assert_not_called()
+
+        expected = "DNSLOOKUP"
+
+        self.assertEqual(expected, actual["status_source"])
+
+
+if __name__ == "__main__":
+    launch_tests()